@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+# Micro-benchmark of argmax and argmin across the split axis, along it and along a process-local axis.
+# Run as a regular MPI Python script, e.g.
+# mpirun -np <procs> python argreduce.py
+
+import argparse
+import timeit
+
+import heat as ht
+
+
+def main():
+    parser = argparse.ArgumentParser(description="runtime of argmax and argmin")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10000, 1000000])
+    parser.add_argument("--columns", type=int, default=16)
+    parser.add_argument("--repetitions", type=int, default=100)
+    args = parser.parse_args()
+
+    if ht.MPI_WORLD.rank == 0:
+        header = ("rows", "op", "dtype", "axis=None [us]", "axis=split [us]", "axis=local [us]")
+        print("{:>10} {:>6} {:>8} {:>16} {:>16} {:>16}".format(*header))
+
+    for rows in args.rows:
+        for dtype in (ht.float32, ht.float64, ht.int64):
+            x = ht.random.randn(rows, args.columns, split=0).astype(dtype)
+            for name, operation in (("argmax", ht.argmax), ("argmin", ht.argmin)):
+                timings = [
+                    timeit.timeit(lambda: operation(x, axis=axis), number=args.repetitions)
+                    for axis in (None, 0, 1)
+                ]
+
+                if ht.MPI_WORLD.rank == 0:
+                    print(
+                        "{:>10} {:>6} {:>8} {:>16.2f} {:>16.2f} {:>16.2f}".format(
+                            rows,
+                            name,
+                            dtype.__name__,
+                            *(timing / args.repetitions * 1e6 for timing in timings)
+                        )
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+# Micro-benchmark of the per-call overhead of binary operations between a DNDarray and a scalar.
+# Run as a regular MPI Python script, e.g.
+# mpirun -np <procs> python binary_op_scalar.py
+
+import argparse
+import timeit
+
+import heat as ht
+
+
+def main():
+    parser = argparse.ArgumentParser(description="overhead of array-scalar operations")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000, 1000000])
+    parser.add_argument("--repetitions", type=int, default=1000)
+    args = parser.parse_args()
+
+    if ht.MPI_WORLD.rank == 0:
+        header = ("size", "op", "wrapped [us]", "scalar [us]", "speedup")
+        print("{:>10} {:>6} {:>16} {:>16} {:>8}".format(*header))
+
+    for size in args.sizes:
+        x = ht.ones((size,), split=0)
+        # the wrapped operand emulates the former code path, turning every scalar into a DNDarray
+        for name, operation in (("add", ht.add), ("mul", ht.mul), ("div", ht.div), ("pow", ht.pow)):
+            wrapped = timeit.timeit(lambda: operation(x, ht.array([2.0])), number=args.repetitions)
+            scalar = timeit.timeit(lambda: operation(x, 2.0), number=args.repetitions)
+
+            if ht.MPI_WORLD.rank == 0:
+                print(
+                    "{:>10} {:>6} {:>16.2f} {:>16.2f} {:>8.2f}".format(
+                        size,
+                        name,
+                        wrapped / args.repetitions * 1e6,
+                        scalar / args.repetitions * 1e6,
+                        wrapped / scalar,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
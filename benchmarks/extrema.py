@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+# Weak-scaling micro-benchmark of the element-wise maximum and minimum of equally split 3D fields, e.g. clipping. The
+# process-local problem size is fixed, hence runtime and memory per process should not grow with the number of
+# processes. Run as a regular MPI Python script, e.g.
+# mpirun -np <procs> python extrema.py
+
+import argparse
+import resource
+import timeit
+
+import heat as ht
+
+
+def main():
+    parser = argparse.ArgumentParser(description="weak scaling of maximum and minimum")
+    parser.add_argument(
+        "--slices", type=int, default=64, help="slices along the split axis per process"
+    )
+    parser.add_argument("--extent", type=int, default=256)
+    parser.add_argument("--repetitions", type=int, default=10)
+    args = parser.parse_args()
+
+    size = ht.MPI_WORLD.size
+    field = ht.random.randn(args.slices * size, args.extent, args.extent, split=0)
+    bound = ht.zeros((1, args.extent, args.extent))
+
+    if ht.MPI_WORLD.rank == 0:
+        header = ("procs", "op", "time [ms]", "local result [MB]", "max rss [MB]")
+        print("{:>6} {:>8} {:>12} {:>18} {:>14}".format(*header))
+
+    for name, operation in (("maximum", ht.maximum), ("minimum", ht.minimum)):
+        result = operation(field, bound)
+        timing = timeit.timeit(lambda: operation(field, bound), number=args.repetitions)
+        local = result._DNDarray__array
+        nbytes = local.element_size() * local.numel()
+        # peak resident memory of the process, in kilobytes on Linux
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        if ht.MPI_WORLD.rank == 0:
+            print(
+                "{:>6} {:>8} {:>12.2f} {:>18.2f} {:>14.2f}".format(
+                    size, name, timing / args.repetitions * 1e3, nbytes / 2 ** 20, rss / 2 ** 10
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
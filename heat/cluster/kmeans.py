@@ -245,16 +245,19 @@ class KMeans(ht.ClusteringMixin, ht.BaseEstimator):
             # determine the centroids
             matching_centroids = self._fit_to_cluster(X)
 
+            # accumulate points and total number of points in each cluster, the reductions are coalesced
+            accumulated = []
+            with X.comm.coalesce():
+                for i in range(self.n_clusters):
+                    # points in current cluster
+                    selection = (matching_centroids == i).astype(ht.int64)
+                    accumulated.append(
+                        ((X * selection).sum(axis=0, keepdim=True), selection.sum(axis=0, keepdim=True))
+                    )
+
             # update the centroids
-            for i in range(self.n_clusters):
-                # points in current cluster
-                selection = (matching_centroids == i).astype(ht.int64)
-
-                # accumulate points and total number of points in cluster
-                assigned_points = (X * selection).sum(axis=0, keepdim=True)
-                points_in_cluster = selection.sum(axis=0, keepdim=True).clip(
-                    1.0, ht.iinfo(ht.int64).max
-                )
+            for i, (assigned_points, points_in_cluster) in enumerate(accumulated):
+                points_in_cluster = points_in_cluster.clip(1.0, ht.iinfo(ht.int64).max)
 
                 # compute the new centroids
                 new_cluster_centers[i : i + 1, :] = assigned_points / points_in_cluster
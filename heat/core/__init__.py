@@ -7,14 +7,19 @@ from .exponential import *
 from .factories import *
 from .indexing import *
 from .io import *
+from .expressions import *
 from .logical import *
 from .manipulations import *
 from .memory import *
 from .operations import *
 from .printing import *
 from . import random
+from .redistribution import *
 from .relational import *
 from .rounding import *
+from .signal import *
+from . import signal
+from .sketches import *
 from .statistics import *
 from .dndarray import *
 from .tiling import *
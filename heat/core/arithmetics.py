@@ -4,6 +4,7 @@ from .communication import MPI
 from . import dndarray
 from . import factories
 from . import operations
+from . import signal
 from . import stride_tricks
 from . import types
 
@@ -38,7 +39,7 @@ __all__ = [
 ]
 
 
-def add(t1, t2):
+def add(t1, t2, out=None):
     """
     Element-wise addition of values from two operands, commutative.
     Takes the first and second operand (scalar or tensor) whose elements are to be added as argument.
@@ -49,6 +50,9 @@ def add(t1, t2):
         The first operand involved in the addition
     t2: tensor or scalar
         The second operand involved in the addition
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -73,10 +77,10 @@ def add(t1, t2):
             [5., 6.]])
 
     """
-    return operations.__binary_op(torch.add, t1, t2)
+    return operations.__binary_op(torch.add, t1, t2, out)
 
 
-def bitwise_and(t1, t2):
+def bitwise_and(t1, t2, out=None):
     """
     Compute the bit-wise AND of two arrays element-wise.
 
@@ -84,6 +88,9 @@ def bitwise_and(t1, t2):
     ----------
     t1, t2: tensor or scalar
         Only integer and boolean types are handled. If x1.shape != x2.shape, they must be broadcastable to a common shape (which becomes the shape of the output).
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -115,10 +122,10 @@ def bitwise_and(t1, t2):
         if types.heat_type_is_inexact(dtype):
             raise TypeError("Operation is not supported for float types")
 
-    return operations.__binary_op(torch.Tensor.__and__, t1, t2)
+    return operations.__binary_op(torch.bitwise_and, t1, t2, out)
 
 
-def bitwise_or(t1, t2):
+def bitwise_or(t1, t2, out=None):
     """
     Compute the bit-wise OR of two arrays element-wise.
 
@@ -126,6 +133,9 @@ def bitwise_or(t1, t2):
     ----------
     t1, t2: tensor or scalar
        Only integer and boolean types are handled. If x1.shape != x2.shape, they must be broadcastable to a common shape (which becomes the shape of the output).
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -159,10 +169,10 @@ def bitwise_or(t1, t2):
         if types.heat_type_is_inexact(dtype):
             raise TypeError("Operation is not supported for float types")
 
-    return operations.__binary_op(torch.Tensor.__or__, t1, t2)
+    return operations.__binary_op(torch.bitwise_or, t1, t2, out)
 
 
-def bitwise_xor(t1, t2):
+def bitwise_xor(t1, t2, out=None):
     """
     Compute the bit-wise XOR of two arrays element-wise.
 
@@ -170,6 +180,9 @@ def bitwise_xor(t1, t2):
     ----------
     t1, t2: tensor or scalar
        Only integer and boolean types are handled. If x1.shape != x2.shape, they must be broadcastable to a common shape (which becomes the shape of the output).
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -198,7 +211,7 @@ def bitwise_xor(t1, t2):
         if types.heat_type_is_inexact(dtype):
             raise TypeError("Operation is not supported for float types")
 
-    return operations.__binary_op(torch.Tensor.__xor__, t1, t2)
+    return operations.__binary_op(torch.bitwise_xor, t1, t2, out)
 
 
 def cumprod(a, axis, dtype=None, out=None):
@@ -286,6 +299,7 @@ def diff(a, n=1, axis=-1):
     """
     Calculate the n-th discrete difference along the given axis.
     The first difference is given by out[i] = a[i+1] - a[i] along the given axis, higher differences are calculated by using diff recursively.
+    Along the split axis, the n-th differences are computed after a single exchange of halos of n elements with the neighboring processes.
 
     a : DNDarray
         Input array
@@ -312,66 +326,17 @@ def diff(a, n=1, axis=-1):
 
     axis = stride_tricks.sanitize_axis(a.gshape, axis)
 
-    if not a.is_distributed():
-        ret = a.copy()
-        for _ in range(n):
-            axis_slice = [slice(None)] * len(ret.shape)
-            axis_slice[axis] = slice(1, None, None)
-            axis_slice_end = [slice(None)] * len(ret.shape)
-            axis_slice_end[axis] = slice(None, -1, None)
-            ret = ret[tuple(axis_slice)] - ret[tuple(axis_slice_end)]
-        return ret
-
-    size = a.comm.size
-    rank = a.comm.rank
-    ret = a.copy()
-    # work loop, runs n times. using the result at the end of the loop as the starting values for each loop
-    for _ in range(n):
-        axis_slice = [slice(None)] * len(ret.shape)
-        axis_slice[axis] = slice(1, None, None)
-        axis_slice_end = [slice(None)] * len(ret.shape)
-        axis_slice_end[axis] = slice(None, -1, None)
-
-        # build the slice for the first element on the specified axis
-        arb_slice = [slice(None)] * len(a.shape)
-        arb_slice[axis] = 0
-        # send the first element of the array to rank - 1
-        if rank > 0:
-            snd = ret.comm.Isend(ret.lloc[arb_slice].clone(), dest=rank - 1, tag=rank)
-
-        # standard logic for the diff with the next element
-        dif = ret.lloc[axis_slice] - ret.lloc[axis_slice_end]
-        # need to slice out to select the proper elements of out
-        diff_slice = [slice(x) for x in dif.shape]
-        ret.lloc[diff_slice] = dif
-
-        if rank > 0:
-            snd.wait()  # wait for the send to finish
-        if rank < size - 1:
-            cr_slice = [slice(None)] * len(a.shape)
-            # slice of 1 element in the selected axis for the shape creation
-            cr_slice[axis] = 1
-            recv_data = torch.ones(
-                ret.lloc[cr_slice].shape, dtype=ret.dtype.torch_type(), device=a.device.torch_device
-            )
-            rec = ret.comm.Irecv(recv_data, source=rank + 1, tag=rank + 1)
-            axis_slice_end = [slice(None)] * len(a.shape)
-            # select the last elements in the selected axis
-            axis_slice_end[axis] = slice(-1, None)
-            rec.wait()
-            # diff logic
-            ret.lloc[axis_slice_end] = (
-                recv_data.reshape(ret.lloc[axis_slice_end].shape) - ret.lloc[axis_slice_end]
-            )
-
-    axis_slice_end = [slice(None, None, None)] * len(a.shape)
-    axis_slice_end[axis] = slice(None, -1 * n, None)
-    ret = ret[tuple(axis_slice_end)]  # slice off the last element on the array (nonsense data)
-    ret.balance_()  # balance the array before returning
-    return ret
-
-
-def div(t1, t2):
+    # the differences of the windows of n + 1 elements starting within the local chunks, a split axis is extended by a
+    # single halo exchange of n elements
+    local, windowed, axis = signal.__windows(a, n + 1, axis, strict=False)
+    differences = torch.diff(local, n=n, dim=axis)
+
+    return signal.__window_result(
+        differences, windowed, axis, n + 1, types.canonical_heat_type(differences.dtype), a.split
+    )
+
+
+def div(t1, t2, out=None):
     """
     Element-wise true division of values of operand t1 by values of operands t2 (i.e t1 / t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2)
@@ -383,6 +348,9 @@ def div(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -406,14 +374,14 @@ def div(t1, t2):
     tensor([[2.0000, 1.0000],
             [0.6667, 0.5000]])
     """
-    return operations.__binary_op(torch.true_divide, t1, t2)
+    return operations.__binary_op(torch.true_divide, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 divide = div
 
 
-def fmod(t1, t2):
+def fmod(t1, t2, out=None):
     """
     Element-wise division remainder of values of operand t1 by values of operand t2 (i.e. C Library function fmod), not commutative.
     Takes the two operands (scalar or tensor, both may contain floating point number) whose elements are to be
@@ -425,6 +393,9 @@ def fmod(t1, t2):
         The first operand whose values are divided (may be floats)
     t2: tensor or scalar
         The second operand by whose values is divided (may be floats)
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -449,10 +420,10 @@ def fmod(t1, t2):
     tensor([[0., 0.]
             [2., 2.]])
     """
-    return operations.__binary_op(torch.fmod, t1, t2)
+    return operations.__binary_op(torch.fmod, t1, t2, out)
 
 
-def floordiv(t1, t2):
+def floordiv(t1, t2, out=None):
     """
     Element-wise floor division of value of operand t1 by values of operands t2 (i.e. t1 // t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2) as argument.
@@ -463,6 +434,9 @@ def floordiv(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Return
     ------
@@ -481,7 +455,7 @@ def floordiv(t1, t2):
     tensor([[1., 0.],
             [1., 1.]])
     """
-    return operations.__binary_op(torch.floor_divide, t1, t2)
+    return operations.__binary_op(torch.floor_divide, t1, t2, out)
 
 
 # Alias in compliance with numpy API
@@ -517,7 +491,7 @@ def invert(t, out=None):
 bitwise_not = invert
 
 
-def left_shift(t1, t2):
+def left_shift(t1, t2, out=None):
     """
     Shift the bits of an integer to the left.
 
@@ -527,6 +501,9 @@ def left_shift(t1, t2):
 
     t2: scalar or tensor
         integer number of zero bits to add
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -544,10 +521,15 @@ def left_shift(t1, t2):
         if not types.heat_type_is_exact(dtype):
             raise TypeError("Operation is supported for integer types only")
 
-    return operations.__binary_op(torch.Tensor.__lshift__, t1, t2)
+    def local_left_shift(t1l, t2l, out=None):
+        # torch does not provide an out-capable left shift, the result is copied into the buffer instead
+        result = t1l.__lshift__(t2l)
+        return result if out is None else out.copy_(result)
+
+    return operations.__binary_op(local_left_shift, t1, t2, out)
 
 
-def mod(t1, t2):
+def mod(t1, t2, out=None):
     """
     Element-wise division remainder of values of operand t1 by values of operand t2 (i.e. t1 % t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2) as arguments.
@@ -560,6 +542,9 @@ def mod(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -584,10 +569,10 @@ def mod(t1, t2):
     tensor([[0, 0]
             [2, 2]], dtype=torch.int32)
     """
-    return remainder(t1, t2)
+    return remainder(t1, t2, out)
 
 
-def mul(t1, t2):
+def mul(t1, t2, out=None):
     """
     Element-wise multiplication (NOT matrix multiplication) of values from two operands, commutative.
     Takes the first and second operand (scalar or tensor) whose elements are to be multiplied as argument.
@@ -598,6 +583,9 @@ def mul(t1, t2):
         The first operand involved in the multiplication
     t2: tensor or scalar
         The second operand involved in the multiplication
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -626,14 +614,14 @@ def mul(t1, t2):
     tensor([[2., 4.],
             [6., 8.]])
     """
-    return operations.__binary_op(torch.mul, t1, t2)
+    return operations.__binary_op(torch.mul, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 multiply = mul
 
 
-def pow(t1, t2):
+def pow(t1, t2, out=None):
     """
     Element-wise exponential function of values of operand t1 to the power of values of operand t2 (i.e t1 ** t2),
     not commutative. Takes the two operands (scalar or tensor) whose elements are to be involved in the exponential
@@ -646,6 +634,9 @@ def pow(t1, t2):
         The first operand whose values represent the base
     t2: tensor or scalar
         The second operand by whose values represent the exponent
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -668,14 +659,14 @@ def pow(t1, t2):
     tensor([[1., 8.],
             [27., 64.]])
     """
-    return operations.__binary_op(torch.pow, t1, t2)
+    return operations.__binary_op(torch.pow, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 power = pow
 
 
-def remainder(t1, t2):
+def remainder(t1, t2, out=None):
     """
     Element-wise division remainder of values of operand t1 by values of operand t2 (i.e. t1 % t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be divided (operand 1 by operand 2) as arguments.
@@ -686,6 +677,9 @@ def remainder(t1, t2):
         The first operand whose values are divided
     t2: tensor or scalar
         The second operand by whose values is divided
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -710,10 +704,10 @@ def remainder(t1, t2):
     tensor([[0, 0]
             [2, 2]], dtype=torch.int32)
     """
-    return operations.__binary_op(torch.remainder, t1, t2)
+    return operations.__binary_op(torch.remainder, t1, t2, out)
 
 
-def right_shift(t1, t2):
+def right_shift(t1, t2, out=None):
     """
     Shift the bits of an integer to the right.
 
@@ -723,6 +717,9 @@ def right_shift(t1, t2):
 
     t2: scalar or tensor
         integer number of bits to remove
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -740,7 +737,12 @@ def right_shift(t1, t2):
         if not types.heat_type_is_exact(dtype):
             raise TypeError("Operation is supported for integer types only")
 
-    return operations.__binary_op(torch.Tensor.__rshift__, t1, t2)
+    def local_right_shift(t1l, t2l, out=None):
+        # torch does not provide an out-capable right shift, the result is copied into the buffer instead
+        result = t1l.__rshift__(t2l)
+        return result if out is None else out.copy_(result)
+
+    return operations.__binary_op(local_right_shift, t1, t2, out)
 
 
 def prod(x, axis=None, out=None, keepdim=None):
@@ -792,7 +794,7 @@ def prod(x, axis=None, out=None, keepdim=None):
     )
 
 
-def sub(t1, t2):
+def sub(t1, t2, out=None):
     """
     Element-wise subtraction of values of operand t2 from values of operands t1 (i.e t1 - t2), not commutative.
     Takes the two operands (scalar or tensor) whose elements are to be subtracted (operand 2 from operand 1)
@@ -804,6 +806,9 @@ def sub(t1, t2):
         The first operand from which values are subtracted
     t2: tensor or scalar
         The second operand whose values are subtracted
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. If not
+        provided or set to None, a fresh tensor is allocated.
 
     Returns
     -------
@@ -827,14 +832,14 @@ def sub(t1, t2):
     tensor([[ 1.,  0.],
             [-1., -2.]])
     """
-    return operations.__binary_op(torch.sub, t1, t2)
+    return operations.__binary_op(torch.sub, t1, t2, out)
 
 
 # Alias in compliance with numpy API
 subtract = sub
 
 
-def sum(x, axis=None, out=None, keepdim=None):
+def sum(x, axis=None, out=None, keepdim=None, async_op=False):
     """
     Sum of array elements over a given axis.
 
@@ -855,6 +860,9 @@ def sum(x, axis=None, out=None, keepdim=None):
     keepdims : bool, optional
         If this is set to True, the axes which are reduced are left in the result as dimensions with size one. With this
         option, the result will broadcast correctly against the input array.
+    async_op : bool, optional
+        If True, the global reduction is performed with a non-blocking collective operation and a pending DNDarray is
+        returned. The reduction is completed on the first access to the data of the result. Default: False
 
     Returns
     -------
@@ -879,5 +887,5 @@ def sum(x, axis=None, out=None, keepdim=None):
     """
     # TODO: make me more numpy API complete Issue #101
     return operations.__reduce_op(
-        x, torch.sum, MPI.SUM, axis=axis, out=out, neutral=0, keepdim=keepdim
+        x, torch.sum, MPI.SUM, axis=axis, out=out, neutral=0, keepdim=keepdim, async_op=async_op
     )
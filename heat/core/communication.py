@@ -1,5 +1,9 @@
 from mpi4py import MPI
 
+import atexit
+import collections
+import contextlib
+import functools
 import numpy as np
 import os
 import subprocess
@@ -19,6 +23,10 @@ CUDA_AWARE_MPI = CUDA_AWARE_MPI or os.environ.get("MPIR_CVAR_ENABLE_HCOLL") == "
 # ParaStationMPI
 CUDA_AWARE_MPI = CUDA_AWARE_MPI or os.environ.get("PSP_CUDA") == "1"
 
+DatatypeCacheInfo = collections.namedtuple(
+    "DatatypeCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
 
 class Communication:
     @staticmethod
@@ -62,11 +70,29 @@ class MPICommunication(Communication):
         torch.float32: MPI.FLOAT,
         torch.float64: MPI.DOUBLE,
     }
+    # builtin reduction operations, the reductions of several buffers can be packed into a single one
+    __COALESCABLE_OPS = (
+        MPI.SUM,
+        MPI.PROD,
+        MPI.MIN,
+        MPI.MAX,
+        MPI.LAND,
+        MPI.LOR,
+        MPI.BAND,
+        MPI.BOR,
+    )
+    # maximum number of committed derived data types kept in the cache
+    DATATYPE_CACHE_SIZE = 256
+    # LRU cache of committed derived data types, shared by all communicators, and its hit and miss counters
+    __datatype_cache = collections.OrderedDict()
+    __datatype_cache_stats = {"hits": 0, "misses": 0}
 
     def __init__(self, handle=MPI.COMM_WORLD):
         self.handle = handle
         self.rank = handle.Get_rank()
         self.size = handle.Get_size()
+        # queue of coalesced reductions, None outside of a coalesce() context
+        self.__queue = None
 
     def is_distributed(self):
         """
@@ -79,6 +105,93 @@ class MPICommunication(Communication):
         """
         return self.size > 1
 
+    @contextlib.contextmanager
+    def coalesce(self):
+        """
+        Context manager coalescing many small reductions into few collective operations. Within the context, in-place
+        non-blocking reductions of torch tensors with a builtin MPI_Op, i.e. Iallreduce(MPI.IN_PLACE, tensor, op), are
+        queued instead of being started. Reductions of heat, e.g. sum() or mean(), return pending DNDarrays. The queue
+        is flushed on exit of the context or as soon as any of the queued reductions is waited for, e.g. by accessing
+        the data of a pending DNDarray, see flush().
+
+        Examples
+        --------
+        >>> a = torch.tensor([1.0, 2.0])
+        >>> b = torch.tensor([3.0])
+        >>> with ht.MPI_WORLD.coalesce():
+        ...     ht.MPI_WORLD.Iallreduce(ht.MPI.IN_PLACE, a, ht.MPI.SUM)
+        ...     ht.MPI_WORLD.Iallreduce(ht.MPI.IN_PLACE, b, ht.MPI.MIN)
+        ...     c = ht.sum(ht.ones((4, 4), split=0), axis=0)
+        """
+        outermost = self.__queue is None
+        if outermost:
+            self.__queue = []
+        try:
+            yield
+        finally:
+            if outermost:
+                self.flush()
+                self.__queue = None
+
+    def is_coalescing(self):
+        """
+        Determines whether reductions are currently coalesced, i.e. whether called within a coalesce() context.
+
+        Returns
+        -------
+            coalescing_flag : bool
+                flag indicating whether in-place non-blocking reductions are queued
+        """
+        return self.__queue is not None
+
+    def flush(self):
+        """
+        Performs the reductions queued within a coalesce() context. The queued tensors are grouped by reduction
+        operation, data type and device. Each group is packed into a contiguous buffer, reduced with a single Allreduce
+        and the results are written back into the queued tensors. Minima are reduced as maxima of order-reversed values,
+        i.e. negated floating point values and bitwise inverted integers, such that they share a buffer with maxima.
+        """
+        if not self.__queue:
+            return
+        queue, self.__queue = self.__queue, []
+
+        groups = []
+        for tensor, op in queue:
+            reverse = op == MPI.MIN
+            key = (MPI.MAX if reverse else op, tensor.dtype, tensor.device)
+            for group_key, members in groups:
+                if group_key == key:
+                    members.append((tensor, reverse))
+                    break
+            else:
+                groups.append((key, [(tensor, reverse)]))
+
+        for (op, _, _), members in groups:
+            chunks = [
+                self.__order_reversed(tensor) if reverse else tensor for tensor, reverse in members
+            ]
+            buffer = torch.cat([chunk.reshape(-1) for chunk in chunks])
+            self.Allreduce(MPI.IN_PLACE, buffer, op)
+
+            offset = 0
+            for (tensor, reverse), chunk in zip(members, chunks):
+                result = buffer[offset : offset + chunk.numel()].reshape(chunk.shape)
+                tensor.copy_(self.__order_reversed(result) if reverse else result)
+                offset += chunk.numel()
+
+        # the requests of the queued reductions are completed
+        queue.clear()
+
+    @staticmethod
+    def __order_reversed(tensor):
+        """
+        Order-reversing and self-inverse transformation of a torch tensor, i.e. negation of floating point values and
+        bitwise inversion of integer and Boolean values.
+        """
+        if tensor.is_floating_point():
+            return -tensor
+        return torch.bitwise_not(tensor)
+
     def chunk(self, shape, split, rank=None, w_size=None):
         """
         Calculates the chunk of data that will be assigned to this compute node given a global data shape and a split
@@ -117,23 +230,42 @@ class MPICommunication(Communication):
         if not isinstance(rank, int) or not isinstance(w_size, int):
             raise TypeError("rank and size must be integers")
 
-        dims = len(shape)
+        offsets, lshapes = self.__chunk_table(tuple(shape), split, w_size)
+        start, lshape = offsets[rank], lshapes[rank]
+
+        return (
+            start,
+            lshape,
+            tuple(
+                slice(0, end) if i != split else slice(start, start + end)
+                for i, end in enumerate(lshape)
+            ),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def __chunk_table(shape, split, w_size):
+        """
+        Offsets along the split axis and local shapes of all processes for a regular chunking of the given shape. The
+        tables are shared by all communicators and keyed by (shape, split, w_size), they hence are calculated only once
+        for each partitioning.
+        """
         size = shape[split]
         chunk = size // w_size
         remainder = size % w_size
 
-        if remainder > rank:
-            chunk += 1
-            start = rank * chunk
-        else:
-            start = rank * chunk + remainder
-        end = start + chunk
+        offsets, lshapes = [], []
+        for rank in range(w_size):
+            if remainder > rank:
+                start = rank * (chunk + 1)
+                end = start + chunk + 1
+            else:
+                start = rank * chunk + remainder
+                end = start + chunk
+            offsets.append(start)
+            lshapes.append(shape[:split] + (end - start,) + shape[split + 1 :])
 
-        return (
-            start,
-            tuple(shape[i] if i != split else end - start for i in range(dims)),
-            tuple(slice(0, shape[i]) if i != split else slice(start, end) for i in range(dims)),
-        )
+        return tuple(offsets), tuple(lshapes)
 
     def counts_displs_shape(self, shape, axis):
         """
@@ -152,36 +284,35 @@ class MPICommunication(Communication):
         counts_and_displs : two-tuple of tuple of ints
             The counts and displacements for all nodes
         """
-        # the elements send/received by all nodes
-        counts = np.full((self.size,), shape[axis] // self.size)
-        counts[: shape[axis] % self.size] += 1
-
-        # the displacements into the buffer
-        displs = np.zeros((self.size,), dtype=counts.dtype)
-        np.cumsum(counts[:-1], out=displs[1:])
+        axis = sanitize_axis(shape, axis)
+        offsets, lshapes = self.__chunk_table(tuple(shape), axis, self.size)
+        counts = tuple(lshape[axis] for lshape in lshapes)
 
         # helper that calculates the output shape for a receiving buffer under the assumption all nodes have an equally
         # sized input compared to this node
         output_shape = list(shape)
         output_shape[axis] = self.size * counts[self.rank]
 
-        return tuple(counts), tuple(displs), tuple(output_shape)
+        return counts, offsets, tuple(output_shape)
 
     @classmethod
-    def mpi_type_and_elements_of(cls, obj, counts, displs):
+    def mpi_type_and_elements_of(cls, obj, counts, displs, axis=0):
         """
         Determines the MPI data type and number of respective elements for the given tensor. In case the tensor is
-        contiguous in memory, a native MPI data type can be used. Otherwise, a derived data type is automatically
-        constructed using the storage information of the passed object.
+        contiguous in memory and its slices along the axis are stored one after another, a native MPI data type can be
+        used. Otherwise, a derived data type describing a single slice along the axis is constructed using the storage
+        information of the passed object, i.e. no copy or permutation of the tensor is required.
 
         Parameters
         ----------
         obj : ht.DNDarray or torch.Tensor
             The object for which to construct the MPI data type and number of elements
         counts : tuple of ints, optional
-            Optional counts arguments for variable MPI-calls (e.g. Alltoallv)
+            Optional counts arguments for variable MPI-calls (e.g. Alltoallv), in slices along the axis
         displs : tuple of ints, optional
-            Optional displacements arguments for variable MPI-calls (e.g. Alltoallv)
+            Optional displacements arguments for variable MPI-calls (e.g. Alltoallv), in slices along the axis
+        axis : int, optional
+            The axis along which the tensor is transmitted in slices. Default is 0
 
         Returns
         -------
@@ -189,18 +320,15 @@ class MPICommunication(Communication):
             The data type object
         elements : int or tuple of ints
             The number of elements of the respective data type
-
-        # ToDo: The option to explicitely specify the counts and displacements to be send still needs propper implementation
-
         """
         mpi_type, elements = cls.__mpi_type_mappings[obj.dtype], torch.numel(obj)
 
-        # simple case, continuous memory can be transmitted as is
-        if obj.is_contiguous():
+        # simple case, continuous memory holding the slices one after another can be transmitted as is
+        if obj.is_contiguous() and int(np.prod(obj.shape[:axis])) == 1:
             if counts is None:
                 return mpi_type, elements
             else:
-                factor = np.prod(obj.shape[1:])
+                factor = int(np.prod(obj.shape[axis + 1 :]))
                 return (
                     mpi_type,
                     (
@@ -209,23 +337,131 @@ class MPICommunication(Communication):
                     ),
                 )
 
-        # non-continuous memory, e.g. after a transpose, has to be packed in derived MPI types
-        elements = obj.shape[0]
-        shape = obj.shape[1:]
-        strides = [1] * len(shape)
-        strides[0] = obj.stride()[-1]
-        strides = strides[::-1]
-        offsets = [obj.element_size() * stride for stride in obj.stride()[:-1]]
-
-        # chain the types based on the
-        for i in range(len(shape) - 1, -1, -1):
-            mpi_type = mpi_type.Create_vector(shape[i], 1, strides[i]).Create_resized(0, offsets[i])
-            mpi_type.Commit()
+        # otherwise, a derived data type describes one slice, its extent is the stride along the axis
+        shape = list(obj.shape)
+        shape[axis] = 1
+        extent = obj.stride()[axis] * obj.element_size()
+        mpi_type = cls.__strided_type(mpi_type, shape, obj.stride(), obj.element_size(), extent)
 
         if counts is not None:
-            return mpi_type, (counts, displs)
+            return mpi_type, (tuple(counts), tuple(displs))
 
-        return mpi_type, elements
+        return mpi_type, obj.shape[axis]
+
+    @classmethod
+    def __strided_type(cls, mpi_type, shape, strides, element_size, extent=None, keep=2):
+        """
+        Returns a committed derived MPI data type for a box of the given shape within a strided tensor. The box is
+        traversed in row-major order, i.e. in the same order as a contiguous tensor of that shape, regardless of the
+        strides. Innermost dimensions that are contiguous in memory are merged into a single block.
+
+        The data types are looked up in an LRU cache keyed by the element type and the memory layout of the box. They
+        are owned by the cache and freed on eviction or by datatype_cache_clear(), callers must not free them.
+
+        Parameters
+        ----------
+        mpi_type : MPI.Datatype
+            The MPI data type of a single element
+        shape : list of ints
+            The shape of the box
+        strides : tuple of ints
+            The strides of the tensor in elements
+        element_size : int
+            The size of a single element in bytes
+        extent : int, optional
+            The extent of the data type in bytes, defaults to the extent of the box
+        keep : int, optional
+            The number of most recently used data types that must not be evicted, as the calling operation may still
+            need them, see __cache_datatype(). Default is 2, i.e. the send and the receive type of an operation
+
+        Returns
+        -------
+        type : MPI.Datatype
+            The committed derived data type
+        """
+        dims = [dim for dim in range(len(shape)) if shape[dim] != 1]
+        block = 1
+        while dims and strides[dims[-1]] == block:
+            block *= shape[dims.pop()]
+
+        # the layout is canonical, e.g. the strides of dimensions of extent one do not matter
+        key = (
+            mpi_type.py2f(),
+            block,
+            tuple((shape[dim], strides[dim] * element_size) for dim in dims),
+            extent,
+        )
+        cache, stats = cls.__datatype_cache, cls.__datatype_cache_stats
+        if key in cache:
+            stats["hits"] += 1
+            cache.move_to_end(key)
+            return cache[key]
+        stats["misses"] += 1
+
+        derived = [mpi_type.Create_contiguous(block)]
+        for dim in reversed(dims):
+            derived.append(derived[-1].Create_hvector(shape[dim], 1, strides[dim] * element_size))
+        if extent is not None:
+            derived.append(derived[-1].Create_resized(0, extent))
+
+        # the intermediate types are not required anymore once the final one is constructed
+        for intermediate in derived[:-1]:
+            intermediate.Free()
+
+        return cls.__cache_datatype(key, derived[-1].Commit(), keep)
+
+    @classmethod
+    def __cache_datatype(cls, key, datatype, keep):
+        """
+        Inserts a committed data type into the cache and frees the least recently used ones exceeding its size. The
+        keep most recently used types are retained even if the cache grows beyond its size, such that the types an
+        operation has already obtained stay valid until it is started. Pending communication using a freed data type
+        completes normally.
+        """
+        cache = cls.__datatype_cache
+        cache[key] = datatype
+        while len(cache) > max(cls.DATATYPE_CACHE_SIZE, keep):
+            cache.popitem(last=False)[1].Free()
+
+        return datatype
+
+    @classmethod
+    def datatype_cache_info(cls):
+        """
+        Reports the statistics of the cache of derived MPI data types, which are created for non-contiguous buffers
+        and for communication along axes other than the first one.
+
+        Returns
+        -------
+        info : DatatypeCacheInfo
+            Named tuple of the number of cache hits and misses, the maximum and the current number of cached types
+
+        Examples
+        --------
+        >>> a = torch.ones((4, 3)).T
+        >>> ht.MPI_WORLD.Bcast(a)
+        >>> ht.MPI_WORLD.Bcast(a)
+        >>> ht.MPI_WORLD.datatype_cache_info()
+        DatatypeCacheInfo(hits=1, misses=1, maxsize=256, currsize=1)
+        """
+        return DatatypeCacheInfo(
+            cls.__datatype_cache_stats["hits"],
+            cls.__datatype_cache_stats["misses"],
+            cls.DATATYPE_CACHE_SIZE,
+            len(cls.__datatype_cache),
+        )
+
+    @classmethod
+    def datatype_cache_clear(cls):
+        """
+        Frees all cached derived MPI data types and resets the hit and miss counters. Called automatically at
+        interpreter shutdown, before MPI is finalized.
+        """
+        if not MPI.Is_finalized():
+            for datatype in cls.__datatype_cache.values():
+                datatype.Free()
+        cls.__datatype_cache.clear()
+        cls.__datatype_cache_stats.update(hits=0, misses=0)
 
     @classmethod
     def as_mpi_memory(cls, obj):
@@ -243,13 +479,11 @@ class MPICommunication(Communication):
             The MPI memory objects of the passed tensor.
         """
 
-        pointer = obj.data_ptr()
-        pointer += obj.storage_offset()
-
-        return MPI.memory.fromaddress(pointer, 0)
+        # data_ptr() already points to the first element of views with a storage offset
+        return MPI.memory.fromaddress(obj.data_ptr(), 0)
 
     @classmethod
-    def as_buffer(cls, obj, counts=None, displs=None):
+    def as_buffer(cls, obj, counts=None, displs=None, axis=0):
         """
         Converts a passed torch tensor into a memory buffer object with associated number of elements and MPI data type.
 
@@ -261,117 +495,18 @@ class MPICommunication(Communication):
             Optional counts arguments for variable MPI-calls (e.g. Alltoallv)
         displs : tuple of ints, optional
             Optional displacements arguments for variable MPI-calls (e.g. Alltoallv)
+        axis : int, optional
+            The axis along which the tensor is transmitted in slices, see mpi_type_and_elements_of(). Default is 0
 
         Returns
         -------
         buffer : list[MPI.memory, int, MPI.Datatype] or list[MPI.memory, tuple of int, MPI.Datatype]
             The buffer information of the passed tensor, ready to be passed as MPI send or receive buffer.
         """
-        mpi_type, elements = cls.mpi_type_and_elements_of(obj, counts, displs)
+        mpi_type, elements = cls.mpi_type_and_elements_of(obj, counts, displs, axis)
 
         return [cls.as_mpi_memory(obj), elements, mpi_type]
 
-    def alltoall_sendbuffer(self, obj):
-        """
-        Converts a passed torch tensor into a memory buffer object with associated number of elements and MPI data type.
-        XXX: might not work for all MPI stacks. Might require multiple type commits or so
-
-        Parameters
-        ----------
-        obj: torch.Tensor
-             The object to be transformed into a custom MPI datatype
-
-        """
-        mpi_type, _ = self.__mpi_type_mappings[obj.dtype], torch.numel(obj)
-
-        nproc = self.size
-        shape = obj.shape
-        strides = [1] * len(shape)
-        strides[-1] = obj.stride()[-1]
-        offsets = [0] * len(shape)
-        offsets[1:] = [obj.element_size() * stride for stride in obj.stride()[:-1]]
-
-        # Step 1: Wrap along axes > 1 (all axes except send_axis and recv_axis
-        for i in range(len(shape) - 1, 1, -1):
-            mpi_type = mpi_type.Create_vector(shape[i], 1, strides[i]).Create_resized(0, offsets[i])
-            mpi_type.Commit()
-
-        # Step 2: Create Custom sized vector datatypes, according to rank-specific size along send_axis
-        # send_elements has nproc entries, defining how many vectors of mpi_type are stacked together for each process to receive along the send_axis
-        send_elements = np.full((nproc,), obj.shape[1] // nproc)
-        send_elements[: obj.shape[1] % nproc] += 1
-
-        # Create short_Type from the last entry of send_elements
-        mpi_short_type = mpi_type.Create_vector(send_elements[-1], 1, strides[1]).Create_resized(
-            0, offsets[1]
-        )
-        mpi_short_type.Commit()
-        # Create long_Type from the first entry of send_elements (wraps one more mpi_type vector than short_Type
-        mpi_long_type = mpi_type.Create_vector(send_elements[0], 1, strides[1]).Create_resized(
-            0, offsets[1]
-        )
-        mpi_long_type.Commit()
-
-        # Step 3: Pack short_type and long_type along the recv_axis
-        mpi_short_type = mpi_short_type.Create_vector(shape[0], 1, strides[0]).Create_resized(
-            0, send_elements[-1] * obj.stride()[1] * obj.element_size()
-        )
-        mpi_short_type.Commit()
-        mpi_long_type = mpi_long_type.Create_vector(shape[0], 1, strides[0]).Create_resized(
-            0, send_elements[0] * obj.stride()[1] * obj.element_size()
-        )
-        mpi_long_type.Commit()
-
-        # Step 4: Prepare sencounts, senddispls and sendtypes for alltoallw
-        # to each process 1 element (=sendcount) of the custom prepared long or short type will be send
-        sendcount = [1] * nproc
-        tmp_displs = [0] * nproc
-        tmp_displs[1:] = np.cumsum(send_elements[:-1])
-        element_size = obj.element_size()
-        senddispls = [element_size * obj.stride()[1] * d for d in tmp_displs]
-        sendtypes = [mpi_short_type] * nproc
-        for i in range(obj.shape[1] % nproc):
-            sendtypes[i] = mpi_long_type
-
-        return self.as_mpi_memory(obj), (sendcount, senddispls), sendtypes
-
-    def alltoall_recvbuffer(self, obj):
-        """
-        Converts a passed torch tensor into a memory buffer object with associated number of elements and MPI data type.
-        XXX: might not work for all MPI stacks. Might require multiple type commits or so
-
-        Parameters
-        ----------
-        obj: torch.Tensor
-             The object to be transformed into a custom MPI datatype
-        """
-
-        mpi_type, _ = self.__mpi_type_mappings[obj.dtype], torch.numel(obj)
-
-        nproc = self.size
-        shape = obj.shape[1:]
-        strides = [1] * len(shape)
-        strides[0] = obj.stride()[-1]
-        strides = strides[::-1]
-        offsets = [obj.element_size() * stride for stride in obj.stride()[:-1]]
-
-        # Step 1: Wrap along axes > 0 (all axes except recv_axis)
-        for i in range(len(shape) - 1, -1, -1):
-            mpi_type = mpi_type.Create_vector(shape[i], 1, strides[i]).Create_resized(0, offsets[i])
-            mpi_type.Commit()
-
-        # Step 2: Receive blocks along the recv axis
-        # Prepare recvcount, senddispls and sendtypes for alltoallw
-        recvcount = np.full((nproc,), obj.shape[0] // nproc)
-        recvcount[: obj.shape[0] % nproc] += 1
-        # size/extent of mpitype = offsets[0]
-        tmp_displs = [0] * nproc
-        tmp_displs[1:] = np.cumsum(recvcount[:-1])
-        recvdispls = [offsets[0] * d for d in tmp_displs]
-        recvtypes = [mpi_type] * nproc
-
-        return self.as_mpi_memory(obj), (recvcount, recvdispls), recvtypes
-
     def Irecv(self, buf, source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG):
         if isinstance(buf, dndarray.DNDarray):
             buf = buf._DNDarray__array
@@ -448,6 +583,37 @@ class MPICommunication(Communication):
 
     Send.__doc__ = MPI.Comm.Send.__doc__
 
+    def __persistent_like(self, func, buf, rank, tag, send):
+        """
+        Sets up a persistent point-to-point request for the passed buffer. The MPI data type of a non-contiguous tensor
+        is duplicated and owned by the request, such that it stays valid independent of the data type cache.
+        """
+        if isinstance(buf, dndarray.DNDarray):
+            buf = buf._DNDarray__array
+        if not isinstance(buf, torch.Tensor):
+            return MPIPersistentRequest(func(buf, rank, tag))
+
+        # in case of GPUs without CUDA-aware MPI, a host memory copy is synchronized on every start or completion
+        staged = buf if CUDA_AWARE_MPI else buf.cpu()
+        memory, elements, mpi_type = self.as_buffer(staged)
+        if not mpi_type.is_predefined:
+            mpi_type = mpi_type.Dup()
+        request = func([memory, elements, mpi_type], rank, tag)
+
+        if send:
+            return MPIPersistentRequest(request, staged, None, buf, mpi_type)
+        return MPIPersistentRequest(request, None, staged, buf, mpi_type)
+
+    def Send_init(self, buf, dest, tag=0):
+        return self.__persistent_like(self.handle.Send_init, buf, dest, tag, send=True)
+
+    Send_init.__doc__ = MPI.Comm.Send_init.__doc__
+
+    def Recv_init(self, buf, source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG):
+        return self.__persistent_like(self.handle.Recv_init, buf, source, tag, send=False)
+
+    Recv_init.__doc__ = MPI.Comm.Recv_init.__doc__
+
     def __broadcast_like(self, func, buf, root):
         # unpack the buffer if it is a HeAT tensor
         if isinstance(buf, dndarray.DNDarray):
@@ -530,6 +696,17 @@ class MPICommunication(Communication):
     Exscan.__doc__ = MPI.COMM_WORLD.Exscan.__doc__
 
     def Iallreduce(self, sendbuf, recvbuf, op=MPI.SUM):
+        if isinstance(recvbuf, dndarray.DNDarray):
+            recvbuf = recvbuf._DNDarray__array
+        # in-place reductions of tensors are queued within a coalesce() context
+        if (
+            self.__queue is not None
+            and sendbuf is MPI.IN_PLACE
+            and isinstance(recvbuf, torch.Tensor)
+            and op in self.__COALESCABLE_OPS
+        ):
+            self.__queue.append((recvbuf, op))
+            return MPICoalescedRequest(self, self.__queue)
         return MPIRequest(*self.__reduce_like(self.handle.Iallreduce, sendbuf, recvbuf, op))
 
     Iallreduce.__doc__ = MPI.Comm.Iallreduce.__doc__
@@ -607,41 +784,28 @@ class MPICommunication(Communication):
         # keep a reference to the original buffer object
         original_recvbuf = recvbuf
 
-        # permute the send_axis order so that the split send_axis is the first to be transmitted
-        if axis != 0:
-            send_axis_permutation = list(range(sendbuf.ndimension()))
-            send_axis_permutation[0], send_axis_permutation[axis] = axis, 0
-            sendbuf = sendbuf.permute(*send_axis_permutation)
-
-        if axis != 0:
-            recv_axis_permutation = list(range(recvbuf.ndimension()))
-            recv_axis_permutation[0], recv_axis_permutation[axis] = axis, 0
-            recvbuf = recvbuf.permute(*recv_axis_permutation)
-        else:
-            recv_axis_permutation = None
-
         sbuf = sendbuf if CUDA_AWARE_MPI or not isinstance(sendbuf, torch.Tensor) else sendbuf.cpu()
         rbuf = recvbuf if CUDA_AWARE_MPI or not isinstance(recvbuf, torch.Tensor) else recvbuf.cpu()
 
-        # prepare buffer objects
+        # prepare buffer objects, both buffers are transmitted in slices along the axis without permuting them
         if sendbuf is MPI.IN_PLACE or not isinstance(sendbuf, torch.Tensor):
             mpi_sendbuf = sbuf
         else:
-            mpi_sendbuf = self.as_buffer(sbuf, send_counts, send_displs)
+            mpi_sendbuf = self.as_buffer(sbuf, send_counts, send_displs, axis)
             if send_counts is not None:
                 mpi_sendbuf[1] = mpi_sendbuf[1][0][self.rank]
 
         if recvbuf is MPI.IN_PLACE or not isinstance(recvbuf, torch.Tensor):
             mpi_recvbuf = rbuf
         else:
-            mpi_recvbuf = self.as_buffer(rbuf, recv_counts, recv_displs)
+            mpi_recvbuf = self.as_buffer(rbuf, recv_counts, recv_displs, axis)
             if recv_counts is None:
                 mpi_recvbuf[1] //= self.size
 
         # perform the scatter operation
         exit_code = func(mpi_sendbuf, mpi_recvbuf, **kwargs)
 
-        return exit_code, sbuf, rbuf, original_recvbuf, recv_axis_permutation
+        return exit_code, sbuf, rbuf, original_recvbuf, None
 
     def Allgather(self, sendbuf, recvbuf, recv_axis=0):
         """
@@ -716,9 +880,9 @@ class MPICommunication(Communication):
         sendbuf: Input send buffer; can be of type DNDarray, torch.Tensor, tuple = (torch.Tensor, send_counts, send_displ), or any other numpy supported type (only if send_axis == 0)
         recvbuf: Input receive buffer; can be of type DNDarray, torch.Tensor, tuple = (torch.Tensor, send_counts, send_displ), or any other numpy supported type (only if send_axis == 0)
         send_axis: future split axis, along which data blocks will be created that will be send to individual ranks
-                    if send_axis == recv_axis, an error will be thrown
-                    if send_axis or recv_axis are None, an error will be thrown
-        recv_axis: prior split axis, along which blocks are received from the individual ranks
+                    if send_axis is None, an error will be thrown
+        recv_axis: prior split axis, along which blocks are received from the individual ranks, defaults to send_axis.
+                    Any combination of axes is supported without permuting or copying the buffers
 
         Returns
         -------
@@ -760,85 +924,82 @@ class MPICommunication(Communication):
         # keep a reference to the original buffer object
         original_recvbuf = recvbuf
 
-        # Simple case, continuos buffers can be transmitted as is
-        if send_axis < 2 and recv_axis < 2:
-            send_axis_permutation = list(range(recvbuf.ndimension()))
-            recv_axis_permutation = list(range(recvbuf.ndimension()))
-
-            # Minimal Fix; Could possibly be improved when reworking counts, displs algorithmics
-            if self.size > 1:
-                send_axis_permutation[0], send_axis_permutation[send_axis] = (send_axis, 0)
-                recv_axis_permutation[0], recv_axis_permutation[recv_axis] = (recv_axis, 0)
+        # prepare buffer objects
+        sbuf = sendbuf if CUDA_AWARE_MPI or not isinstance(sendbuf, torch.Tensor) else sendbuf.cpu()
+        rbuf = recvbuf if CUDA_AWARE_MPI or not isinstance(recvbuf, torch.Tensor) else recvbuf.cpu()
 
+        # simple case, the blocks are sent and received in slices along the same axis
+        if send_axis == recv_axis or not isinstance(sendbuf, torch.Tensor):
+            if not isinstance(sendbuf, torch.Tensor):
+                mpi_sendbuf = sbuf
             else:
-                recv_counts = send_counts
-
-            sendbuf = sendbuf.permute(*send_axis_permutation)
-            recvbuf = recvbuf.permute(*recv_axis_permutation)
-
-            # prepare buffer objects
-            sbuf = (
-                sendbuf
-                if CUDA_AWARE_MPI or not isinstance(sendbuf, torch.Tensor)
-                else sendbuf.cpu()
-            )
-            mpi_sendbuf = self.as_buffer(sbuf, send_counts, send_displs)
-            if send_counts is None:
-                mpi_sendbuf[1] //= self.size
-
-            rbuf = (
-                recvbuf
-                if CUDA_AWARE_MPI or not isinstance(recvbuf, torch.Tensor)
-                else recvbuf.cpu()
-            )
-            mpi_recvbuf = self.as_buffer(rbuf, recv_counts, recv_displs)
-            if recv_counts is None:
-                mpi_recvbuf[1] //= self.size
+                mpi_sendbuf = self.as_buffer(sbuf, send_counts, send_displs, send_axis)
+                if send_counts is None:
+                    mpi_sendbuf[1] //= self.size
+            if not isinstance(recvbuf, torch.Tensor):
+                mpi_recvbuf = rbuf
+            else:
+                mpi_recvbuf = self.as_buffer(rbuf, recv_counts, recv_displs, recv_axis)
+                if recv_counts is None:
+                    mpi_recvbuf[1] //= self.size
 
-            # perform the scatter operation
             exit_code = func(mpi_sendbuf, mpi_recvbuf, **kwargs)
-        # slightly more difficult situation, send and receive buffer need custom datatype preparation;
-        # operation is performed via alltoallw
+        # the blocks are cut along different axes on either side, each block is described by a derived data type of
+        # its own, operation is performed via alltoallw
         else:
-            if recv_axis == send_axis:
-                raise NotImplementedError(
-                    "AllToAll for same axes not supported. Please choose send_axis and recv_axis to be different."
-                )
-
-            # Send_axis-Permutation: [recv_axis, send_axis, rest ...]
-            axis_permutation = list(range(recvbuf.ndimension()))
-            if send_axis == 0:
-                axis_permutation[1], axis_permutation[send_axis] = send_axis, 1
-                axis_permutation[recv_axis] = axis_permutation[0]
-                axis_permutation[0] = recv_axis
+            mpi_sendbuf = self.__alltoallw_buffer(sbuf, send_counts, send_displs, send_axis)
+            mpi_recvbuf = self.__alltoallw_buffer(rbuf, recv_counts, recv_displs, recv_axis)
 
+            if func.__name__.startswith("I"):
+                exit_code = self.handle.Ialltoallw(mpi_sendbuf, mpi_recvbuf, **kwargs)
             else:
-                axis_permutation[0], axis_permutation[recv_axis] = recv_axis, 0
-                axis_permutation[send_axis] = axis_permutation[1]
-                axis_permutation[1] = send_axis
-
-            sendbuf = sendbuf.permute(*axis_permutation)
-            recvbuf = recvbuf.permute(*axis_permutation)
-
-            # prepare buffer objects
-            sbuf = (
-                sendbuf
-                if CUDA_AWARE_MPI or not isinstance(sendbuf, torch.Tensor)
-                else sendbuf.cpu()
-            )
-            rbuf = (
-                recvbuf
-                if CUDA_AWARE_MPI or not isinstance(recvbuf, torch.Tensor)
-                else recvbuf.cpu()
-            )
-            mpi_sendbuf = self.alltoall_sendbuffer(sbuf)
-            mpi_recvbuf = self.alltoall_recvbuffer(rbuf)
+                exit_code = self.handle.Alltoallw(mpi_sendbuf, mpi_recvbuf, **kwargs)
 
-            exit_code = self.handle.Alltoallw(mpi_sendbuf, mpi_recvbuf, **kwargs)
-            # original_recvbuf.set_(recvbuf.storage(), recvbuf.storage_offset(), original_recvbuf.shape, original_recvbuf.stride())
-            recv_axis_permutation = list(np.argsort(np.array(axis_permutation)))
+        return exit_code, sbuf, rbuf, original_recvbuf, None
 
-        return exit_code, sbuf, rbuf, original_recvbuf, recv_axis_permutation
+    def __alltoallw_buffer(self, obj, counts, displs, axis):
+        """
+        Prepares a buffer object for an alltoallw exchanging blocks along the given axis of a tensor. Each block is
+        described by a derived data type traversing it in row-major order, such that the blocks match regardless of the
+        axis along which they are cut on the other side.
+
+        Parameters
+        ----------
+        obj : torch.Tensor
+            The send or receive buffer
+        counts : tuple of ints or None
+            The extents of the blocks along the axis, defaults to the regular chunking of the axis
+        displs : tuple of ints or None
+            The offsets of the blocks along the axis
+        axis : int
+            The axis along which the blocks are cut
+
+        Returns
+        -------
+        buffer : list[MPI.memory, tuple of lists of ints, list of MPI.Datatype]
+            The buffer information, ready to be passed to alltoallw
+        """
+        if counts is None:
+            counts, displs, _ = self.counts_displs_shape(obj.shape, axis)
+        mpi_type = self.__mpi_type_mappings[obj.dtype]
+        stride = obj.stride()[axis] * obj.element_size()
+
+        # blocks of equal extent share their data type, the send and receive types of all blocks are kept in the cache
+        block_types = {}
+        for count in counts:
+            count = int(count)
+            if count not in block_types:
+                shape = list(obj.shape)
+                shape[axis] = count
+                block_types[count] = self.__strided_type(
+                    mpi_type, shape, obj.stride(), obj.element_size(), keep=2 * self.size
+                )
+
+        return [
+            self.as_mpi_memory(obj),
+            ([int(count > 0) for count in counts], [stride * int(displ) for displ in displs]),
+            [block_types[int(count)] for count in counts],
+        ]
 
     def Alltoall(self, sendbuf, recvbuf, send_axis=0, recv_axis=None):
         ret, sbuf, rbuf, buf, permutation = self.__alltoall_like(
@@ -883,8 +1044,6 @@ class MPICommunication(Communication):
     def __scatter_like(
         self, func, sendbuf, recvbuf, send_axis, recv_axis, send_factor=1, recv_factor=1, **kwargs
     ):
-        sbuf, rbuf, recv_axis_permutation = None, None, None
-
         # align the output buffer in the same way as the input buffer by default
         if recv_axis is None:
             recv_axis = send_axis
@@ -915,28 +1074,18 @@ class MPICommunication(Communication):
         # keep a reference to the original buffer object
         original_recvbuf = recvbuf
 
-        # permute the send_axis order so that the split send_axis is the first to be transmitted
-        send_axis_permutation = list(range(recvbuf.ndimension()))
-        send_axis_permutation[0], send_axis_permutation[send_axis] = send_axis, 0
-        if self.rank == kwargs.get("root", -1) or send_counts is not None:
-            sendbuf = sendbuf.permute(*send_axis_permutation)
-
-        recv_axis_permutation = list(range(recvbuf.ndimension()))
-        recv_axis_permutation[0], recv_axis_permutation[recv_axis] = recv_axis, 0
-        recvbuf = recvbuf.permute(*recv_axis_permutation)
-
-        # prepare buffer objects
+        # prepare buffer objects, the buffers are transmitted in slices along their axes without permuting them
         sbuf = sendbuf if CUDA_AWARE_MPI or not isinstance(sendbuf, torch.Tensor) else sendbuf.cpu()
         rbuf = recvbuf if CUDA_AWARE_MPI or not isinstance(recvbuf, torch.Tensor) else recvbuf.cpu()
 
         if sendbuf is not MPI.IN_PLACE:
-            mpi_sendbuf = self.as_buffer(sbuf, send_counts, send_displs)
+            mpi_sendbuf = self.as_buffer(sbuf, send_counts, send_displs, send_axis)
             if send_counts is None:
                 mpi_sendbuf[1] //= send_factor
         else:
             mpi_sendbuf = sbuf
         if recvbuf is not MPI.IN_PLACE:
-            mpi_recvbuf = self.as_buffer(rbuf, recv_counts, recv_displs)
+            mpi_recvbuf = self.as_buffer(rbuf, recv_counts, recv_displs, recv_axis)
             if recv_counts is None:
                 mpi_recvbuf[1] //= recv_factor
         else:
@@ -945,12 +1094,7 @@ class MPICommunication(Communication):
         # perform the scatter operation
         exit_code = func(mpi_sendbuf, mpi_recvbuf, **kwargs)
 
-        # undo the recvbuf permutation and assign the temporary buffer to the original recvbuf
-        # if recv_axis != 0:
-        #    recvbuf = recvbuf.permute(*recv_axis_permutation)
-        #    original_recvbuf.set_(recvbuf.storage(), recvbuf.storage_offset(), recvbuf.shape, recvbuf.stride())
-
-        return exit_code, sbuf, rbuf, original_recvbuf, recv_axis_permutation
+        return exit_code, sbuf, rbuf, original_recvbuf, None
 
     def Gather(self, sendbuf, recvbuf, root=0, axis=0, recv_axis=None):
         ret, sbuf, rbuf, buf, permutation = self.__scatter_like(
@@ -1132,9 +1276,89 @@ class MPIRequest:
         return getattr(self.handle, name)
 
 
+class MPIPersistentRequest(MPIRequest):
+    """
+    Persistent point-to-point request, see MPICommunication.Send_init() and Recv_init(). The request is started with
+    Start() and completed with Wait() as often as required, the buffer is transmitted as it is at the time of the
+    start. Free() releases the request and its data type once it is not needed anymore.
+
+    Parameters
+    ----------
+    handle : MPI.Prequest
+        The persistent request
+    sendbuf : torch.Tensor, optional
+        The send buffer, a copy of tensor in host memory if CUDA-aware MPI is not supported
+    recvbuf : torch.Tensor, optional
+        The receive buffer, a copy of tensor in host memory if CUDA-aware MPI is not supported
+    tensor : torch.Tensor, optional
+        The tensor sent from or received into
+    datatype : MPI.Datatype, optional
+        The derived data type owned by the request
+    """
+
+    def __init__(self, handle, sendbuf=None, recvbuf=None, tensor=None, datatype=None):
+        super().__init__(handle, sendbuf, recvbuf, tensor)
+        self.datatype = datatype
+
+    def Start(self):
+        if self.sendbuf is not None and self.sendbuf is not self.tensor:
+            self.sendbuf.copy_(self.tensor)
+        self.handle.Start()
+
+    def Wait(self, status=None):
+        self.handle.Wait(status)
+        if self.recvbuf is not None and self.recvbuf is not self.tensor:
+            self.tensor.copy_(self.recvbuf)
+
+    def wait(self, status=None):
+        self.Wait(status)
+
+    def Free(self):
+        if self.handle != MPI.REQUEST_NULL:
+            self.handle.Free()
+        if self.datatype is not None and not self.datatype.is_predefined:
+            self.datatype.Free()
+        self.datatype = None
+
+    def __del__(self):
+        if "handle" in self.__dict__ and not MPI.Is_finalized():
+            self.Free()
+
+
+class MPICoalescedRequest:
+    """
+    Request of a reduction queued within a coalesce() context of a communicator. Waiting for the request flushes the
+    queue of the communicator.
+
+    Parameters
+    ----------
+    comm : MPICommunication
+        The communicator the reduction is queued in
+    queue : list
+        The queue of the communicator containing the reduction, it is emptied once it has been flushed
+    """
+
+    def __init__(self, comm, queue):
+        self.comm = comm
+        self.queue = queue
+
+    def Test(self, status=None):
+        return not self.queue
+
+    def Wait(self, status=None):
+        if self.queue:
+            self.comm.flush()
+
+    def wait(self, status=None):
+        self.Wait(status)
+
+
 MPI_WORLD = MPICommunication()
 MPI_SELF = MPICommunication(MPI.COMM_SELF)
 
+# free the cached derived data types before MPI is finalized, atexit handlers run in reverse order of registration
+atexit.register(MPICommunication.datatype_cache_clear)
+
 # set the default communicator to be MPI_WORLD
 __default_comm = MPI_WORLD
 
@@ -12,6 +12,7 @@ from . import exponential
 from . import factories
 from . import indexing
 from . import io
+from . import expressions
 from . import linalg
 from . import logical
 from . import manipulations
@@ -21,11 +22,10 @@ from . import relational
 from . import rounding
 from . import statistics
 from . import stride_tricks
-from . import tiling
 from . import trigonometrics
 from . import types
 
-from .communication import MPI
+from .communication import MPI, MPIRequest
 from .stride_tricks import sanitize_axis
 
 warnings.simplefilter("always", ResourceWarning)
@@ -46,9 +46,52 @@ class LocalIndex:
         return self.obj[key]
 
     def __setitem__(self, key, value):
+        expressions.evaluate_dependents(self.obj)
         self.obj[key] = value
 
 
+class PartitionMetadata:
+    """
+    Cache for the partition metadata of a DNDarray, i.e. the map of the local shapes on all processes and whether the
+    data is balanced. The entries are only valid for the global shape, split axis, device and communicator they were
+    determined for. This key is identical on all processes, hence all of them agree on whether the cache is valid and
+    whether the collective operation creating the entries has to be performed. Replacing the process-local tensor does
+    not invalidate the cache, as it may happen on a subset of the processes only. Collective operations moving data
+    between the processes without changing the key, e.g. redistribute_(), have to store the new entries themselves.
+    """
+
+    __slots__ = ("key", "lshape_map", "balanced")
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drops all cached entries.
+        """
+        self.key = None
+        self.lshape_map = None
+        self.balanced = None
+
+    def lookup(self, key, entry):
+        """
+        Returns the cached entry if it has been determined for the given (gshape, split, device, comm) key, None
+        otherwise.
+        """
+        if self.key != key:
+            self.invalidate()
+            self.key = key
+        return getattr(self, entry)
+
+    def store(self, key, lshape_map=None, balanced=None):
+        """
+        Replaces the cached entries by the ones determined for the given (gshape, split, device, comm) key.
+        """
+        self.key = key
+        self.lshape_map = lshape_map
+        self.balanced = balanced
+
+
 class DNDarray:
     """
 
@@ -72,6 +115,9 @@ class DNDarray:
     """
 
     def __init__(self, array, gshape, dtype, split, device, comm):
+        self.__partition = PartitionMetadata()
+        self.__expression = None
+        self.__request = None
         self.__array = array
         self.__gshape = gshape
         self.__dtype = dtype
@@ -81,6 +127,7 @@ class DNDarray:
         self.__ishalo = False
         self.__halo_next = None
         self.__halo_prev = None
+        self.__halos = None
 
         # handle inconsistencies between torch and heat devices
         if (
@@ -90,6 +137,35 @@ class DNDarray:
         ):
             self.__array = self.__array.to(devices.sanitize_device(self.__device).torch_device)
 
+    @property
+    def __array(self):
+        """
+        The process-local torch tensor. A pending lazy expression is evaluated and a pending non-blocking collective
+        operation is completed on first access.
+        """
+        if self.__request is not None:
+            request, finalize = self.__request
+            self.__request = None
+            request.Wait()
+            if finalize is not None:
+                self.__tensor = finalize(self.__tensor)
+        if self.__expression is not None:
+            expression = self.__expression
+            self.__tensor = expressions.evaluate(expression)
+            self.__expression = None
+            # downstream expressions may reuse the result instead of recomputing it
+            expression.value = self.__tensor
+        return self.__tensor
+
+    @__array.setter
+    def __array(self, array):
+        # a pending collective operation writes into the current tensor and has to be completed nevertheless
+        if self.__request is not None:
+            self.__request[0].Wait()
+            self.__request = None
+        self.__tensor = array
+        self.__expression = None
+
     @property
     def halo_next(self):
         return self.__halo_next
@@ -220,6 +296,8 @@ class DNDarray:
         local_shape : tuple
             the shape of the data on each node
         """
+        if self.__expression is not None:
+            return self.__expression.shape
         return tuple(self.__array.shape)
 
     @property
@@ -277,6 +355,12 @@ class DNDarray:
 
     @property
     def array_with_halos(self):
+        """
+        The process-local data together with the halos fetched by get_halo(). The halos are received directly into a
+        padded tensor holding the local data, which is returned without copying.
+        """
+        if self.__halos is not None and self.__halos[0] is self.__array:
+            return self.__halos[1]
         return self.__cat_halo()
 
     def __prephalo(self, start, end):
@@ -309,53 +393,120 @@ class DNDarray:
         in case they are not already stored. If 'halo_size' differs from the size of already stored halos,
         the are overwritten.
 
+        The halos are exchanged with persistent requests, which are set up on the first call and restarted by every
+        following call with the same halo sizes. The local data is moved into the interior of a padded tensor once, the
+        halos are received into its borders, see array_with_halos.
+
         Parameters
         ----------
-        halo_size : int
-            Size of the halo.
-        """
-        if not isinstance(halo_size, int):
+        halo_size : int or tuple of two ints
+            Size of the halo. A tuple (prev, next) sets the sizes of the halos received from the previous and from the
+            next rank separately.
+
+        Examples
+        --------
+        >>> a = ht.arange(12, split=0)
+        >>> a.get_halo((1, 2))
+        >>> a.array_with_halos
+        [0/2] tensor([0, 1, 2, 3, 4, 5])
+        [1/2] tensor([3, 4, 5, 6, 7, 8, 9, 10])
+        [2/2] tensor([7, 8, 9, 10, 11])
+        """
+        halo_sizes = halo_size if isinstance(halo_size, tuple) else (halo_size, halo_size)
+        if len(halo_sizes) != 2 or not all(isinstance(size, int) for size in halo_sizes):
             raise TypeError(
                 "halo_size needs to be of Python type integer, {} given)".format(type(halo_size))
             )
-        if halo_size < 0:
+        if min(halo_sizes) < 0:
             raise ValueError(
                 "halo_size needs to be a positive Python integer, {} given)".format(type(halo_size))
             )
 
         if self.comm.is_distributed() and self.split is not None:
-            min_chunksize = self.shape[self.split] // self.comm.size
-            if halo_size > min_chunksize:
+            min_chunksize = self.create_lshape_map()[:, self.split].min().item()
+            if max(halo_sizes) > min_chunksize:
                 raise ValueError(
                     "halo_size {} needs to smaller than chunck-size {} )".format(
                         halo_size, min_chunksize
                     )
                 )
 
-            a_prev = self.__prephalo(0, halo_size)
-            a_next = self.__prephalo(-halo_size, None)
-
-            res_prev = None
-            res_next = None
+            # the persistent requests are bound to the memory of the local data, they are set up again if it is replaced
+            if (
+                self.__halos is None
+                or self.__halos[0] is not self.__array
+                or self.__halos[2] != halo_sizes
+            ):
+                self.__free_halos()
+                self.__halos = self.__init_halos(*halo_sizes)
+            interior, padded, _, requests = self.__halos
+
+            for request in requests:
+                request.Start()
+            for request in requests:
+                request.Wait()
+
+            prev = halo_sizes[0] if self.comm.rank > 0 else 0
+            next = halo_sizes[1] if self.comm.rank < self.comm.size - 1 else 0
+            self.__halo_prev = padded.narrow(self.split, 0, prev) if prev > 0 else None
+            end = padded.shape[self.split]
+            self.__halo_next = padded.narrow(self.split, end - next, next) if next > 0 else None
+            self.__ishalo = True
 
-            req_list = list()
+    def __init_halos(self, prev, next):
+        """
+        Moves the local data into the interior of a padded tensor and sets up the persistent requests exchanging
+        the borders of the interior with the neighboring ranks.
 
-            if self.comm.rank != self.comm.size - 1:
-                self.comm.Isend(a_next, self.comm.rank + 1)
-                res_prev = torch.zeros(a_prev.size(), dtype=a_prev.dtype)
-                req_list.append(self.comm.Irecv(res_prev, source=self.comm.rank + 1))
+        Parameters
+        ----------
+        prev : int
+            Size of the halo received from the previous rank
+        next : int
+            Size of the halo received from the next rank
 
-            if self.comm.rank != 0:
-                self.comm.Isend(a_prev, self.comm.rank - 1)
-                res_next = torch.zeros(a_next.size(), dtype=a_next.dtype)
-                req_list.append(self.comm.Irecv(res_next, source=self.comm.rank - 1))
+        Returns
+        -------
+        halos : tuple
+            The interior, the padded tensor, the halo sizes and the persistent requests
+        """
+        rank, split = self.comm.rank, self.split
+        has_prev, has_next = rank > 0, rank < self.comm.size - 1
+
+        local = self.__array
+        shape = list(local.shape)
+        shape[split] += prev * has_prev + next * has_next
+        padded = torch.empty(shape, dtype=local.dtype, device=local.device)
+        interior = padded.narrow(split, prev * has_prev, local.shape[split])
+        interior.copy_(local)
+        self.__array = interior
+
+        requests = []
+        if has_prev and prev > 0:
+            requests.append(self.comm.Recv_init(padded.narrow(split, 0, prev), rank - 1))
+        if has_prev and next > 0:
+            requests.append(self.comm.Send_init(interior.narrow(split, 0, next), rank - 1))
+        if has_next and next > 0:
+            requests.append(
+                self.comm.Recv_init(padded.narrow(split, shape[split] - next, next), rank + 1)
+            )
+        if has_next and prev > 0:
+            requests.append(
+                self.comm.Send_init(
+                    interior.narrow(split, interior.shape[split] - prev, prev), rank + 1
+                )
+            )
 
-            for req in req_list:
-                req.wait()
+        return interior, padded, (prev, next), requests
 
-            self.__halo_next = res_prev
-            self.__halo_prev = res_next
-            self.__ishalo = True
+    def __free_halos(self):
+        """
+        Releases the persistent requests of the halo exchange.
+        """
+        if self.__halos is not None:
+            for request in self.__halos[3]:
+                request.Free()
+            self.__halos = None
 
     def __cat_halo(self):
         """
@@ -371,6 +522,8 @@ class DNDarray:
         -------
         array + halos: pytorch tensors
         """
+        if self.__halo_prev is None and self.__halo_next is None:
+            return self.__array
         return torch.cat(
             [_ for _ in (self.__halo_prev, self.__array, self.__halo_next) if _ is not None],
             self.split,
@@ -790,11 +943,23 @@ class DNDarray:
         """
         return statistics.average(self, axis=axis, weights=weights, returned=returned)
 
-    def balance_(self):
+    def balance_(self, tolerance=0.0):
         """
         Function for balancing a DNDarray between all nodes. To determine if this is needed use the is_balanced function.
         If the DNDarray is already balanced this function will do nothing. This function modifies the DNDarray itself and will not return anything.
 
+        Parameters
+        ----------
+        tolerance : float, optional
+            The tolerated imbalance, i.e. the relative excess of the largest process-local chunk over the mean chunk
+            size along the split axis. The data is only moved if the imbalance exceeds it. Default is 0.0, i.e. the
+            DNDarray is balanced exactly unless it is already.
+
+        Raises
+        ------
+        ValueError
+            If the tolerance is negative.
+
         Examples
         --------
         >>> a = ht.zeros((10, 2), split=0)
@@ -824,9 +989,22 @@ class DNDarray:
         [0/2] (7, 2) (3, 2)
         [1/2] (7, 2) (2, 2)
         [2/2] (7, 2) (2, 2)
-        """
+        >>> c = ht.zeros((100, 2), split=0)[5:]
+        >>> c.balance_(tolerance=0.2)
+        >>> print(c.lshape)
+        [0/2] (29, 2)
+        [1/2] (33, 2)
+        [2/2] (33, 2)
+        """
+        if tolerance < 0:
+            raise ValueError("tolerance must not be negative, but was {}".format(tolerance))
         if self.is_balanced():
             return
+        if tolerance > 0:
+            # the lshape map is identical on all processes, so is the decision
+            largest = self.create_lshape_map()[:, self.split].max().item()
+            if largest <= (1.0 + tolerance) * self.gshape[self.split] / self.comm.size:
+                return
         self.redistribute_()
 
     def __bool__(self):
@@ -1007,22 +1185,40 @@ class DNDarray:
         self.__device = devices.cpu
         return self
 
-    def create_lshape_map(self):
+    def create_lshape_map(self, force_check=False):
         """
         Generate a 'map' of the lshapes of the data on all processes.
         Units -> (process rank, lshape)
 
+        Parameters
+        ----------
+        force_check : bool, optional
+            If False (default) and the map has already been created for the current distribution of the data, the
+            cached map is used. Otherwise, the map is created anew with a collective operation.
+
         Returns
         -------
         lshape_map : torch.Tensor
             Units -> (process rank, lshape)
         """
-        lshape_map = torch.zeros(
-            (self.comm.size, len(self.gshape)), dtype=torch.int, device=self.device.torch_device
-        )
-        lshape_map[self.comm.rank, :] = torch.tensor(self.lshape, device=self.device.torch_device)
-        self.comm.Allreduce(MPI.IN_PLACE, lshape_map, MPI.SUM)
-        return lshape_map
+        lshape_map = self.__partition.lookup(self.__partition_key(), "lshape_map")
+        if lshape_map is None or force_check:
+            lshape_map = torch.zeros(
+                (self.comm.size, len(self.gshape)), dtype=torch.int, device=self.device.torch_device
+            )
+            lshape_map[self.comm.rank, :] = torch.tensor(
+                self.lshape, device=self.device.torch_device
+            )
+            self.comm.Allreduce(MPI.IN_PLACE, lshape_map, MPI.SUM)
+            self.__partition.store(self.__partition_key(), lshape_map)
+
+        return lshape_map.clone()
+
+    def __partition_key(self):
+        """
+        The key the partition metadata of this DNDarray is valid for.
+        """
+        return tuple(self.gshape), self.split, self.device, self.comm
 
     def __eq__(self, other):
         """
@@ -1637,6 +1833,200 @@ class DNDarray:
         """
         return relational.gt(self, other)
 
+    def __iadd__(self, other):
+        """
+        In-place element-wise addition of another tensor or a scalar to the tensor.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.float32([[1, 2], [3, 4]])
+        >>> T1 += 2.0
+        >>> T1
+        tensor([[3., 4.],
+                [5., 6.]])
+        """
+        return self.__inplace_op(arithmetics.add, other)
+
+    def __iand__(self, other):
+        """
+        In-place bit-wise AND of the tensor and another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.array([14, 3])
+        >>> T1 &= 13
+        >>> T1
+        tensor([12,  1])
+        """
+        return self.__inplace_op(arithmetics.bitwise_and, other)
+
+    def __ifloordiv__(self, other):
+        """
+        In-place element-wise floor division of the tensor by another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.float32([[1.7, 2.0], [1.9, 4.2]])
+        >>> T1 //= 1
+        >>> T1
+        tensor([[1., 2.],
+                [1., 4.]])
+        """
+        return self.__inplace_op(arithmetics.floordiv, other)
+
+    def __ilshift__(self, other):
+        """
+        In-place left shift of the bits of the integer tensor.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.array([1, 2, 4])
+        >>> T1 <<= 1
+        >>> T1
+        tensor([2, 4, 8])
+        """
+        return self.__inplace_op(arithmetics.left_shift, other)
+
+    def __imod__(self, other):
+        """
+        In-place element-wise division remainder of the tensor by another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.int32([[1, 2], [3, 4]])
+        >>> T1 %= 2
+        >>> T1
+        tensor([[1, 0],
+                [1, 0]], dtype=torch.int32)
+        """
+        return self.__inplace_op(arithmetics.mod, other)
+
+    def __imul__(self, other):
+        """
+        In-place element-wise multiplication of the tensor with another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.float32([[1, 2], [3, 4]])
+        >>> T1 *= 3.0
+        >>> T1
+        tensor([[ 3.,  6.],
+                [ 9., 12.]])
+        """
+        return self.__inplace_op(arithmetics.mul, other)
+
+    def __inplace_op(self, operation, other):
+        """
+        Generic implementation of the in-place element-wise binary operations, e.g. +=. The result
+        is written into the process-local tensor of self if the operation preserves the shape and
+        split of self and the result type can be cast to the data type of self within the same type
+        family. Otherwise, the operation is performed out-of-place and the augmented assignment
+        rebinds the name to a new tensor, just like the binary operation. Inside of a lazy()
+        context, in-place operations are evaluated immediately like all operations with an out
+        buffer, hence all references to self observe the modification just like outside of it.
+
+        Parameters
+        ----------
+        operation : function
+            The element-wise binary operation accepting an output buffer, e.g. ht.add
+        other : ht.DNDarray or scalar
+            The second operand
+
+        Returns
+        -------
+        result : ht.DNDarray
+            Either self or a new tensor containing the results.
+        """
+        if isinstance(other, DNDarray):
+            try:
+                in_place = (
+                    stride_tricks.broadcast_shape(self.gshape, other.gshape) == self.gshape
+                    and other.split in (None, self.split)
+                    and types.can_cast(
+                        types.promote_types(self.dtype, other.dtype), self.dtype, "same_kind"
+                    )
+                )
+            except ValueError:
+                in_place = False
+        elif np.isscalar(other):
+            try:
+                promoted = types.promote_types(self.dtype, types.heat_type_of(other))
+                in_place = types.can_cast(promoted, self.dtype, "same_kind")
+            except TypeError:
+                in_place = False
+        else:
+            in_place = False
+
+        if in_place:
+            return operation(self, other, out=self)
+        return operation(self, other)
+
     def __int__(self):
         """
         Integer scalar casting.
@@ -1659,21 +2049,183 @@ class DNDarray:
         """
         return arithmetics.invert(self)
 
-    def is_balanced(self):
+    def __ior__(self, other):
+        """
+        In-place bit-wise OR of the tensor and another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.array([14, 3])
+        >>> T1 |= 13
+        >>> T1
+        tensor([15, 15])
+        """
+        return self.__inplace_op(arithmetics.bitwise_or, other)
+
+    def __ipow__(self, other):
+        """
+        In-place element-wise exponentiation of the tensor by another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.float32([[1, 2], [3, 4]])
+        >>> T1 **= 2.0
+        >>> T1
+        tensor([[ 1.,  4.],
+                [ 9., 16.]])
+        """
+        return self.__inplace_op(arithmetics.pow, other)
+
+    def __irshift__(self, other):
+        """
+        In-place right shift of the bits of the integer tensor.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.array([2, 4, 8])
+        >>> T1 >>= 1
+        >>> T1
+        tensor([1, 2, 4])
+        """
+        return self.__inplace_op(arithmetics.right_shift, other)
+
+    def __isub__(self, other):
+        """
+        In-place element-wise subtraction of another tensor or a scalar from the tensor.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.float32([[1, 2], [3, 4]])
+        >>> T1 -= 2.0
+        >>> T1
+        tensor([[-1.,  0.],
+                [ 1.,  2.]])
+        """
+        return self.__inplace_op(arithmetics.sub, other)
+
+    def __itruediv__(self, other):
+        """
+        In-place element-wise true division of the tensor by another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand by whose values is divided
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.float32([[1, 2], [3, 4]])
+        >>> T1 /= 2.0
+        >>> T1
+        tensor([[0.5000, 1.0000],
+                [1.5000, 2.0000]])
+        """
+        # true division of integers yields floating point numbers, which do not fit into the tensor
+        if not types.heat_type_is_inexact(self.dtype):
+            return arithmetics.div(self, other)
+
+        return self.__inplace_op(arithmetics.div, other)
+
+    def __ixor__(self, other):
+        """
+        In-place bit-wise XOR of the tensor and another tensor or a scalar.
+
+        Parameters
+        ----------
+        other: tensor or scalar
+            The second operand
+
+        Returns
+        -------
+        result: ht.DNDarray
+            The tensor itself or a new tensor containing the results.
+
+        Examples:
+        ---------
+        >>> import heat as ht
+        >>> T1 = ht.array([14, 3])
+        >>> T1 ^= 13
+        >>> T1
+        tensor([ 3, 14])
+        """
+        return self.__inplace_op(arithmetics.bitwise_xor, other)
+
+    def is_balanced(self, force_check=False):
         """
         Determine if a DNDarray is balanced evenly (or as evenly as possible) across all nodes
 
+        Parameters
+        ----------
+        force_check : bool, optional
+            If False (default), the cached result or lshape map is used if available. Otherwise, the local shapes are
+            collected anew.
+
         Returns
         -------
         balanced : bool
             True if balanced, False if not
         """
-        _, _, chk = self.comm.chunk(self.shape, self.split)
-        test_lshape = tuple([x.stop - x.start for x in chk])
-        balanced = 1 if test_lshape == self.lshape else 0
+        balanced = self.__partition.lookup(self.__partition_key(), "balanced")
+        if balanced is None or force_check:
+            lshape_map = self.create_lshape_map(force_check=force_check)
+            if self.split is None:
+                balanced = lshape_map.tolist() == [list(self.gshape)] * self.comm.size
+            else:
+                counts, _, _ = self.comm.counts_displs_shape(self.gshape, self.split)
+                balanced = lshape_map[:, self.split].tolist() == list(counts)
+            self.__partition.balanced = balanced
 
-        out = self.comm.allreduce(balanced, MPI.SUM)
-        return True if out == self.comm.size else False
+        return balanced
 
     def is_distributed(self):
         """
@@ -2430,6 +2982,9 @@ class DNDarray:
         This function does not modify the non-split dimensions of the DNDarray.
         This is an abstraction and extension of the balance function.
 
+        The data is moved in a single Alltoallv, every process only sends the parts of its chunk overlapping the
+        target chunks of the other processes. Nothing is moved if the array already matches the target map.
+
         Parameters
         ----------
         lshape_map : torch.Tensor, optional
@@ -2471,7 +3026,6 @@ class DNDarray:
         """
         if not self.is_distributed():
             return
-        snd_dtype = self.dtype.torch_type()
         # units -> {pr, 1st index, 2nd index}
         if lshape_map is None:
             # NOTE: giving an lshape map which is incorrect will result in an incorrect distribution
@@ -2489,16 +3043,10 @@ class DNDarray:
                 )
 
         if target_map is None:  # if no target map is given then it will balance the tensor
-            target_map = torch.zeros(
-                (self.comm.size, len(self.gshape)), dtype=int, device=self.device.torch_device
-            )
-            _, _, chk = self.comm.chunk(self.shape, self.split)
             target_map = lshape_map.clone()
-            target_map[..., self.split] = 0
-            for pr in range(self.comm.size):
-                target_map[pr, self.split] = self.comm.chunk(self.shape, self.split, rank=pr)[1][
-                    self.split
-                ]
+            target_map[..., self.split] = torch.tensor(
+                self.comm.counts_displs_shape(self.shape, self.split)[0]
+            )
         else:
             if not isinstance(target_map, torch.Tensor):
                 raise TypeError(
@@ -2516,121 +3064,65 @@ class DNDarray:
                     )
                 )
 
-        lshape_cumsum = torch.cumsum(lshape_map[..., self.split], dim=0)
-        chunk_cumsum = torch.cat(
-            (
-                torch.tensor([0], device=self.device.torch_device),
-                torch.cumsum(target_map[..., self.split], dim=0),
-            ),
-            dim=0,
-        )
-        # need the data start as well for process 0
-        for rcv_pr in range(self.comm.size - 1):
-            st = chunk_cumsum[rcv_pr].item()
-            sp = chunk_cumsum[rcv_pr + 1].item()
-            # start pr should be the next process with data
-            if lshape_map[rcv_pr, self.split] >= target_map[rcv_pr, self.split]:
-                # if there is more data on the process than the start process than start == stop
-                st_pr = rcv_pr
-                sp_pr = rcv_pr
-            else:
-                # if there is less data on the process than need to get the data from the next data
-                # with data
-                # need processes > rcv_pr with lshape > 0
-                st_pr = (
-                    torch.nonzero(input=lshape_map[rcv_pr:, self.split] > 0, as_tuple=False)[
-                        0
-                    ].item()
-                    + rcv_pr
-                )
-                hld = (
-                    torch.nonzero(input=sp <= lshape_cumsum[rcv_pr:], as_tuple=False).flatten()
-                    + rcv_pr
-                )
-                sp_pr = hld[0].item() if hld.numel() > 0 else self.comm.size
+        counts = lshape_map[..., self.split].tolist()
+        target = target_map[..., self.split].tolist()
+        if counts != target:
+            self.__array = self.__redistribute_exchange(counts, target)
 
-            # st_pr and sp_pr are the processes on which the data sits at the beginning
-            # need to loop from st_pr to sp_pr + 1 and send the pr
-            for snd_pr in range(st_pr, sp_pr + 1):
-                if snd_pr == self.comm.size:
-                    break
-                data_required = abs(sp - st - lshape_map[rcv_pr, self.split].item())
-                send_amt = (
-                    data_required
-                    if data_required <= lshape_map[snd_pr, self.split]
-                    else lshape_map[snd_pr, self.split]
-                )
-                if (sp - st) <= lshape_map[rcv_pr, self.split].item() or snd_pr == rcv_pr:
-                    send_amt = 0
-                # send amount is the data still needed by recv if that is available on the snd
-                if send_amt != 0:
-                    self.__redistribute_shuffle(
-                        snd_pr=snd_pr, send_amt=send_amt, rcv_pr=rcv_pr, snd_dtype=snd_dtype
-                    )
-                lshape_cumsum[snd_pr] -= send_amt
-                lshape_cumsum[rcv_pr] += send_amt
-                lshape_map[rcv_pr, self.split] += send_amt
-                lshape_map[snd_pr, self.split] -= send_amt
-            if lshape_map[rcv_pr, self.split] > target_map[rcv_pr, self.split]:
-                # if there is any data left on the process then send it to the next one
-                send_amt = lshape_map[rcv_pr, self.split] - target_map[rcv_pr, self.split]
-                self.__redistribute_shuffle(
-                    snd_pr=rcv_pr, send_amt=send_amt.item(), rcv_pr=rcv_pr + 1, snd_dtype=snd_dtype
-                )
-                lshape_cumsum[rcv_pr] -= send_amt
-                lshape_cumsum[rcv_pr + 1] += send_amt
-                lshape_map[rcv_pr, self.split] -= send_amt
-                lshape_map[rcv_pr + 1, self.split] += send_amt
+        # the target is known on all processes, the map of the new distribution does not require communication
+        gshape = torch.tensor(self.gshape, dtype=torch.int, device=self.device.torch_device)
+        lshape_map = gshape.repeat(self.comm.size, 1)
+        lshape_map[:, self.split] = target_map[..., self.split]
+        self.__partition.store(self.__partition_key(), lshape_map)
 
-        if any(lshape_map[..., self.split] != target_map[..., self.split]):
-            # sometimes need to call the redistribute once more,
-            # (in the case that the second to last processes needs to get data from +1 and -1)
-            self.redistribute_(lshape_map=lshape_map, target_map=target_map)
-
-    def __redistribute_shuffle(self, snd_pr, send_amt, rcv_pr, snd_dtype):
+    def __redistribute_exchange(self, counts, target):
         """
-        Function to abstract the function used during redistribute for shuffling data between
-        processes along the split axis
+        Moves the data along the split axis from the current to the target distribution with a single Alltoallv. The
+        intervals of the split axis every process sends to and receives from every other process are the overlaps of
+        the current and the target chunks, the received blocks are written directly into the new local tensor.
 
         Parameters
         ----------
-        snd_pr : int, single element torch.Tensor
-            Sending process
-        send_amt : int, single element torch.Tensor
-            Amount of data to be sent by the sending process
-        rcv_pr : int, single element torch.Tensor
-            Recieving process
-        snd_dtype : torch.type
-            Torch type of the data in question
+        counts : list of ints
+            The current extents of the chunks of all processes along the split axis
+        target : list of ints
+            The target extents of the chunks of all processes along the split axis
 
         Returns
         -------
-        None
+        local : torch.Tensor
+            The new process-local tensor
         """
         rank = self.comm.rank
-        send_slice = [slice(None)] * self.ndim
-        keep_slice = [slice(None)] * self.ndim
-        if rank == snd_pr:
-            if snd_pr < rcv_pr:  # data passed to a higher rank (off the bottom)
-                send_slice[self.split] = slice(
-                    self.lshape[self.split] - send_amt, self.lshape[self.split]
-                )
-                keep_slice[self.split] = slice(0, self.lshape[self.split] - send_amt)
-            if snd_pr > rcv_pr:  # data passed to a lower rank (off the top)
-                send_slice[self.split] = slice(0, send_amt)
-                keep_slice[self.split] = slice(send_amt, self.lshape[self.split])
-            data = self.__array[send_slice].clone()
-            self.comm.Send(data, dest=rcv_pr, tag=685)
-            self.__array = self.__array[keep_slice]
-        if rank == rcv_pr:
-            shp = list(self.gshape)
-            shp[self.split] = send_amt
-            data = torch.zeros(shp, dtype=snd_dtype, device=self.device.torch_device)
-            self.comm.Recv(data, source=snd_pr, tag=685)
-            if snd_pr < rcv_pr:  # data passed from a lower rank (append to top)
-                self.__array = torch.cat((data, self.__array), dim=self.split)
-            if snd_pr > rcv_pr:  # data passed from a higher rank (append to bottom)
-                self.__array = torch.cat((self.__array, data), dim=self.split)
+        starts = np.cumsum([0] + counts[:-1]).tolist()
+        target_starts = np.cumsum([0] + target[:-1]).tolist()
+
+        def overlaps(start, count, others, other_counts):
+            # extents and offsets within [start, start + count) of the intersections with all other intervals
+            lengths, displs = [], []
+            for other, other_count in zip(others, other_counts):
+                first = max(start, other)
+                lengths.append(max(min(start + count, other + other_count) - first, 0))
+                displs.append(min(max(first - start, 0), count))
+            return lengths, displs
+
+        send = overlaps(starts[rank], counts[rank], target_starts, target)
+        recv = overlaps(target_starts[rank], target[rank], starts, counts)
+
+        local = self.__array
+        if local.ndim != self.ndim:
+            # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+            shape = list(self.gshape)
+            shape[self.split] = 0
+            local = local.reshape(shape)
+        shape = list(self.gshape)
+        shape[self.split] = target[rank]
+        redistributed = torch.empty(shape, dtype=local.dtype, device=local.device)
+        self.comm.Alltoallv(
+            (local, *send), (redistributed, *recv), send_axis=self.split, recv_axis=self.split
+        )
+
+        return redistributed
 
     def reshape(self, shape, axis=None):
         """
@@ -2704,21 +3196,46 @@ class DNDarray:
         (0/2) (4, 3)
         (1/2) (4, 2)
         """
+        self.resplit_async(axis).Wait()
+
+        return self
+
+    def resplit_async(self, axis=None):
+        """
+        Non-blocking in-place option for resplitting a DNDarray. The exchange of the data is started and a request
+        handle is returned immediately, the caller may continue computing and call ``wait()`` on the handle once the
+        result is needed. ``Test()`` progresses the exchange without blocking. Accessing the process-local data of the
+        DNDarray, e.g. its ``lshape``, before that completes the exchange implicitly.
+
+        Parameters
+        ----------
+        axis : int, None
+            The new split axis, None denotes gathering, an int will set the new split axis
+
+        Returns
+        -------
+        request : MPIRequest
+            The handle of the pending exchange. The split axis of the DNDarray is set to the new one right away.
+
+        Examples
+        --------
+        >>> a = ht.zeros((4, 5,), split=0)
+        >>> b = ht.ones((4, 5,), split=0)
+        >>> request = a.resplit_async(1)
+        >>> b = ht.exp(b)  # computation overlapping the exchange
+        >>> request.wait()
+        >>> a.lshape
+        (0/2) (4, 3)
+        (1/2) (4, 2)
+        """
         # sanitize the axis to check whether it is in range
         axis = sanitize_axis(self.shape, axis)
 
         # early out for unchanged content
         if axis == self.split:
-            return self
-        if axis is None:
-            gathered = torch.empty(
-                self.shape, dtype=self.dtype.torch_type(), device=self.device.torch_device
-            )
-            counts, displs, _ = self.comm.counts_displs_shape(self.shape, self.split)
-            self.comm.Allgatherv(self.__array, (gathered, counts, displs), recv_axis=self.split)
-            self.__array = gathered
-            self.__split = axis
-            return self
+            return MPIRequest(MPI.REQUEST_NULL)
+
+        request = None
         # tensor needs be split/sliced locally
         if self.split is None:
             # new_arr = self
@@ -2727,71 +3244,64 @@ class DNDarray:
             self.__array = torch.empty((1,), device=self.device.torch_device)
             # necessary to clear storage of local __array
             self.__array = temp.clone().detach()
-            self.__split = axis
-            return self
-
-        tiles = tiling.SplitTiles(self)
-        new_tile_locs = tiles.set_tile_locations(
-            split=axis, tile_dims=tiles.tile_dimensions, arr=self
-        )
-        rank = self.comm.rank
-        # receive the data with non-blocking, save which process its from
-        rcv = {}
-        for rpr in range(self.comm.size):
-            # need to get where the tiles are on the new one first
-            # rpr is the destination
-            new_locs = torch.where(new_tile_locs == rpr)
-            new_locs = torch.stack([new_locs[i] for i in range(self.ndim)], dim=1)
-            for i in range(new_locs.shape[0]):
-                key = tuple(new_locs[i].tolist())
-                spr = tiles.tile_locations[key].item()
-                to_send = tiles[key]
-                if spr == rank and spr != rpr:
-                    self.comm.Send(to_send.clone(), dest=rpr, tag=rank)
-                    del to_send
-                elif spr == rpr and rpr == rank:
-                    rcv[key] = [None, to_send]
-                elif rank == rpr:
-                    sz = tiles.get_tile_size(key)
-                    buf = torch.zeros(
-                        sz, dtype=self.dtype.torch_type(), device=self.device.torch_device
-                    )
-                    w = self.comm.Irecv(buf=buf, source=spr, tag=spr)
-                    rcv[key] = [w, buf]
-        dims = list(range(self.ndim))
-        del dims[axis]
-        sorted_keys = sorted(rcv.keys())
-        # todo: reduce the problem to 1D cats for each dimension, then work up
-        sz = self.comm.size
-        arrays = []
-        for prs in range(int(len(sorted_keys) / sz)):
-            lp_keys = sorted_keys[prs * sz : (prs + 1) * sz]
-            lp_arr = None
-            for k in lp_keys:
-                if rcv[k][0] is not None:
-                    rcv[k][0].wait()
-                if lp_arr is None:
-                    lp_arr = rcv[k][1]
-                else:
-                    lp_arr = torch.cat((lp_arr, rcv[k][1]), dim=dims[-1])
-                del rcv[k]
-            if lp_arr is not None:
-                arrays.append(lp_arr)
-        del dims[-1]
-        # for 4 prs and 4 dims, arrays is now 16 elements long,
-        # next need to group the each 4 (sz) and cat in the next dim
-        for d in reversed(dims):
-            new_arrays = []
-            for prs in range(int(len(arrays) / sz)):
-                new_arrays.append(torch.cat(arrays[prs * sz : (prs + 1) * sz], dim=d))
-            arrays = new_arrays
-            del d
-        if len(arrays) == 1:
-            arrays = arrays[0]
-
-        self.__array = arrays
+        else:
+            received, request = self.__resplit_exchange(axis, nonblocking=True)
+            # the request keeps the send buffer alive, the exchange is completed on first access to the data
+            self.__array = received
+            self.__request = (request, None)
         self.__split = axis
-        return self
+        # the data is moved on all processes, a map cached for the new split axis before is outdated
+        self.__partition.invalidate()
+
+        return request if request is not None else MPIRequest(MPI.REQUEST_NULL)
+
+    def __resplit_exchange(self, axis, nonblocking=False):
+        """
+        Gathers the chunks of the split axis for axis None, or otherwise receives the blocks of the new distribution
+        along axis directly in the new process-local tensor by derived MPI data types, i.e. in a single collective
+        operation without packing or concatenating them. Used by resplit_async() and manipulations.resplit().
+
+        Parameters
+        ----------
+        axis : int or None
+            The new split axis, it differs from the current split axis, which is not None
+        nonblocking : bool, optional
+            Whether the non-blocking collective operations are used
+
+        Returns
+        -------
+        received : torch.Tensor
+            The new process-local tensor, valid once the exchange is completed
+        request : MPIRequest or None
+            The handle of the pending exchange, None for a blocking one
+        """
+        counts = self.create_lshape_map()[:, self.split].tolist()
+        displs = tuple(np.cumsum([0] + counts[:-1]).tolist())
+        local = self.__array
+        if local.ndim != self.ndim:
+            # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+            shape = list(self.gshape)
+            shape[self.split] = 0
+            local = local.reshape(shape)
+
+        if axis is None:
+            received = torch.empty(self.gshape, dtype=local.dtype, device=local.device)
+            collective = self.comm.Iallgatherv if nonblocking else self.comm.Allgatherv
+            request = collective(local, (received, counts, displs), recv_axis=self.split)
+        else:
+            target, target_displs, _ = self.comm.counts_displs_shape(self.gshape, axis)
+            shape = list(self.gshape)
+            shape[axis] = target[self.comm.rank]
+            received = torch.empty(shape, dtype=local.dtype, device=local.device)
+            collective = self.comm.Ialltoallv if nonblocking else self.comm.Alltoallv
+            request = collective(
+                (local, target, target_displs),
+                (received, counts, displs),
+                send_axis=axis,
+                recv_axis=self.split,
+            )
+
+        return received, request if nonblocking else None
 
     def __rfloordiv__(self, other):
         """
@@ -3093,6 +3603,7 @@ class DNDarray:
         (2/2) >>> tensor([[0., 1., 0., 0., 0.],
                           [0., 1., 0., 0., 0.]])
         """
+        expressions.evaluate_dependents(self)
         if isinstance(key, DNDarray) and key.ndim == self.ndim:
             # this splits the key into torch.Tensors in each dimension for advanced indexing
             lkey = [slice(None, None, None)] * self.ndim
@@ -3686,7 +4197,7 @@ class DNDarray:
         """
         return rounding.trunc(self, out)
 
-    def unique(self, sorted=False, return_inverse=False, axis=None):
+    def unique(self, sorted=False, return_inverse=False, axis=None, return_counts=False):
         """
         Finds and returns the unique elements of the tensor.
 
@@ -3702,13 +4213,17 @@ class DNDarray:
         axis : int
             Axis along which unique elements should be found. Default to None, which will return a one dimensional list of
             unique values.
+        return_counts : bool
+            Whether to also return the number of occurrences of each unique element.
 
         Returns
         -------
         res : ht.DNDarray
             Output array. The unique elements. Elements are distributed the same way as the input tensor.
-        inverse_indices : torch.tensor (optional)
+        inverse_indices : torch.tensor or ht.DNDarray (optional)
             If return_inverse is True, this tensor will hold the list of inverse indices
+        counts : ht.DNDarray (optional)
+            If return_counts is True, this array will hold the number of occurrences of each unique element
 
         Examples
         --------
@@ -3724,7 +4239,7 @@ class DNDarray:
         array([[2, 3],
                [3, 1]])
         """
-        return manipulations.unique(self, sorted, return_inverse, axis)
+        return manipulations.unique(self, sorted, return_inverse, axis, return_counts)
 
     def var(self, axis=None, ddof=0, **kwargs):
         """
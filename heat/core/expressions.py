@@ -0,0 +1,568 @@
+"""
+Deferred evaluation of element-wise operations on DNDarrays.
+
+Inside of a ``lazy()`` context, element-wise operations do not compute their result immediately. Instead they record
+an expression graph which is attached to the returned DNDarray. The graph is evaluated as soon as the process-local
+tensor of the array is required, e.g. by a reduction, ``item()``, I/O, printing or any communication.
+"""
+
+import contextlib
+import torch
+import weakref
+
+from . import dndarray
+from . import stride_tricks
+from . import types
+
+__all__ = ["is_lazy", "lazy"]
+
+# flags indicating whether element-wise operations are currently deferred and whether they may be fused
+__lazy_mode = False
+__fusion_mode = False
+# weak references to the DNDarrays deferred within the currently open lazy() contexts
+__pending = []
+
+# number of evaluations after which a recurring fusion group is compiled into a TorchScript kernel
+__FUSION_THRESHOLD = 2
+# evaluation counts and compiled kernels of the fusion groups, keyed by operations, input types and dimensionalities
+__fusion_counts = {}
+__fused_kernels = {}
+
+# torch operations that are known to accept an out buffer, these may be evaluated in-place into a dead temporary
+__OUT_CAPABLE = frozenset(
+    getattr(torch, name)
+    for name in (
+        "abs",
+        "acos",
+        "add",
+        "asin",
+        "atan",
+        "atan2",
+        "bitwise_and",
+        "bitwise_or",
+        "bitwise_xor",
+        "ceil",
+        "cos",
+        "cosh",
+        "div",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "fmod",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "mul",
+        "neg",
+        "pow",
+        "remainder",
+        "sin",
+        "sinh",
+        "sqrt",
+        "sub",
+        "tan",
+        "tanh",
+        "true_divide",
+        "trunc",
+    )
+    if hasattr(torch, name)
+)
+
+# torch operations that may be fused into a single TorchScript kernel, mapped to their name in the torch namespace
+__SCRIPTABLE = {
+    getattr(torch, name): name
+    for name in (
+        "abs",
+        "acos",
+        "add",
+        "asin",
+        "atan",
+        "atan2",
+        "bitwise_and",
+        "bitwise_not",
+        "bitwise_or",
+        "bitwise_xor",
+        "ceil",
+        "cos",
+        "cosh",
+        "eq",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "fmod",
+        "ge",
+        "gt",
+        "le",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logical_not",
+        "logical_xor",
+        "lt",
+        "mul",
+        "ne",
+        "neg",
+        "pow",
+        "remainder",
+        "sin",
+        "sinh",
+        "sqrt",
+        "sub",
+        "tan",
+        "tanh",
+        "true_divide",
+        "trunc",
+    )
+    if hasattr(torch, name)
+}
+
+
+class Expression:
+    """
+    Node of a deferred expression graph. Represents the process-local result of a single element-wise operation.
+
+    Parameters
+    ----------
+    operation : function
+        The element-wise torch operation, e.g. torch.add
+    operands : tuple of torch.Tensor or Expression
+        The process-local operands of the operation, either materialized tensors or other pending expressions
+    torch_type : torch.dtype
+        The type the operands are cast to before the operation is applied
+    shape : tuple of ints
+        The process-local shape of the result
+    dtype : torch.dtype
+        The type of the result
+    kwargs : dict
+        Additional keyword arguments passed to the operation
+    fuse : bool, optional
+        Whether the node may be fused with its neighbours into a single kernel
+    """
+
+    def __init__(self, operation, operands, torch_type, shape, dtype, kwargs, fuse=False):
+        self.operation = operation
+        self.operands = operands
+        self.torch_type = torch_type
+        self.shape = shape
+        self.dtype = dtype
+        self.kwargs = kwargs
+        self.fuse = fuse
+        # the materialized result, only set once the owning DNDarray has been evaluated
+        self.value = None
+
+
+def is_lazy():
+    """
+    Determines whether element-wise operations are currently deferred.
+
+    Returns
+    -------
+    lazy_mode : bool
+        True if called inside of a lazy() context, False otherwise
+    """
+    return __lazy_mode
+
+
+@contextlib.contextmanager
+def lazy(fuse=False):
+    """
+    Context manager enabling the deferred evaluation of element-wise operations. Within the context, arithmetic,
+    exponential, trigonometric, rounding, logical and relational operations build an expression graph instead of
+    allocating a fresh local tensor per operation. The graph is evaluated as a whole once the local data is needed, e.g.
+    in a reduction, ``item()``, I/O or communication, and at the latest when the context is left. During evaluation dead
+    temporaries are released immediately, chains of operations reuse the buffer of their predecessor and type
+    promotions of shared operands are performed only once.
+
+    Pending expressions reading an array are evaluated before the array is modified in-place within the context, e.g.
+    by item assignment or as out buffer, i.e. deferred results always reflect the operands at the time of the
+    operation.
+
+    Parameters
+    ----------
+    fuse : bool, optional
+        If True, chains of element-wise operations that are recurringly evaluated are scripted into a single
+        TorchScript kernel, which is cached and reused by subsequent evaluations of the same chain. Default: False
+
+    Examples
+    --------
+    >>> x = ht.random.randn(1000, 10, split=0)
+    >>> mu, var = ht.mean(x, axis=0), ht.var(x, axis=0)
+    >>> with ht.lazy():
+    ...     standardized = (x - mu) ** 2 / var
+    ...     total = standardized.sum(axis=0)
+    """
+    global __lazy_mode, __fusion_mode
+    previous = __lazy_mode, __fusion_mode
+    start = len(__pending)
+    __lazy_mode, __fusion_mode = True, fuse
+    try:
+        yield
+    finally:
+        __lazy_mode, __fusion_mode = previous
+        deferred = __pending[start:]
+        del __pending[start:]
+
+    # no expression may outlive the context, the operands could be modified in-place afterwards
+    for reference in deferred:
+        array = reference()
+        if array is not None:
+            __materialize(array)
+
+
+def evaluate_dependents(x):
+    """
+    Evaluates all pending expressions reading the process-local tensor of a DNDarray, including the pending expression
+    of the DNDarray itself. Has to be called before the tensor is modified in-place, the modification would otherwise
+    be visible in the deferred results.
+
+    Parameters
+    ----------
+    x : ht.DNDarray or torch.Tensor
+        The array or process-local tensor that is about to be modified
+    """
+    if not __pending:
+        return
+    tensor = x if isinstance(x, torch.Tensor) else __materialize(x)
+    storage = tensor.storage().data_ptr()
+    for reference in __pending:
+        array = reference()
+        if array is None or array._DNDarray__expression is None:
+            continue
+        leaves = __leaves(array._DNDarray__expression)
+        if any(leaf.storage().data_ptr() == storage for leaf in leaves):
+            __materialize(array)
+
+
+def __leaves(expression):
+    """
+    Generates the materialized tensors a pending expression graph reads.
+    """
+    visited = set()
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        for operand in node.operands:
+            if not isinstance(operand, Expression):
+                yield operand
+            elif operand.value is not None:
+                yield operand.value
+            else:
+                stack.append(operand)
+
+
+def __materialize(array):
+    """
+    Evaluates the pending expression of a DNDarray, if any, and returns its process-local tensor.
+    """
+    return array._DNDarray__array
+
+
+def defer(operation, operands, torch_type, gshape, split, device, comm, **kwargs):
+    """
+    Records an element-wise operation in the expression graph instead of executing it.
+
+    Parameters
+    ----------
+    operation : function
+        The element-wise torch operation, e.g. torch.add
+    operands : tuple of ht.DNDarray or torch.Tensor
+        The operands of the operation, their local tensors or pending expressions are used as graph inputs
+    torch_type : torch.dtype
+        The type the operands are cast to before the operation is applied
+    gshape : tuple of ints
+        The global shape of the result
+    split : int or None
+        The split axis of the result
+    device : ht.Device
+        The device of the result
+    comm : Communication
+        The communication of the result
+    kwargs : dict
+        Additional keyword arguments passed to the operation
+
+    Returns
+    -------
+    deferred : ht.DNDarray or None
+        A DNDarray carrying the pending expression, None if the operation cannot be deferred, e.g. because it does not
+        return a tensor
+    """
+    inputs = []
+    for operand in operands:
+        if isinstance(operand, torch.Tensor):
+            inputs.append(operand)
+            continue
+        expression = operand._DNDarray__expression
+        if expression is not None and expression.value is None:
+            inputs.append(expression)
+        else:
+            inputs.append(operand._DNDarray__array)
+
+    try:
+        shape = inputs[0].shape
+        for operand in inputs[1:]:
+            shape = stride_tricks.broadcast_shape(tuple(shape), tuple(operand.shape))
+        # determine the type of the result without doing any actual work
+        probe = operation(
+            *(torch.empty((0,), dtype=torch_type, device=device.torch_device) for _ in inputs),
+            **kwargs
+        )
+    except (RuntimeError, TypeError, ValueError):
+        return None
+    if not isinstance(probe, torch.Tensor):
+        return None
+
+    result = dndarray.DNDarray(
+        None, gshape, types.canonical_heat_type(probe.dtype), split, device, comm
+    )
+    result._DNDarray__expression = Expression(
+        operation, tuple(inputs), torch_type, tuple(shape), probe.dtype, kwargs, __fusion_mode
+    )
+    __pending.append(weakref.ref(result))
+
+    return result
+
+
+def evaluate(expression):
+    """
+    Evaluates a pending expression graph and returns the process-local result.
+
+    Parameters
+    ----------
+    expression : Expression
+        The root of the expression graph
+
+    Returns
+    -------
+    result : torch.Tensor
+        The process-local result of the expression
+    """
+    # determine a topological order of all pending nodes and count the number of consumers of each node
+    order = []
+    consumers = {}
+    visited = set()
+    stack = [(expression, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack.append((node, True))
+        for operand in node.operands:
+            if isinstance(operand, Expression) and operand.value is None:
+                consumers[id(operand)] = consumers.get(id(operand), 0) + 1
+                stack.append((operand, False))
+
+    groups = __fusion_groups(order, consumers)
+    fused = set(id(member) for group in groups.values() for member in group[:-1])
+
+    # casted versions of materialized inputs, shared between all nodes, i.e. type promotions are hoisted
+    casts = {}
+    # results of the intermediate nodes that still have pending consumers
+    values = {}
+
+    def fetch(operand, torch_type):
+        """
+        Retrieves the value of an operand cast to the given type and whether it is a dead temporary afterwards.
+        """
+        if isinstance(operand, Expression) and operand.value is None:
+            tensor = values[id(operand)]
+            consumers[id(operand)] -= 1
+            if consumers[id(operand)] > 0:
+                return tensor.type(torch_type), False
+            # the temporary is dead after this operation, release it as early as possible
+            del values[id(operand)]
+            return tensor.type(torch_type), True
+
+        tensor = operand.value if isinstance(operand, Expression) else operand
+        key = (id(tensor), torch_type)
+        if key not in casts:
+            casts[key] = tensor.type(torch_type)
+        return casts[key], False
+
+    for node in order:
+        if id(node) in fused:
+            continue
+        if id(node) in groups:
+            values[id(node)] = __run_fused(groups[id(node)], fetch)
+            continue
+
+        operands = []
+        buffer = None
+        for operand in node.operands:
+            tensor, owned = fetch(operand, node.torch_type)
+            # a dead temporary of matching layout may be overwritten with the result of this node
+            if (
+                owned
+                and buffer is None
+                and tensor.dtype == node.dtype
+                and tuple(tensor.shape) == node.shape
+            ):
+                buffer = tensor
+            operands.append(tensor)
+        values[id(node)] = __apply(node.operation, operands, buffer, node.kwargs)
+
+    return values[id(expression)]
+
+
+def __apply(operation, operands, buffer, kwargs):
+    """
+    Applies an operation, writing the result into the given buffer if the operation supports it.
+    """
+    if buffer is not None and operation in __OUT_CAPABLE:
+        return operation(*operands, out=buffer, **kwargs)
+    return operation(*operands, **kwargs)
+
+
+def __fusion_groups(order, consumers):
+    """
+    Partitions the pending nodes of an expression graph into groups that may be fused into a single kernel. A group
+    consists of a root and all transitive operands that are consumed exclusively within the group.
+
+    Parameters
+    ----------
+    order : list of Expression
+        The pending nodes in topological order
+    consumers : dict
+        The number of consumers of each node, keyed by the node's id
+
+    Returns
+    -------
+    groups : dict
+        The groups with at least two members keyed by the id of their root, members are in topological order
+    """
+    position = {id(node): index for index, node in enumerate(order)}
+    groups = {}
+    assigned = set()
+
+    for root in reversed(order):
+        if id(root) in assigned or not __is_fusable(root):
+            continue
+        group = []
+        stack = [root]
+        while stack:
+            member = stack.pop()
+            group.append(member)
+            assigned.add(id(member))
+            for operand in member.operands:
+                if (
+                    isinstance(operand, Expression)
+                    and operand.value is None
+                    and consumers[id(operand)] == 1
+                    and operand.dtype == member.torch_type
+                    and __is_fusable(operand)
+                ):
+                    stack.append(operand)
+        if len(group) > 1:
+            groups[id(root)] = sorted(group, key=lambda member: position[id(member)])
+
+    return groups
+
+
+def __is_fusable(node):
+    """
+    Determines whether a node may become part of a fused kernel.
+    """
+    return node.fuse and not node.kwargs and node.operation in __SCRIPTABLE
+
+
+def __run_fused(group, fetch):
+    """
+    Evaluates a fusion group. Recurring groups are compiled into a single TorchScript kernel, which is cached and keyed
+    by the operation sequence as well as the types and dimensionalities of the inputs. Groups seen for the first time
+    are evaluated operation by operation.
+
+    Parameters
+    ----------
+    group : list of Expression
+        The members of the group in topological order, the last one is the root
+    fetch : function
+        Retrieves the value of an external operand cast to the given type
+
+    Returns
+    -------
+    result : torch.Tensor
+        The process-local result of the group's root
+    """
+    inputs = []
+    names = {}
+    program = []
+    for index, member in enumerate(group):
+        arguments = []
+        for operand in member.operands:
+            if id(operand) in names:
+                arguments.append(names[id(operand)])
+            else:
+                arguments.append("a{}".format(len(inputs)))
+                inputs.append(fetch(operand, member.torch_type)[0])
+        names[id(member)] = "v{}".format(index)
+        program.append((member, arguments))
+
+    key = (
+        tuple((__SCRIPTABLE[member.operation], tuple(arguments)) for member, arguments in program),
+        tuple((tensor.dtype, tensor.dim()) for tensor in inputs),
+    )
+    if key not in __fused_kernels:
+        __fusion_counts[key] = __fusion_counts.get(key, 0) + 1
+        if __fusion_counts[key] >= __FUSION_THRESHOLD:
+            __fused_kernels[key] = __compile(program, len(inputs))
+    kernel = __fused_kernels.get(key)
+    if kernel is not None:
+        return kernel(*inputs)
+
+    # interpret the program, every intermediate has exactly one consumer and its buffer may be reused
+    results = {}
+    for member, arguments in program:
+        operands = []
+        buffer = None
+        for argument in arguments:
+            if argument.startswith("a"):
+                operands.append(inputs[int(argument[1:])])
+                continue
+            tensor = results.pop(argument)
+            if buffer is None and tensor.dtype == member.dtype and tuple(tensor.shape) == member.shape:
+                buffer = tensor
+            operands.append(tensor)
+        results[names[id(member)]] = __apply(member.operation, operands, buffer, member.kwargs)
+
+    return results[names[id(group[-1])]]
+
+
+def __compile(program, inputs):
+    """
+    Scripts a fusion group program into a single TorchScript function.
+
+    Parameters
+    ----------
+    program : list of tuples
+        The group members and the names of their arguments in topological order
+    inputs : int
+        The number of external inputs
+
+    Returns
+    -------
+    kernel : torch.jit.ScriptFunction or None
+        The scripted function, None if the program cannot be scripted
+    """
+    lines = ["def fused({}):".format(", ".join("a{}".format(i) for i in range(inputs)))]
+    for index, (member, arguments) in enumerate(program):
+        lines.append(
+            "    v{} = torch.{}({})".format(
+                index, __SCRIPTABLE[member.operation], ", ".join(arguments)
+            )
+        )
+    lines.append("    return v{}".format(len(program) - 1))
+
+    try:
+        return torch.jit.CompilationUnit("\n".join(lines)).fused
+    except RuntimeError:
+        return None
@@ -7,12 +7,13 @@ from .. import exponential
 from .. import dndarray
 from .. import factories
 from .. import manipulations
+from .. import operations
 from .. import types
 
 __all__ = ["dot", "matmul", "norm", "outer", "projection", "transpose", "tril", "triu"]
 
 
-def dot(a, b, out=None):
+def dot(a, b, out=None, async_op=False):
     """
     Dot product of two arrays. Specifically,
 
@@ -24,6 +25,10 @@ def dot(a, b, out=None):
     ----------
     a : ht.DNDarray
     b : ht.DNDarray
+    async_op : bool, optional
+        Only applies to 1-D arrays. If True, the global reduction of the inner product is performed with a non-blocking
+        collective operation and a pending DNDarray of shape () is returned instead of a scalar. The reduction is
+        completed on the first access to the data of the result, e.g. by item(). Default: False
 
     Returns
     -------
@@ -44,6 +49,15 @@ def dot(a, b, out=None):
         else:  # at least one of them is split
             sl = a.comm.chunk(a.shape, a.split if a.split is not None else b.split)[2]
         ret = torch.dot(a[sl]._DNDarray__array, b[sl]._DNDarray__array)
+        if async_op:
+            result = dndarray.DNDarray(
+                ret, (), types.canonical_heat_type(ret.dtype), None, a.device, a.comm
+            )
+            # the pending reduction is completed on first access to the data of the result
+            if a.is_distributed() or b.is_distributed():
+                request = a.comm.Iallreduce(MPI.IN_PLACE, ret, MPI.SUM)
+                result._DNDarray__request = (request, None)
+            return result
         if a.is_distributed() or b.is_distributed():
             a.comm.Allreduce(MPI.IN_PLACE, ret, MPI.SUM)
 
@@ -803,13 +817,17 @@ def __mm_c_block_setter(
                     c[c_start0 : c_start0 + mB, c_start1 : c_start1 + nB] += a_block @ b_block
 
 
-def norm(a):
+def norm(a, async_op=False):
     """
     Frobenius norm of vector a
 
     Parameters
     ----------
     a : ht.DNDarray
+    async_op : bool, optional
+        If True, the global reduction is performed with a non-blocking collective operation and a pending DNDarray of
+        shape () is returned instead of a float. The reduction is completed on the first access to the data of the
+        result, e.g. by item(). Default: False
 
     Returns
     -------
@@ -819,6 +837,22 @@ def norm(a):
     if not isinstance(a, dndarray.DNDarray):
         raise TypeError("a must be of type ht.DNDarray, but was {}".format(type(a)))
 
+    if async_op:
+        torch_type = a.dtype.torch_type() if types.heat_type_is_inexact(a.dtype) else torch.float32
+
+        def local_square_sum(t, *args, **kwargs):
+            t = t.type(torch_type)
+            return torch.sum(t * t, *args, **kwargs)
+
+        def local_norm(t):
+            return torch.sqrt(t).reshape(())
+
+        result = operations.__reduce_op(
+            a, local_square_sum, MPI.SUM, neutral=0, async_op=True, finalize=local_norm
+        )
+        result._DNDarray__gshape = ()
+        return result
+
     d = a ** 2
 
     for i in range(len(a.shape) - 1, -1, -1):
@@ -133,29 +133,19 @@ def lanczos(A, m, v0=None, V_out=None, T_out=None):
             # print("Lanczos breakdown in iteration {}".format(i))
             # Lanczos Breakdown, pick a random vector to continue
             vr = ht.random.rand(n, dtype=A.dtype, split=V.split)
-            # orthogonalize v_r with respect to all vectors v[i]
-            for j in range(i):
-                vi_loc = V._DNDarray__array[:, j]
-                a = torch.dot(vr._DNDarray__array, vi_loc)
-                b = torch.dot(vi_loc, vi_loc)
-                A.comm.Allreduce(ht.communication.MPI.IN_PLACE, a, ht.communication.MPI.SUM)
-                A.comm.Allreduce(ht.communication.MPI.IN_PLACE, b, ht.communication.MPI.SUM)
-                vr._DNDarray__array = vr._DNDarray__array - a / b * vi_loc
+            # orthogonalize v_r with respect to all vectors v[i], twice for numerical stability
+            for _ in range(2):
+                vr._DNDarray__array = vr._DNDarray__array - __projection(V, vr, i)
             # normalize v_r to Euclidian norm 1 and set as ith vector v
             vi = vr / ht.norm(vr)
         else:
             vr = w
 
-            # Reorthogonalization
+            # Reorthogonalization, classical Gram-Schmidt is applied twice for numerical stability
             # ToDo: Rethink this; mask torch calls, See issue #494
             # This is the fast solution, using item access on the ht.dndarray level is way slower
-            for j in range(i):
-                vi_loc = V._DNDarray__array[:, j]
-                a = torch.dot(vr._DNDarray__array, vi_loc)
-                b = torch.dot(vi_loc, vi_loc)
-                A.comm.Allreduce(ht.communication.MPI.IN_PLACE, a, ht.communication.MPI.SUM)
-                A.comm.Allreduce(ht.communication.MPI.IN_PLACE, b, ht.communication.MPI.SUM)
-                vr._DNDarray__array -= a / b * vi_loc
+            for _ in range(2):
+                vr._DNDarray__array -= __projection(V, vr, i)
 
             vi = vr / ht.norm(vr)
 
@@ -182,3 +172,25 @@ def lanczos(A, m, v0=None, V_out=None, T_out=None):
         return V_out, T
 
     return V, T
+
+
+def __projection(V, vr, i):
+    """
+    Process-local chunk of the projection of vr onto the span of the first i columns of V (classical Gram-Schmidt). All
+    inner products are computed with the same vr, their global reductions are coalesced into a single collective
+    operation.
+    """
+    V_loc = V._DNDarray__array[:, :i]
+    a = torch.mv(V_loc.t(), vr._DNDarray__array)
+    b = (V_loc * V_loc).sum(dim=0)
+
+    if V.split is not None:
+        with V.comm.coalesce():
+            requests = [
+                V.comm.Iallreduce(ht.communication.MPI.IN_PLACE, a, ht.communication.MPI.SUM),
+                V.comm.Iallreduce(ht.communication.MPI.IN_PLACE, b, ht.communication.MPI.SUM),
+            ]
+        for request in requests:
+            request.Wait()
+
+    return torch.mv(V_loc, a / b)
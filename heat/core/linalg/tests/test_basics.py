@@ -34,6 +34,11 @@ class TestLinalgBasics(TestCase):
         a1d = ht.array(data1d, dtype=ht.float32, split=0)
         b1d = ht.array(data1d, dtype=ht.float32, split=0)
         self.assertEqual(ht.dot(a1d, b1d), np.dot(data1d, data1d))
+        # non-blocking reduction of the inner product
+        ret = ht.dot(a1d, b1d, async_op=True)
+        self.assertIsInstance(ret, ht.DNDarray)
+        self.assertEqual(ret.shape, ())
+        self.assertEqual(ret.item(), np.dot(data1d, data1d))
         # 2 1D arrays,
 
         a2d = ht.array(data2d, split=1)
@@ -475,6 +480,12 @@ class TestLinalgBasics(TestCase):
             ht.allclose(ht.linalg.norm(b), ht.float32(np.linalg.norm(b.numpy())).item(), atol=1e-5)
         )
 
+        # non-blocking reduction
+        res = ht.linalg.norm(b, async_op=True)
+        self.assertIsInstance(res, ht.DNDarray)
+        self.assertEqual(res.shape, ())
+        self.assertAlmostEqual(res.item(), np.linalg.norm(b.numpy()), places=5)
+
         with self.assertRaises(TypeError):
             c = np.arange(9) - 4
             ht.linalg.norm(c)
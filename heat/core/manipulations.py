@@ -8,13 +8,14 @@ from . import constants
 from . import dndarray
 from . import factories
 from . import linalg
+from . import signal
 from . import stride_tricks
-from . import tiling
 from . import types
 from . import operations
 
 
 __all__ = [
+    "argsort",
     "concatenate",
     "diag",
     "diagonal",
@@ -24,8 +25,10 @@ __all__ = [
     "fliplr",
     "flipud",
     "hstack",
+    "pad",
     "reshape",
     "resplit",
+    "roll",
     "rot90",
     "shape",
     "sort",
@@ -35,6 +38,17 @@ __all__ = [
     "vstack",
 ]
 
+# number of samples drawn by every process per process for the pivots of the parallel sample sort
+__SORT_OVERSAMPLING = 4
+
+# padding modes of pad and the corresponding boundaries of the signal module
+__PAD_MODES = {
+    "constant": "constant",
+    "edge": "replicate",
+    "reflect": "reflect",
+    "wrap": "circular",
+}
+
 
 def concatenate(arrays, axis=0):
     """
@@ -817,6 +831,144 @@ def hstack(tup):
     return concatenate(tup, axis=axis)
 
 
+def pad(array, pad_width, mode="constant", constant_values=0):
+    """
+    Pads an array along its axes. Along the split axis, only the first and the last process build the padding, which
+    is then moved on to their neighbors as far as required to balance the padded array.
+
+    Parameters
+    ----------
+    array : ht.DNDarray
+        The array to pad
+    pad_width : int or sequence of ints or sequence of pairs of ints
+        The number of elements padded before and after each axis, ((before_0, after_0), ..., (before_n, after_n)).
+        A single pair (before, after) or a single int pads all axes alike.
+    mode : str, optional
+        "constant" pads constant_values, "edge" repeats the edge elements, "reflect" mirrors the array at its edge
+        elements without repeating them and "wrap" continues the axes periodically with the elements of the other end.
+        Default: "constant"
+    constant_values : scalar, optional
+        The value padded in "constant" mode
+        Default: 0
+
+    Returns
+    -------
+    padded : ht.DNDarray
+        The padded array of the same split axis as array, balanced along it
+
+    Raises
+    ------
+    TypeError
+        If array is not a DNDarray.
+    ValueError
+        If pad_width does not hold non-negative ints for every axis or mode is unknown. If an empty axis is padded
+        with elements of the array or a reflected padding is not smaller than its axis.
+
+    Examples
+    --------
+    >>> x = ht.arange(5, split=0)
+    >>> ht.pad(x, 2)
+    tensor([0, 0, 0, 1, 2, 3, 4, 0, 0])
+    >>> ht.pad(x, (1, 2), mode="reflect")
+    tensor([1, 0, 1, 2, 3, 4, 3, 2])
+    >>> ht.pad(x, (1, 2), mode="wrap")
+    tensor([4, 0, 1, 2, 3, 4, 0, 1])
+    >>> ht.pad(ht.array([[1, 2], [3, 4]], split=1), ((1, 0), (0, 1)), mode="edge")
+    tensor([[1, 2, 2],
+            [1, 2, 2],
+            [3, 4, 4]])
+    """
+    if not isinstance(array, dndarray.DNDarray):
+        raise TypeError("expected array to be a ht.DNDarray, but was {}".format(type(array)))
+    if mode not in __PAD_MODES:
+        raise ValueError("mode must be one of {}, but was {}".format(", ".join(__PAD_MODES), mode))
+    widths = np.asarray(pad_width)
+    if widths.dtype.kind not in "iu" or (widths < 0).any():
+        raise ValueError("pad_width must be non-negative ints, but was {}".format(pad_width))
+    try:
+        widths = np.broadcast_to(widths, (array.ndim, 2)).tolist()
+    except ValueError:
+        raise ValueError(
+            "pad_width {} does not match an array of {} dimensions".format(pad_width, array.ndim)
+        )
+    boundary = __PAD_MODES[mode]
+    for axis, (before, after) in enumerate(widths):
+        if mode != "constant" and before + after > 0 and array.gshape[axis] == 0:
+            raise ValueError("cannot pad the empty axis {} in {} mode".format(axis, mode))
+        if mode == "reflect" and max(before, after) >= array.gshape[axis]:
+            raise ValueError(
+                "reflect padding of {} elements requires more elements along axis {}".format(
+                    max(before, after), axis
+                )
+            )
+
+    x = array
+    if x.is_distributed() and sum(widths[x.split]) > 0:
+        # the first and the last chunk have to provide the elements of the padding
+        before, after = widths[x.split]
+        required = {
+            "constant": (0, 0),
+            "edge": (min(before, 1), min(after, 1)),
+            "reflect": (before and before + 1, after and after + 1),
+            "wrap": (after, before),
+        }[mode]
+        if not signal.__chunks_suffice(x, (0, 0), required):
+            x = x.copy()
+            x.balance_()
+        if not signal.__chunks_suffice(x, (0, 0), required):
+            x = resplit(x, None)
+
+    local = x._DNDarray__array
+    if local.ndim != x.ndim:
+        # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+        shape = list(x.gshape)
+        shape[x.split] = 0
+        local = local.reshape(shape)
+    gshape = tuple(extent + before + after for extent, (before, after) in zip(x.gshape, widths))
+
+    if x.is_distributed():
+        rank, last = x.comm.rank, x.comm.size - 1
+        before, after = widths[x.split]
+        local_boundary = "constant" if mode == "wrap" else boundary
+        blocks = [
+            signal.__boundary(
+                local, x.split, before if rank == 0 else 0, local_boundary, constant_values, True
+            ),
+            local,
+            signal.__boundary(
+                local, x.split, after if rank == last else 0, local_boundary, constant_values, False
+            ),
+        ]
+        if mode == "wrap":
+            blocks = signal.__wrap(x, local, x.split, before, after, blocks)
+        local = torch.cat(blocks, dim=x.split)
+
+        counts = x.create_lshape_map()[:, x.split].tolist()
+        counts[0] += before
+        counts[-1] += after
+        placements = [[(0, start, count)] for start, count in zip(__displacements(counts), counts)]
+        target = x.comm.counts_displs_shape(gshape, x.split)[0]
+        local = __move_slabs(x.comm, local, x.split, placements, target)
+
+    for axis, (before, after) in enumerate(widths):
+        if before + after == 0 or (axis == x.split and x.is_distributed()):
+            continue
+        local = torch.cat(
+            (
+                signal.__boundary(local, axis, before, boundary, constant_values, True),
+                local,
+                signal.__boundary(local, axis, after, boundary, constant_values, False),
+            ),
+            dim=axis,
+        )
+
+    padded = dndarray.DNDarray(local, gshape, x.dtype, x.split, x.device, x.comm)
+    if padded.split != array.split:
+        padded.resplit_(array.split)
+
+    return padded
+
+
 def reshape(a, shape, axis=None):
     """
     Returns a tensor with the same data and number of elements as a, but with the specified shape.
@@ -1059,14 +1211,18 @@ def shape(a):
     return a.gshape
 
 
-def sort(a, axis=None, descending=False, out=None):
+def sort(a, axis=None, descending=False, out=None, stable=False, balance=True):
     """
     Sorts the elements of the DNDarray a along the given dimension (by default in ascending order) by their value.
 
-    The sorting is not stable which means that equal elements in the result may have a different ordering than in the
-    original array.
+    By default, the sorting is not stable which means that equal elements in the result may have a different ordering
+    than in the original array.
 
-    Sorting where `axis == a.split` needs a lot of communication between the processes of MPI.
+    Sorting along the split axis is done with a parallel sample sort. The pivots splitting the data between the
+    processes are determined from a regular, oversampled sample of the locally sorted data. Ties are broken by the
+    position of the elements, hence duplicate values are spread over the processes as well. The values and indices are
+    exchanged together in a single Alltoallv and, if balance is set, in a second one restoring the balanced
+    distribution of the input.
 
     Parameters
     ----------
@@ -1081,6 +1237,13 @@ def sort(a, axis=None, descending=False, out=None):
     out : ht.DNDarray or None, optional
         A location in which to store the results. If provided, it must have a broadcastable shape. If not provided
         or set to None, a fresh tensor is allocated.
+    stable : bool, optional
+        If set to true, equal elements keep their relative order of the original array.
+        Default is false
+    balance : bool, optional
+        If set to false, a one-dimensional result sorted along the split axis keeps the distribution determined by
+        the sample sort, saving the final redistribution. Multi-dimensional results are always balanced.
+        Default is true
 
     Returns
     -------
@@ -1114,220 +1277,276 @@ def sort(a, axis=None, descending=False, out=None):
     if axis is None:
         axis = len(a.shape) - 1
 
-    stride_tricks.sanitize_axis(a.shape, axis)
+    final_result, final_indices = __sort(a, axis, descending, stable, balance)
+    gshape = tuple(a.gshape)
+
+    return_indices = dndarray.DNDarray(
+        final_indices.type(torch.int32), gshape, types.int32, a.split, a.device, a.comm
+    )
+    if out is not None:
+        out._DNDarray__array = final_result
+        return return_indices
+    else:
+        tensor = dndarray.DNDarray(final_result, gshape, a.dtype, a.split, a.device, a.comm)
+        return tensor, return_indices
+
+
+def argsort(a, axis=-1, descending=False, stable=False):
+    """
+    Returns the indices that would sort the DNDarray a along the given dimension. The indices are global, i.e. they
+    refer to positions in the whole array along the axis, and are distributed like a. See sort() for the algorithm.
+
+    Parameters
+    ----------
+    a : ht.DNDarray
+        Input array to be sorted.
+    axis : int, optional
+        The dimension to sort along.
+        Default is the last axis.
+    descending : bool, optional
+        If set to true, the indices sort the values in descending order
+        Default is false
+    stable : bool, optional
+        If set to true, the indices of equal elements are in ascending order.
+        Default is false
+
+    Returns
+    -------
+    indices : ht.DNDarray of ints
+        The indices sorting a along the given axis.
+
+    Raises
+    ------
+    ValueError
+        If the axis is not in range of the axes.
+
+    Examples
+    --------
+    >>> x = ht.array([3, 1, 2, 1], split=0)
+    >>> ht.argsort(x, stable=True)
+    tensor([1, 3, 2, 0])
+    >>> ht.argsort(x, descending=True, stable=True)
+    tensor([0, 2, 1, 3])
+    """
+    _, indices = __sort(a, axis, descending, stable, balance=True)
+
+    return dndarray.DNDarray(indices, tuple(a.gshape), types.int64, a.split, a.device, a.comm)
+
+
+def __sort(a, axis, descending, stable, balance):
+    """
+    Sorts the process-local data of a along an axis, returns the sorted values and the global indices of the sorted
+    values as torch tensors.
+    """
+    axis = stride_tricks.sanitize_axis(a.shape, axis)
 
-    if a.split is None or axis != a.split:
+    if a.split is None or axis != a.split or not a.comm.is_distributed() or a.gnumel == 0:
         # sorting is not affected by split -> we can just sort along the axis
-        final_result, final_indices = torch.sort(
-            a._DNDarray__array, dim=axis, descending=descending
-        )
+        local = a._DNDarray__array.transpose(0, axis)
+        indices = __argsort_local(local, descending, stable)
+        values = local.gather(0, indices)
+        if axis == a.split:
+            indices = indices + a.comm.chunk(a.gshape, a.split)[0]
+        return values.transpose(0, axis).contiguous(), indices.transpose(0, axis).contiguous()
+
+    return __sample_sort(a, axis, descending, stable, balance)
+
+
+def __argsort_local(t, descending, stable):
+    """
+    Permutation sorting a tensor along its first dimension. The stable permutation sorts the unique composite keys of
+    the ranks of the runs of equal values and the original positions.
+    """
+    values, perm = torch.sort(t, dim=0, descending=descending)
+    if not stable or t.shape[0] < 2:
+        return perm
+
+    runs = torch.zeros_like(perm)
+    nans = torch.isnan(values)
+    changes = (values[1:] != values[:-1]) & ~(nans[1:] & nans[:-1])
+    runs[1:] = torch.cumsum(changes.long(), dim=0)
 
+    return perm.gather(0, torch.argsort(runs * t.shape[0] + perm, dim=0))
+
+
+def __sample_sort(a, axis, descending, stable, balance):
+    """
+    Parallel sample sort of a along its split axis. The sorting axis is moved to the front and all other dimensions are
+    flattened into independently sorted fibers. Within each fiber, the elements are totally ordered by their value and a
+    unique key increasing with the local sorted order, i.e. the global index for stable sorting or the global position
+    in the locally sorted data otherwise.
+    """
+    comm = a.comm
+    size, rank = comm.size, comm.rank
+
+    local = a._DNDarray__array.transpose(0, axis)
+    trailing = tuple(local.shape[1:])
+    length, fibers = local.shape[0], int(np.prod(trailing))
+    local = local.reshape(length, fibers)
+    device = local.device
+
+    counts = a.create_lshape_map()[:, axis].tolist()
+    offset = sum(counts[:rank])
+    total = a.gshape[axis]
+    # values and indices are packed into rows of a common type that represents both exactly
+    packed_type = torch.float64 if local.is_floating_point() else torch.int64
+
+    perm = __argsort_local(local, descending, stable)
+    values = local.gather(0, perm)
+    if stable:
+        keys = perm + offset
     else:
-        # sorting is affected by split, processes need to communicate results
-        # transpose so we can work along the 0 axis
-        transposed = a._DNDarray__array.transpose(axis, 0)
-        local_sorted, local_indices = torch.sort(transposed, dim=0, descending=descending)
+        keys = torch.arange(offset, offset + length, device=device).unsqueeze(1).expand_as(perm)
+
+    # regular sampling of the sorted data, every sample of a process represents the same number of elements
+    samples = [min(count, __SORT_OVERSAMPLING * size) for count in counts]
+    positions = (2 * torch.arange(samples[rank], device=device) + 1) * length
+    positions = positions // (2 * max(samples[rank], 1))
+    local_samples = torch.stack(
+        [values[positions].to(packed_type), keys[positions].to(packed_type)], dim=-1
+    )
+    gathered = torch.empty((sum(samples), fibers, 2), dtype=packed_type, device=device)
+    comm.Allgatherv(local_samples, (gathered, samples, __displacements(samples)))
+    weights = [count / max(sample, 1) for count, sample in zip(counts, samples)]
+    weights = torch.repeat_interleave(
+        torch.tensor(weights, dtype=torch.float64, device=device),
+        torch.tensor(samples, device=device),
+    )
 
-        size = a.comm.Get_size()
-        rank = a.comm.Get_rank()
-        counts, disp, _ = a.comm.counts_displs_shape(a.gshape, axis=axis)
+    # the pivots split the lexicographically sorted, weighted samples into parts of equal weight
+    sample_values = gathered[..., 0].to(local.dtype)
+    sample_keys = gathered[..., 1].long()
+    order = torch.argsort(sample_keys, dim=0)
+    order = order.gather(
+        0, __argsort_local(sample_values.gather(0, order), descending, stable=True)
+    )
+    cumulative = torch.cumsum(weights[order], dim=0)
+    quantiles = torch.arange(1, size, dtype=cumulative.dtype, device=device).unsqueeze(1)
+    quantiles = quantiles * total / size
+    pivots = __search_sorted(
+        order.shape[0], lambda i: cumulative.gather(0, i) <= quantiles, (size - 1, fibers), device
+    )
+    pivots = order.gather(0, pivots.clamp(max=order.shape[0] - 1))
+    pivot_values = sample_values.gather(0, pivots)
+    pivot_keys = sample_keys.gather(0, pivots)
+
+    # number of local elements of each fiber preceding the pivots, NaN is the largest value like in the local sorts
+    pivot_nans = torch.isnan(pivot_values)
+
+    def precedes(i):
+        value = values.gather(0, i)
+        nans = torch.isnan(value)
+        if descending:
+            before = (value > pivot_values) | (nans & ~pivot_nans)
+        else:
+            before = (value < pivot_values) | (~nans & pivot_nans)
+        equal = (value == pivot_values) | (nans & pivot_nans)
+        return before | (equal & (keys.gather(0, i) < pivot_keys))
 
-        actual_indices = local_indices.to(dtype=local_sorted.dtype) + disp[rank]
+    bounds = __search_sorted(length, precedes, (size - 1, fibers), device)
+    bounds = torch.cat(
+        [torch.zeros_like(bounds[:1]), bounds, torch.full_like(bounds[:1], length)], dim=0
+    )
+    send_lengths = bounds[1:] - bounds[:-1]
+
+    # exchange the packed values and global indices of all fibers at once
+    rows = torch.stack([values.to(packed_type), (perm + offset).to(packed_type)], dim=-1)
+    rows = __transpose_segments(rows.transpose(0, 1).reshape(-1, 2), send_lengths.t())
+    recv_lengths = torch.empty_like(send_lengths)
+    comm.Alltoall(send_lengths, recv_lengths)
+    rows = __exchange_rows(comm, rows, send_lengths.sum(dim=1), recv_lengths.sum(dim=1))
+
+    # merge the received runs of every fiber, runs of lower ranks hold the lower keys
+    rows = __transpose_segments(rows, recv_lengths)
+    lengths = recv_lengths.sum(dim=0)
+    order = __argsort_local(rows[:, 0], descending, stable)
+    fiber_ids = torch.repeat_interleave(torch.arange(fibers, device=device), lengths)
+    order = order[__argsort_local(fiber_ids[order], False, stable=True)]
+    rows = rows[order]
+
+    if balance or fibers != 1:
+        # redistribute the sorted fibers to the balanced chunks of the input
+        all_lengths = torch.empty((size, fibers), dtype=lengths.dtype, device=device)
+        comm.Allgather(lengths.unsqueeze(0), all_lengths)
+        starts = torch.cumsum(all_lengths, dim=0) - all_lengths
+        _, displs, _ = comm.counts_displs_shape(a.gshape, axis)
+        targets = [int(displ) for displ in displs] + [total]
+
+        bounds = torch.tensor(targets, device=device).unsqueeze(1) - starts[rank]
+        bounds = torch.min(bounds.clamp(min=0), lengths.unsqueeze(0).expand_as(bounds))
+        send_lengths = bounds[1:] - bounds[:-1]
+        recv_lengths = (starts + all_lengths).clamp(max=targets[rank + 1])
+        recv_lengths = (recv_lengths - starts.clamp(min=targets[rank])).clamp(min=0)
+
+        rows = __transpose_segments(rows, send_lengths.t())
+        rows = __exchange_rows(comm, rows, send_lengths.sum(dim=1), recv_lengths.sum(dim=1))
+        rows = __transpose_segments(rows, recv_lengths)
+
+    rows = rows.reshape(fibers, rows.shape[0] // fibers, 2).transpose(0, 1)
+    shape = (rows.shape[0],) + trailing
+    values = rows[..., 0].to(local.dtype).reshape(shape).transpose(0, axis).contiguous()
+    indices = rows[..., 1].long().reshape(shape).transpose(0, axis).contiguous()
+
+    return values, indices
+
+
+def __search_sorted(length, precedes, shape, device):
+    """
+    Vectorized binary search of a tensor of independent queries of the given shape. Returns the number of leading
+    positions of a sorted sequence of the given length for which precedes(positions) holds.
+    """
+    low = torch.zeros(shape, dtype=torch.int64, device=device)
+    high = torch.full(shape, length, dtype=torch.int64, device=device)
 
-        length = local_sorted.size()[0]
+    while (low < high).any():
+        active = low < high
+        middle = (low + high) // 2
+        hit = precedes(middle.clamp(max=max(length - 1, 0)))
+        low = torch.where(active & hit, middle + 1, low)
+        high = torch.where(active & ~hit, middle, high)
 
-        # Separate the sorted tensor into size + 1 equal length partitions
-        partitions = [x * length // (size + 1) for x in range(1, size + 1)]
-        local_pivots = (
-            local_sorted[partitions]
-            if counts[rank]
-            else torch.empty((0,) + local_sorted.size()[1:], dtype=local_sorted.dtype)
-        )
+    return low
 
-        # Only processes with elements should share their pivots
-        gather_counts = [int(x > 0) * size for x in counts]
-        gather_displs = (0,) + tuple(np.cumsum(gather_counts[:-1]))
 
-        pivot_dim = list(transposed.size())
-        pivot_dim[0] = size * sum([1 for x in counts if x > 0])
+def __transpose_segments(data, lengths):
+    """
+    Reorders the rows of data consisting of consecutive segments in row-major order of the segment lengths, i.e.
+    segment (i, j) has lengths[i, j] rows, into column-major order of the segments.
+    """
+    flat_lengths = lengths.reshape(-1)
+    starts = torch.cumsum(flat_lengths, dim=0) - flat_lengths
+    segments = torch.arange(flat_lengths.numel(), device=data.device).reshape(lengths.shape)
+    segments = segments.t().reshape(-1)
+    target_lengths = flat_lengths[segments]
+    target_starts = torch.cumsum(target_lengths, dim=0) - target_lengths
 
-        # share the local pivots with root process
-        pivot_buffer = torch.empty(
-            pivot_dim, dtype=a.dtype.torch_type(), device=a.device.torch_device
-        )
-        a.comm.Gatherv(local_pivots, (pivot_buffer, gather_counts, gather_displs), root=0)
+    index = torch.arange(data.shape[0], device=data.device)
+    index += (starts[segments] - target_starts).repeat_interleave(target_lengths)
 
-        pivot_dim[0] = size - 1
-        global_pivots = torch.empty(
-            pivot_dim, dtype=a.dtype.torch_type(), device=a.device.torch_device
-        )
+    return data[index]
 
-        # root process creates new pivots and shares them with other processes
-        if rank == 0:
-            sorted_pivots, _ = torch.sort(pivot_buffer, descending=descending, dim=0)
-            length = sorted_pivots.size()[0]
-            global_partitions = [x * length // size for x in range(1, size)]
-            global_pivots = sorted_pivots[global_partitions]
-
-        a.comm.Bcast(global_pivots, root=0)
-
-        lt_partitions = torch.empty((size,) + local_sorted.shape, dtype=torch.int64)
-        last = torch.zeros_like(local_sorted, dtype=torch.int64)
-        comp_op = torch.gt if descending else torch.lt
-        # Iterate over all pivots and store which pivot is the first greater than the elements value
-        for idx, p in enumerate(global_pivots):
-            lt = comp_op(local_sorted, p).int()
-            if idx > 0:
-                lt_partitions[idx] = lt - last
-            else:
-                lt_partitions[idx] = lt
-            last = lt
-        lt_partitions[size - 1] = torch.ones_like(local_sorted, dtype=last.dtype) - last
-
-        # Matrix holding information how many values will be sent where
-        local_partitions = torch.sum(lt_partitions, dim=1)
-
-        partition_matrix = torch.empty_like(local_partitions)
-        a.comm.Allreduce(local_partitions, partition_matrix, op=MPI.SUM)
-
-        # Matrix that holds information which value will be shipped where
-        index_matrix = torch.empty_like(local_sorted, dtype=torch.int64)
-
-        # Matrix holding information which process get how many values from where
-        shape = (size,) + transposed.size()[1:]
-        send_matrix = torch.zeros(shape, dtype=partition_matrix.dtype)
-        recv_matrix = torch.zeros(shape, dtype=partition_matrix.dtype)
-
-        for i, x in enumerate(lt_partitions):
-            index_matrix[x > 0] = i
-            send_matrix[i] += torch.sum(x, dim=0)
-
-        a.comm.Alltoall(send_matrix, recv_matrix)
-
-        scounts = local_partitions
-        rcounts = recv_matrix
-
-        shape = (partition_matrix[rank].max(),) + transposed.size()[1:]
-        first_result = torch.empty(shape, dtype=local_sorted.dtype)
-        first_indices = torch.empty_like(first_result)
-
-        # Iterate through one layer and send values with alltoallv
-        for idx in np.ndindex(local_sorted.shape[1:]):
-            idx_slice = [slice(None)] + [slice(ind, ind + 1) for ind in idx]
-
-            send_count = scounts[idx_slice].reshape(-1).tolist()
-            send_disp = [0] + list(np.cumsum(send_count[:-1]))
-            s_val = local_sorted[idx_slice].clone()
-            s_ind = actual_indices[idx_slice].clone().to(dtype=local_sorted.dtype)
-
-            recv_count = rcounts[idx_slice].reshape(-1).tolist()
-            recv_disp = [0] + list(np.cumsum(recv_count[:-1]))
-            rcv_length = rcounts[idx_slice].sum().item()
-            r_val = torch.empty((rcv_length,) + s_val.shape[1:], dtype=local_sorted.dtype)
-            r_ind = torch.empty_like(r_val)
-
-            a.comm.Alltoallv((s_val, send_count, send_disp), (r_val, recv_count, recv_disp))
-            a.comm.Alltoallv((s_ind, send_count, send_disp), (r_ind, recv_count, recv_disp))
-            first_result[idx_slice][:rcv_length] = r_val
-            first_indices[idx_slice][:rcv_length] = r_ind
-
-        # The process might not have the correct number of values therefore the tensors need to be rebalanced
-        send_vec = torch.zeros(local_sorted.shape[1:] + (size, size), dtype=torch.int64)
-        target_cumsum = np.cumsum(counts)
-        for idx in np.ndindex(local_sorted.shape[1:]):
-            idx_slice = [slice(None)] + [slice(ind, ind + 1) for ind in idx]
-            current_counts = partition_matrix[idx_slice].reshape(-1).tolist()
-            current_cumsum = list(np.cumsum(current_counts))
-            for proc in range(size):
-                if current_cumsum[proc] > target_cumsum[proc]:
-                    # process has to many values which will be sent to higher ranks
-                    first = next(i for i in range(size) if send_vec[idx][:, i].sum() < counts[i])
-                    last = next(
-                        i
-                        for i in range(size + 1)
-                        if i == size or current_cumsum[proc] < target_cumsum[i]
-                    )
-                    sent = 0
-                    for i, x in enumerate(counts[first:last]):
-                        # Each following process gets as many elements as it needs
-                        amount = int(x - send_vec[idx][:, first + i].sum())
-                        send_vec[idx][proc][first + i] = amount
-                        current_counts[first + i] += amount
-                        sent += amount
-                    if last < size:
-                        # Send all left over values to the highest last process
-                        amount = partition_matrix[proc][idx]
-                        send_vec[idx][proc][last] = int(amount - sent)
-                        current_counts[last] += int(amount - sent)
-                elif current_cumsum[proc] < target_cumsum[proc]:
-                    # process needs values from higher rank
-                    first = (
-                        0
-                        if proc == 0
-                        else next(
-                            i for i, x in enumerate(current_cumsum) if target_cumsum[proc - 1] < x
-                        )
-                    )
-                    last = next(i for i, x in enumerate(current_cumsum) if target_cumsum[proc] <= x)
-                    for i, x in enumerate(partition_matrix[idx_slice][first:last]):
-                        # Taking as many elements as possible from each following process
-                        send_vec[idx][first + i][proc] = int(x - send_vec[idx][first + i].sum())
-                        current_counts[first + i] = 0
-                    # Taking just enough elements from the last element to fill the current processes tensor
-                    send_vec[idx][last][proc] = int(target_cumsum[proc] - current_cumsum[last - 1])
-                    current_counts[last] -= int(target_cumsum[proc] - current_cumsum[last - 1])
-                else:
-                    # process doesn't need more values
-                    send_vec[idx][proc][proc] = (
-                        partition_matrix[proc][idx] - send_vec[idx][proc].sum()
-                    )
-                current_counts[proc] = counts[proc]
-                current_cumsum = list(np.cumsum(current_counts))
-
-        # Iterate through one layer again to create the final balanced local tensors
-        second_result = torch.empty_like(local_sorted)
-        second_indices = torch.empty_like(second_result)
-        for idx in np.ndindex(local_sorted.shape[1:]):
-            idx_slice = [slice(None)] + [slice(ind, ind + 1) for ind in idx]
-
-            send_count = send_vec[idx][rank]
-            send_disp = [0] + list(np.cumsum(send_count[:-1]))
-
-            recv_count = send_vec[idx][:, rank]
-            recv_disp = [0] + list(np.cumsum(recv_count[:-1]))
-
-            end = partition_matrix[rank][idx]
-            s_val, indices = first_result[0:end][idx_slice].sort(descending=descending, dim=0)
-            s_ind = first_indices[0:end][idx_slice][indices].reshape_as(s_val)
-
-            r_val = torch.empty((counts[rank],) + s_val.shape[1:], dtype=local_sorted.dtype)
-            r_ind = torch.empty_like(r_val)
-
-            a.comm.Alltoallv((s_val, send_count, send_disp), (r_val, recv_count, recv_disp))
-            a.comm.Alltoallv((s_ind, send_count, send_disp), (r_ind, recv_count, recv_disp))
-
-            second_result[idx_slice] = r_val
-            second_indices[idx_slice] = r_ind
-
-        second_result, tmp_indices = second_result.sort(dim=0, descending=descending)
-        final_result = second_result.transpose(0, axis)
-        final_indices = torch.empty_like(second_indices)
-        # Update the indices in case the ordering changed during the last sort
-        for idx in np.ndindex(tmp_indices.shape):
-            val = tmp_indices[idx]
-            final_indices[idx] = second_indices[val.item()][idx[1:]]
-        final_indices = final_indices.transpose(0, axis)
-    return_indices = factories.array(
-        final_indices, dtype=dndarray.types.int32, is_split=a.split, device=a.device, comm=a.comm
+
+def __exchange_rows(comm, rows, send_counts, recv_counts):
+    """
+    Sends consecutive blocks of rows to all processes and receives the blocks of all processes in one Alltoallv.
+    """
+    send_counts, recv_counts = send_counts.tolist(), recv_counts.tolist()
+    received = torch.empty(
+        (sum(recv_counts),) + tuple(rows.shape[1:]), dtype=rows.dtype, device=rows.device
     )
-    if out is not None:
-        out._DNDarray__array = final_result
-        return return_indices
-    else:
-        tensor = factories.array(
-            final_result, dtype=a.dtype, is_split=a.split, device=a.device, comm=a.comm
-        )
-        return tensor, return_indices
+    comm.Alltoallv(
+        (rows, send_counts, __displacements(send_counts)),
+        (received, recv_counts, __displacements(recv_counts)),
+    )
+
+    return received
+
+
+def __displacements(counts):
+    """
+    Exclusive prefix sum of the counts, i.e. the displacements of the respective chunks in a buffer.
+    """
+    return tuple(int(displ) for displ in np.cumsum([0] + list(counts[:-1])))
 
 
 def squeeze(x, axis=None):
@@ -1431,11 +1650,15 @@ def squeeze(x, axis=None):
     )
 
 
-def unique(a, sorted=False, return_inverse=False, axis=None):
+def unique(a, sorted=False, return_inverse=False, axis=None, return_counts=False):
     """
     Finds and returns the unique elements of an array.
 
-    Works most effective if axis != a.split.
+    Works most effective if axis != a.split. The unique elements of a split array are found without gathering them on
+    every process if axis is None. Every process owns a partition of the values, determined by a hash or, if sorted,
+    by a range of the values. The local unique elements are sent to their owners in a single Alltoallv and merged
+    there, such that the result and the inverse indices stay distributed. If axis is not the split axis, every
+    process holds a part of each slice along axis, the slices are identified by gathering the ids of their local parts.
 
     Parameters
     ----------
@@ -1452,13 +1675,20 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
     axis : int, optional
         Axis along which unique elements should be found. Default to None, which will return a one dimensional list of
         unique values.
+    return_counts : bool, optional
+        Whether to also return the number of occurrences of each unique element.
+        Default: False
 
     Returns
     -------
     res : ht.DNDarray
-        Output array. The unique elements. Elements are distributed the same way as the input tensor.
-    inverse_indices : torch.tensor (optional)
-        If return_inverse is True, this tensor will hold the list of inverse indices
+        Output array. The unique elements. Elements are distributed the same way as the input tensor. If axis is
+        None, the unique elements of a split array are balanced along their only axis.
+    inverse_indices : torch.tensor or ht.DNDarray (optional)
+        If return_inverse is True, this tensor will hold the list of inverse indices. It is a DNDarray distributed like
+        the input if axis is None.
+    counts : ht.DNDarray (optional)
+        If return_counts is True, this array will hold the number of occurrences of each unique element
 
     Examples
     --------
@@ -1476,42 +1706,53 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
     """
     if a.split is None:
         torch_output = torch.unique(
-            a._DNDarray__array, sorted=sorted, return_inverse=return_inverse, dim=axis
+            a._DNDarray__array,
+            sorted=sorted,
+            return_inverse=return_inverse,
+            return_counts=return_counts,
+            dim=axis,
         )
         if isinstance(torch_output, tuple):
-            heat_output = tuple(
+            heat_output = [
                 factories.array(i, dtype=a.dtype, split=None, device=a.device) for i in torch_output
-            )
+            ]
+            if return_counts:
+                heat_output[-1] = factories.array(
+                    torch_output[-1], dtype=types.int64, split=None, device=a.device
+                )
+            heat_output = tuple(heat_output)
         else:
             heat_output = factories.array(torch_output, dtype=a.dtype, split=None, device=a.device)
         return heat_output
 
-    local_data = a._DNDarray__array
-    unique_axis = None
-    inverse_indices = None
+    if axis is None:
+        return __unique_partitioned(a, sorted, return_inverse, return_counts)
+    if axis != a.split:
+        if sorted:
+            raise ValueError(
+                "Sorting with axis != split is not supported yet. "
+                "See https://github.com/helmholtz-analytics/heat/issues/363"
+            )
+        return __unique_slices(a, axis, return_inverse, return_counts)
 
-    if axis is not None:
-        # transpose so we can work along the 0 axis
-        local_data = local_data.transpose(0, axis)
-        unique_axis = 0
+    inverse_indices = None
+    # transpose so we can work along the 0 axis
+    local_data = a._DNDarray__array.transpose(0, axis)
+    unique_axis = 0
 
     # Calculate the unique on the local values
     if a.lshape[a.split] == 0:
         # Passing an empty vector to torch throws exception
-        if axis is None:
-            res_shape = [0]
-            inv_shape = list(a.gshape)
-            inv_shape[a.split] = 0
-        else:
-            res_shape = list(local_data.shape)
-            res_shape[0] = 0
-            inv_shape = [0]
+        res_shape = list(local_data.shape)
+        res_shape[0] = 0
+        inv_shape = [0]
         lres = torch.empty(res_shape, dtype=a.dtype.torch_type())
         inverse_pos = torch.empty(inv_shape, dtype=torch.int64)
+        lcounts = torch.empty(inv_shape, dtype=torch.int64)
 
     else:
-        lres, inverse_pos = torch.unique(
-            local_data, sorted=sorted, return_inverse=True, dim=unique_axis
+        lres, inverse_pos, lcounts = torch.unique(
+            local_data, sorted=sorted, return_inverse=True, return_counts=True, dim=unique_axis
         )
 
     # Share and gather the results with the other processes
@@ -1519,127 +1760,238 @@ def unique(a, sorted=False, return_inverse=False, axis=None):
     uniques_buf = torch.empty((a.comm.Get_size(),), dtype=torch.int32)
     a.comm.Allgather(uniques, uniques_buf)
 
-    if axis is None or axis == a.split:
-        is_split = None
-        split = a.split
+    # the unique slices along the split axis of all processes are gathered and merged
+    split = a.split
 
-        output_dim = list(lres.shape)
-        output_dim[0] = uniques_buf.sum().item()
-
-        # Gather all unique vectors
-        counts = list(uniques_buf.tolist())
-        displs = list([0] + uniques_buf.cumsum(0).tolist()[:-1])
-        gres_buf = torch.empty(output_dim, dtype=a.dtype.torch_type())
-        a.comm.Allgatherv(lres, (gres_buf, counts, displs), recv_axis=0)
-
-        if return_inverse:
-            # Prepare some information to generated the inverse indices list
-            avg_len = a.gshape[a.split] // a.comm.Get_size()
-            rem = a.gshape[a.split] % a.comm.Get_size()
-
-            # Share the local reverse indices with other processes
-            counts = [avg_len] * a.comm.Get_size()
-            add_vec = [1] * rem + [0] * (a.comm.Get_size() - rem)
-            inverse_counts = [sum(x) for x in zip(counts, add_vec)]
-            inverse_displs = [0] + list(np.cumsum(inverse_counts[:-1]))
-            inverse_dim = list(inverse_pos.shape)
-            inverse_dim[a.split] = a.gshape[a.split]
-            inverse_buf = torch.empty(inverse_dim, dtype=inverse_pos.dtype)
-
-            # Transpose data and buffer so we can use Allgatherv along axis=0 (axis=1 does not work properly yet)
-            inverse_pos = inverse_pos.transpose(0, a.split)
-            inverse_buf = inverse_buf.transpose(0, a.split)
-            a.comm.Allgatherv(
-                inverse_pos, (inverse_buf, inverse_counts, inverse_displs), recv_axis=0
-            )
-            inverse_buf = inverse_buf.transpose(0, a.split)
-
-        # Run unique a second time
-        gres = torch.unique(gres_buf, sorted=sorted, return_inverse=return_inverse, dim=unique_axis)
-        if return_inverse:
-            # Use the previously gathered information to generate global inverse_indices
-            g_inverse = gres[1]
-            gres = gres[0]
-            if axis is None:
-                # Calculate how many elements we have in each layer along the split axis
-                elements_per_layer = 1
-                for num, val in enumerate(a.gshape):
-                    if not num == a.split:
-                        elements_per_layer *= val
-
-                # Create the displacements for the flattened inverse indices array
-                local_elements = [displ * elements_per_layer for displ in inverse_displs][1:] + [
-                    float("inf")
-                ]
+    output_dim = list(lres.shape)
+    output_dim[0] = uniques_buf.sum().item()
 
-                # Flatten the inverse indices array every element can be updated to represent a global index
-                transposed = inverse_buf.transpose(0, a.split)
-                transposed_shape = transposed.shape
-                flatten_inverse = transposed.flatten()
+    # Gather all unique vectors
+    counts = list(uniques_buf.tolist())
+    displs = list([0] + uniques_buf.cumsum(0).tolist()[:-1])
+    gres_buf = torch.empty(output_dim, dtype=a.dtype.torch_type())
+    a.comm.Allgatherv(lres, (gres_buf, counts, displs), recv_axis=0)
+    if return_counts:
+        gcounts_buf = torch.empty((output_dim[0],), dtype=torch.int64)
+        a.comm.Allgatherv(lcounts, (gcounts_buf, counts, displs))
 
-                # Update the index elements iteratively
-                cur_displ = 0
-                inverse_indices = [0] * len(flatten_inverse)
-                for num in range(len(inverse_indices)):
-                    if num >= local_elements[cur_displ]:
-                        cur_displ += 1
-                    index = flatten_inverse[num] + displs[cur_displ]
-                    inverse_indices[num] = g_inverse[index].tolist()
+    if return_inverse:
+        # Prepare some information to generated the inverse indices list
+        avg_len = a.gshape[a.split] // a.comm.Get_size()
+        rem = a.gshape[a.split] % a.comm.Get_size()
+
+        # Share the local reverse indices with other processes
+        counts = [avg_len] * a.comm.Get_size()
+        add_vec = [1] * rem + [0] * (a.comm.Get_size() - rem)
+        inverse_counts = [sum(x) for x in zip(counts, add_vec)]
+        inverse_displs = [0] + list(np.cumsum(inverse_counts[:-1]))
+        # the inverse indices enumerate the slices along the split axis
+        inverse_buf = torch.empty((a.gshape[a.split],), dtype=inverse_pos.dtype)
+        a.comm.Allgatherv(inverse_pos, (inverse_buf, inverse_counts, inverse_displs), recv_axis=0)
+
+    # Run unique a second time
+    gres, g_inverse = torch.unique(gres_buf, sorted=sorted, return_inverse=True, dim=unique_axis)
+    if return_counts:
+        # the local counts of the merged unique slices add up
+        gcounts = torch.zeros((gres.shape[0],), dtype=torch.int64)
+        gcounts.index_add_(0, g_inverse, gcounts_buf)
+    if return_inverse:
+        # Use the previously gathered information to generate global inverse_indices
+        inverse_indices = torch.zeros_like(inverse_buf)
+        steps = displs + [None]
 
-                # Convert the flattened array back to the correct global shape of a
-                inverse_indices = torch.tensor(inverse_indices).reshape(transposed_shape)
-                inverse_indices = inverse_indices.transpose(0, a.split)
+        # Algorithm that creates the correct list for the reverse_indices
+        for i in range(len(steps) - 1):
+            begin = steps[i]
+            end = steps[i + 1]
+            for num, x in enumerate(inverse_buf[begin:end]):
+                inverse_indices[begin + num] = g_inverse[begin + x]
 
-            else:
-                inverse_indices = torch.zeros_like(inverse_buf)
-                steps = displs + [None]
+    # transpose matrix back
+    gres = gres.transpose(0, axis)
 
-                # Algorithm that creates the correct list for the reverse_indices
-                for i in range(len(steps) - 1):
-                    begin = steps[i]
-                    end = steps[i + 1]
-                    for num, x in enumerate(inverse_buf[begin:end]):
-                        inverse_indices[begin + num] = g_inverse[begin + x]
+    split = split if a.split < len(gres.shape) else None
+    result = factories.array(gres, dtype=a.dtype, device=a.device, comm=a.comm, split=split)
+    if split is not None:
+        result.resplit_(a.split)
 
+    return_value = result
+    if return_inverse:
+        return_value = (return_value, inverse_indices.to(a.device.torch_device))
+    if return_counts:
+        counts = factories.array(gcounts, dtype=types.int64, device=a.device, comm=a.comm)
+        return_value = (return_value, counts) if not return_inverse else return_value + (counts,)
+
+    return return_value
+
+
+def __unique_slices(a, axis, return_inverse, return_counts):
+    """
+    Unique slices of the split DNDarray a along an axis other than the split axis. Every process holds a part of each
+    slice, two slices are equal if all of their parts are. Hence, the slices are identified by the ids of the local
+    unique parts, gathered from all processes. The unique slices are ordered by their first occurrence and distributed
+    like a, the inverse indices and counts are not split.
+    """
+    local = a._DNDarray__array.transpose(0, axis)
+    length = local.shape[0]
+    device = local.device
+    if local.numel() > 0:
+        _, local_ids = torch.unique(local, return_inverse=True, dim=0)
     else:
-        # Tensor is already split and does not need to be redistributed afterward
-        split = None
-        is_split = a.split
-        max_uniques, max_pos = uniques_buf.max(0)
-        # find indices of vectors
-        if a.comm.Get_rank() == max_pos.item():
-            # Get indices of the unique vectors to share with all over processes
-            indices = inverse_pos.reshape(-1).unique()
-        else:
-            indices = torch.empty((max_uniques.item(),), dtype=inverse_pos.dtype)
+        local_ids = torch.zeros((length,), dtype=torch.int64, device=device)
+    ids = torch.empty((a.comm.size, length), dtype=torch.int64, device=device)
+    a.comm.Allgather(local_ids.unsqueeze(0), ids)
+    _, inverse, counts = torch.unique(ids, return_inverse=True, return_counts=True, dim=1)
+
+    # first occurrences of the unique slices, these determine their order
+    first = torch.full(counts.shape, length, dtype=torch.int64, device=device)
+    first.scatter_reduce_(0, inverse, torch.arange(length, device=device), reduce="amin")
+    first, order = torch.sort(first)
+    positions = torch.empty_like(order)
+    positions[order] = torch.arange(order.numel(), device=device)
+
+    gshape = list(a.gshape)
+    gshape[axis] = first.numel()
+    uniques = local[first].transpose(0, axis).contiguous()
+    result = dndarray.DNDarray(uniques, tuple(gshape), a.dtype, a.split, a.device, a.comm)
+
+    return_value = (result,)
+    if return_inverse:
+        return_value += (positions[inverse],)
+    if return_counts:
+        counts = counts[order]
+        return_value += (factories.array(counts, dtype=types.int64, device=a.device, comm=a.comm),)
 
-        a.comm.Bcast(indices, root=max_pos)
+    return return_value if len(return_value) > 1 else result
 
-        gres = local_data[indices.tolist()]
 
-        inverse_indices = indices
-        if sorted:
-            raise ValueError(
-                "Sorting with axis != split is not supported yet. "
-                "See https://github.com/helmholtz-analytics/heat/issues/363"
-            )
+def __unique_partitioned(a, sorted, return_inverse, return_counts):
+    """
+    Unique elements of the flattened split DNDarray a. The local unique elements and their counts are sent to the
+    owning processes in a single Alltoallv and merged there. For the inverse indices, the owners return the global
+    indices of the unique elements in a second Alltoallv.
+    """
+    comm = a.comm
+    size = comm.size
+    local = a._DNDarray__array
+    device = local.device
+    # values and counts are packed into rows of a common type that represents both exactly
+    packed_type = torch.float64 if local.is_floating_point() else torch.int64
+
+    if local.numel() == 0:
+        local_uniques = local.reshape(-1)
+        local_inverse = torch.empty((0,), dtype=torch.int64, device=device)
+        local_counts = torch.empty((0,), dtype=torch.int64, device=device)
+    else:
+        local_uniques, local_inverse, local_counts = torch.unique(
+            local, sorted=True, return_inverse=True, return_counts=True
+        )
 
-    if axis is not None:
-        # transpose matrix back
-        gres = gres.transpose(0, axis)
+    if sorted:
+        owners = __range_owners(comm, local_uniques, packed_type)
+    else:
+        owners = __hash_owners(local_uniques, size)
+    order = __argsort_local(owners, False, stable=True)
+    send_counts = torch.bincount(owners, minlength=size)
+    recv_counts = torch.empty_like(send_counts)
+    comm.Alltoall(send_counts, recv_counts)
+
+    rows = torch.stack([local_uniques.to(packed_type), local_counts.to(packed_type)], dim=1)
+    rows = __exchange_rows(comm, rows[order], send_counts, recv_counts)
+
+    # merge the unique elements received from all processes
+    if rows.shape[0] == 0:
+        uniques = rows[:, 0].to(local.dtype)
+        positions = torch.empty((0,), dtype=torch.int64, device=device)
+    else:
+        uniques, positions = torch.unique(
+            rows[:, 0].to(local.dtype), sorted=True, return_inverse=True
+        )
+    counts = torch.zeros(uniques.shape, dtype=torch.int64, device=device)
+    counts.index_add_(0, positions, rows[:, 1].long())
 
-    split = split if a.split < len(gres.shape) else None
-    result = factories.array(
-        gres, dtype=a.dtype, device=a.device, comm=a.comm, split=split, is_split=is_split
-    )
-    if split is not None:
-        result.resplit_(a.split)
+    # the unique elements are ordered by the rank of their owner
+    unique_counts = torch.empty((size,), dtype=torch.int64, device=device)
+    comm.Allgather(torch.tensor([uniques.shape[0]], device=device), unique_counts)
+    unique_counts = unique_counts.tolist()
+    offset = sum(unique_counts[: comm.rank])
+    gshape = (sum(unique_counts),)
 
-    return_value = result
+    results = [__unique_result(uniques, gshape, a.dtype, a.device, comm)]
     if return_inverse:
-        return_value = [return_value, inverse_indices.to(a.device.torch_device)]
+        indices = __exchange_rows(comm, positions + offset, recv_counts, send_counts)
+        global_indices = torch.empty_like(indices)
+        global_indices[order] = indices
+        inverse = global_indices[local_inverse].reshape(local.shape)
+        results.append(
+            dndarray.DNDarray(inverse, tuple(a.gshape), types.int64, a.split, a.device, comm)
+        )
+    if return_counts:
+        results.append(__unique_result(counts, gshape, types.int64, a.device, comm))
 
-    return return_value
+    return results[0] if len(results) == 1 else tuple(results)
+
+
+def __unique_result(local, gshape, dtype, device, comm):
+    """
+    Wraps the owned parts of a unique result into a DNDarray split along its only axis and balances it. The result
+    stays distributed, independent of the split axis of the input.
+    """
+    result = dndarray.DNDarray(local, gshape, dtype, 0, device, comm)
+    result.balance_()
+
+    return result
+
+
+def __hash_owners(values, size):
+    """
+    Owning process of each value, determined by Fibonacci hashing of the integer value or the bit pattern of a
+    floating point value.
+    """
+    if values.is_floating_point():
+        # both zeros are equal and have to be owned by the same process
+        values = values.masked_fill(values == 0, 0)
+        bits = values.cpu().numpy()
+        bits = bits.view("i{}".format(bits.dtype.itemsize)).astype(np.int64)
+        keys = torch.from_numpy(bits).to(values.device)
+    else:
+        keys = values.long()
+
+    keys = keys * -7046029254386353131
+    keys = keys ^ (keys >> 32)
+
+    return torch.remainder(keys, size)
+
+
+def __range_owners(comm, values, packed_type):
+    """
+    Owning process of each of the sorted, unique values, the value range is split by pivots chosen from a regular
+    sample of the unique values of all processes.
+    """
+    size = comm.size
+    length = values.shape[0]
+    device = values.device
+
+    samples = min(length, __SORT_OVERSAMPLING * size)
+    positions = (2 * torch.arange(samples, device=device) + 1) * length // (2 * max(samples, 1))
+    all_samples = torch.empty((size,), dtype=torch.int64, device=device)
+    comm.Allgather(torch.tensor([samples], device=device), all_samples)
+    all_samples = all_samples.tolist()
+
+    gathered = torch.empty((sum(all_samples),), dtype=packed_type, device=device)
+    comm.Allgatherv(
+        values[positions].to(packed_type), (gathered, all_samples, __displacements(all_samples))
+    )
+    gathered, _ = torch.sort(gathered)
+    if gathered.shape[0] == 0:
+        return torch.zeros((length,), dtype=torch.int64, device=device)
+    pivots = gathered[torch.arange(1, size, device=device) * gathered.shape[0] // size]
+
+    values = values.to(packed_type)
+    bounds = __search_sorted(length, lambda i: values[i] < pivots, (size - 1,), device)
+    bounds = torch.cat([bounds.new_zeros((1,)), bounds, bounds.new_full((1,), length)])
+
+    return torch.repeat_interleave(torch.arange(size, device=device), bounds[1:] - bounds[:-1])
 
 
 def resplit(arr, axis=None):
@@ -1649,6 +2001,9 @@ def resplit(arr, axis=None):
     WARNING: this operation might involve a significant communication overhead. Use it sparingly and preferably for
     small tensors.
 
+    Resplitting from one split axis to another is done with a single Alltoallv, the blocks are received directly in
+    the new process-local tensor.
+
     Parameters
     ----------
     arr : ht.DNDarray
@@ -1690,51 +2045,149 @@ def resplit(arr, axis=None):
     # early out for unchanged content
     if axis == arr.split:
         return arr.copy()
-    if axis is None:
-        # new_arr = arr.copy()
-        gathered = torch.empty(
-            arr.shape, dtype=arr.dtype.torch_type(), device=arr.device.torch_device
-        )
-        counts, displs, _ = arr.comm.counts_displs_shape(arr.shape, arr.split)
-        arr.comm.Allgatherv(arr._DNDarray__array, (gathered, counts, displs), recv_axis=arr.split)
-        new_arr = factories.array(gathered, is_split=axis, device=arr.device, dtype=arr.dtype)
-        return new_arr
     # tensor needs be split/sliced locally
     if arr.split is None:
         temp = arr._DNDarray__array[arr.comm.chunk(arr.shape, axis)[2]]
         new_arr = factories.array(temp, is_split=axis, device=arr.device, dtype=arr.dtype)
         return new_arr
 
-    arr_tiles = tiling.SplitTiles(arr)
-    new_arr = factories.empty(arr.gshape, split=axis, dtype=arr.dtype, device=arr.device)
-    new_tiles = tiling.SplitTiles(new_arr)
-    rank = arr.comm.rank
-    waits = []
-    rcv_waits = {}
-    for rpr in range(arr.comm.size):
-        # need to get where the tiles are on the new one first
-        # rpr is the destination
-        new_locs = torch.where(new_tiles.tile_locations == rpr)
-        new_locs = torch.stack([new_locs[i] for i in range(arr.ndim)], dim=1)
-
-        for i in range(new_locs.shape[0]):
-            key = tuple(new_locs[i].tolist())
-            spr = arr_tiles.tile_locations[key].item()
-            to_send = arr_tiles[key]
-            if spr == rank and spr != rpr:
-                waits.append(arr.comm.Isend(to_send.clone(), dest=rpr, tag=rank))
-            elif spr == rpr and rpr == rank:
-                new_tiles[key] = to_send.clone()
-            elif rank == rpr:
-                buf = torch.zeros_like(new_tiles[key])
-                rcv_waits[key] = [arr.comm.Irecv(buf=buf, source=spr, tag=spr), buf]
-    for w in waits:
-        w.wait()
-    for k in rcv_waits.keys():
-        rcv_waits[k][0].wait()
-        new_tiles[k] = rcv_waits[k][1]
-
-    return new_arr
+    # the chunks are gathered or the blocks of the new distribution are received in the new local tensor with a single
+    # collective operation
+    resplit, _ = arr._DNDarray__resplit_exchange(axis)
+    return dndarray.DNDarray(resplit, arr.gshape, arr.dtype, axis, arr.device, arr.comm)
+
+
+def roll(x, shift, axis=None):
+    """
+    Rolls the elements of an array along the given axes, elements shifted beyond the last position re-enter at the
+    first. Along the split axis, the processes exchange only the slabs crossing the boundaries of their chunks, i.e.
+    for shifts smaller than the chunks every process communicates with its neighbors only. The result is balanced.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The array to roll
+    shift : int or tuple of ints
+        The number of positions the elements are shifted by. A tuple holds the shifts of the respective axes, an int
+        shifts all axes alike.
+    axis : int or tuple of ints, optional
+        The axes along which the elements are shifted. None rolls the flattened array and restores its shape.
+        Default: None
+
+    Returns
+    -------
+    rolled : ht.DNDarray
+        The rolled array of the same shape and split axis as x, balanced along it
+
+    Raises
+    ------
+    TypeError
+        If x is not a DNDarray or shift is not an int or a tuple of ints.
+    ValueError
+        If the numbers of shifts and axes do not match.
+
+    Examples
+    --------
+    >>> x = ht.arange(10, split=0)
+    >>> ht.roll(x, 2)
+    tensor([8, 9, 0, 1, 2, 3, 4, 5, 6, 7])
+    >>> ht.roll(x, -2)
+    tensor([2, 3, 4, 5, 6, 7, 8, 9, 0, 1])
+    >>> x = ht.arange(10, split=1).reshape((2, 5))
+    >>> ht.roll(x, 1, axis=1)
+    tensor([[4, 0, 1, 2, 3],
+            [9, 5, 6, 7, 8]])
+    >>> ht.roll(x, (1, 1), axis=(1, 0))
+    tensor([[9, 5, 6, 7, 8],
+            [4, 0, 1, 2, 3]])
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if axis is None:
+        return reshape(roll(flatten(x), shift, 0), x.gshape, axis=x.split)
+
+    shifts = (shift,) if isinstance(shift, int) else tuple(shift)
+    if not all(isinstance(s, int) for s in shifts):
+        raise TypeError("shift must be an int or a tuple of ints, but was {}".format(shift))
+    axes = (axis,) if isinstance(axis, int) else tuple(axis)
+    if len(shifts) == 1:
+        shifts *= len(axes)
+    if len(axes) == 1:
+        axes *= len(shifts)
+    if len(shifts) != len(axes):
+        raise ValueError(
+            "shift and axis must be of the same length, but were {} and {}".format(shift, axis)
+        )
+    totals = {}
+    for s, a in zip(shifts, axes):
+        a = stride_tricks.sanitize_axis(x.gshape, a)
+        totals[a] = totals.get(a, 0) + s
+
+    local = x._DNDarray__array
+    if local.ndim != x.ndim:
+        # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+        shape = list(x.gshape)
+        shape[x.split] = 0
+        local = local.reshape(shape)
+    split_shift = totals.pop(x.split, 0) if x.is_distributed() else 0
+    dims = [a for a in totals if x.gshape[a] > 0]
+    if dims:
+        local = torch.roll(local, [totals[a] % x.gshape[a] for a in dims], dims)
+
+    if x.is_distributed():
+        # every chunk is placed at its shifted position, the one crossing the end of the axis in two slabs
+        extent = x.gshape[x.split]
+        counts = x.create_lshape_map()[:, x.split].tolist()
+        placements = []
+        for start, count in zip(__displacements(counts), counts):
+            start = (start + split_shift) % extent if extent > 0 else 0
+            head = min(count, extent - start)
+            placements.append([(0, start, head), (head, 0, count - head)])
+        target = x.comm.counts_displs_shape(x.gshape, x.split)[0]
+        local = __move_slabs(x.comm, local, x.split, placements, target)
+    elif not dims:
+        local = local.clone()
+
+    return dndarray.DNDarray(local, x.gshape, x.dtype, x.split, x.device, x.comm)
+
+
+def __move_slabs(comm, local, axis, placements, target):
+    """
+    Moves slabs of the process-local tensors along the axis into the chunks of the distribution with the target
+    counts. placements[p] lists the slabs of process p as (offset, start, length), i.e. the local slab [offset,
+    offset + length) is placed at the global position start. Every slab is sent point-to-point to the processes whose
+    target chunks it overlaps, slabs displaced by less than the chunks hence move between neighbors only.
+    """
+    rank = comm.rank
+    target_starts = __displacements(target)
+    shape = list(local.shape)
+    shape[axis] = target[rank]
+    moved = torch.empty(shape, dtype=local.dtype, device=local.device)
+    own_start, own_end = target_starts[rank], target_starts[rank] + target[rank]
+
+    requests = []
+    for offset, start, length in placements[rank]:
+        for dest in range(comm.size):
+            begin = max(start, target_starts[dest])
+            end = min(start + length, target_starts[dest] + target[dest])
+            if begin < end and dest != rank:
+                slab = local.narrow(axis, offset + begin - start, end - begin).contiguous()
+                requests.append(comm.Isend(slab, dest=dest))
+    # the slabs of every pair of processes are received in the order they have been sent
+    for source, slabs in enumerate(placements):
+        for offset, start, length in slabs:
+            begin, end = max(start, own_start), min(start + length, own_end)
+            if begin >= end:
+                continue
+            received = moved.narrow(axis, begin - own_start, end - begin)
+            if source == rank:
+                received.copy_(local.narrow(axis, offset + begin - start, end - begin))
+            else:
+                requests.append(comm.Irecv(received, source=source))
+    for request in requests:
+        request.Wait()
+
+    return moved
 
 
 def vstack(tup):
@@ -1,10 +1,11 @@
 import builtins
 import numpy as np
 import torch
-import warnings
 
 from .communication import MPI, MPI_WORLD
 from . import factories
+from . import expressions
+from . import redistribution
 from . import stride_tricks
 from . import dndarray
 from . import types
@@ -13,7 +14,7 @@ __all__ = []
 __BOOLEAN_OPS = [MPI.LAND, MPI.LOR, MPI.BAND, MPI.BOR]
 
 
-def __binary_op(operation, t1, t2):
+def __binary_op(operation, t1, t2, out=None):
     """
     Generic wrapper for element-wise binary operations of two operands (either can be tensor or scalar).
     Takes the operation function and the two operands involved in the operation as arguments.
@@ -30,11 +31,34 @@ def __binary_op(operation, t1, t2):
     t2: dndarray or scalar
         The second operand involved in the operation,
 
+    out: ht.DNDarray, optional
+        A location in which to store the results. If provided, it must have the shape and split of the result. Its
+        data type is retained, i.e. the result is cast to it. If not provided or set to None, a fresh tensor is
+        allocated.
+
     Returns
     -------
     result: ht.DNDarray
-        A DNDarray containing the results of element-wise operation.
+        A DNDarray containing the results of element-wise operation. If out was provided, result is a reference to it.
+
+    Raises
+    -------
+    TypeError
+        If out is neither None nor a DNDarray.
+    ValueError
+        If the shape or the split of out do not match the ones of the result.
     """
+    if out is not None and not isinstance(out, dndarray.DNDarray):
+        raise TypeError("expected out to be None or an ht.DNDarray, but was {}".format(type(out)))
+
+    # fast path, an array and a scalar do not require any sanitation of the scalar operand
+    if isinstance(t1, dndarray.DNDarray) != isinstance(t2, dndarray.DNDarray) and (
+        np.isscalar(t1) or np.isscalar(t2)
+    ):
+        result = __binary_op_scalar(operation, t1, t2, out)
+        if result is not None:
+            return result
+
     if np.isscalar(t1):
         try:
             t1 = factories.array([t1])
@@ -79,47 +103,15 @@ def __binary_op(operation, t1, t2):
                 raise TypeError("Data type not supported, input was {}".format(type(t2)))
 
         elif isinstance(t2, dndarray.DNDarray):
-            if t1.split is None:
-                t1 = factories.array(
-                    t1, split=t2.split, copy=False, comm=t1.comm, device=t1.device, ndmin=-t2.ndim
-                )
-            elif t2.split is None:
-                t2 = factories.array(
-                    t2, split=t1.split, copy=False, comm=t2.comm, device=t2.device, ndmin=-t1.ndim
-                )
-            elif t1.split != t2.split:
-                # It is NOT possible to perform binary operations on tensors with different splits, e.g. split=0
-                # and split=1
-                raise NotImplementedError("Not implemented for other splittings")
-
+            # line up the distributions of the operands, moving as few bytes as possible
             output_shape = stride_tricks.broadcast_shape(t1.shape, t2.shape)
-            output_split = t1.split
+            plan = redistribution.redistribution_plan(t1, t2)
+            t1, t2 = redistribution.redistribute(plan, t1, t2)
+
+            output_split = plan.split
             output_device = t1.device
             output_comm = t1.comm
 
-            # ToDo: Fine tuning in case of comm.size>t1.shape[t1.split]. Send torch tensors only to ranks, that will hold data.
-            if t1.split is not None:
-                if t1.shape[t1.split] == 1 and t1.comm.is_distributed():
-                    warnings.warn(
-                        "Broadcasting requires transferring data of first operator between MPI ranks!"
-                    )
-                    if t1.comm.rank > 0:
-                        t1._DNDarray__array = torch.zeros(
-                            t1.shape, dtype=t1.dtype.torch_type(), device=t1.device.torch_device
-                        )
-                    t1.comm.Bcast(t1)
-
-            if t2.split is not None:
-                if t2.shape[t2.split] == 1 and t2.comm.is_distributed():
-                    warnings.warn(
-                        "Broadcasting requires transferring data of second operator between MPI ranks!"
-                    )
-                    if t2.comm.rank > 0:
-                        t2._DNDarray__array = torch.zeros(
-                            t2.shape, dtype=t2.dtype.torch_type(), device=t2.device.torch_device
-                        )
-                    t2.comm.Bcast(t2)
-
         else:
             raise TypeError(
                 "Only tensors and numeric scalars are supported, but input was {}".format(type(t2))
@@ -128,34 +120,206 @@ def __binary_op(operation, t1, t2):
         raise NotImplementedError("Not implemented for non scalar")
 
     promoted_type = types.promote_types(t1.dtype, t2.dtype).torch_type()
+    if out is not None:
+        __sanitize_binary_out(out, output_shape, output_split)
+    elif expressions.is_lazy():
+        deferred = expressions.defer(
+            operation,
+            (t1, t2),
+            promoted_type,
+            output_shape,
+            output_split,
+            output_device,
+            output_comm,
+        )
+        if deferred is not None:
+            return deferred
+
     if t1.split is not None:
         if len(t1.lshape) > t1.split and t1.lshape[t1.split] == 0:
             result = t1._DNDarray__array.type(promoted_type)
         else:
-            result = operation(
-                t1._DNDarray__array.type(promoted_type), t2._DNDarray__array.type(promoted_type)
+            result = __apply_binary_op(
+                operation,
+                t1._DNDarray__array.type(promoted_type),
+                t2._DNDarray__array.type(promoted_type),
+                out,
             )
     elif t2.split is not None:
 
         if len(t2.lshape) > t2.split and t2.lshape[t2.split] == 0:
             result = t2._DNDarray__array.type(promoted_type)
         else:
-            result = operation(
-                t1._DNDarray__array.type(promoted_type), t2._DNDarray__array.type(promoted_type)
+            result = __apply_binary_op(
+                operation,
+                t1._DNDarray__array.type(promoted_type),
+                t2._DNDarray__array.type(promoted_type),
+                out,
             )
     else:
-        result = operation(
-            t1._DNDarray__array.type(promoted_type), t2._DNDarray__array.type(promoted_type)
+        result = __apply_binary_op(
+            operation,
+            t1._DNDarray__array.type(promoted_type),
+            t2._DNDarray__array.type(promoted_type),
+            out,
         )
 
     if not isinstance(result, torch.Tensor):
         result = torch.tensor(result)
 
+    if out is not None:
+        out._DNDarray__array = result.type(out.dtype.torch_type())
+        return out
+
     return dndarray.DNDarray(
         result, output_shape, types.heat_type_of(result), output_split, output_device, output_comm
     )
 
 
+def __apply_binary_op(operation, t1, t2, out):
+    """
+    Applies an element-wise binary operation to two process-local tensors. If an output buffer is given, the result is
+    written directly into its process-local tensor whenever shape and type permit, avoiding a temporary allocation.
+
+    Parameters
+    ----------
+    operation : function
+        The element-wise torch operation, e.g. torch.add
+    t1: torch.Tensor
+        The first process-local operand, already cast to the promoted type
+    t2: torch.Tensor
+        The second process-local operand, already cast to the promoted type
+    out: ht.DNDarray or None
+        The output buffer
+
+    Returns
+    -------
+    result: torch.Tensor
+        The process-local result, the process-local tensor of out if it could be reused
+    """
+    if out is None:
+        return operation(t1, t2)
+
+    expressions.evaluate_dependents(out)
+    buffer = out._DNDarray__array
+    if tuple(buffer.shape) != stride_tricks.broadcast_shape(tuple(t1.shape), tuple(t2.shape)):
+        return operation(t1, t2)
+    if buffer.dtype == t1.dtype:
+        return operation(t1, t2, out=buffer)
+
+    return buffer.copy_(operation(t1, t2))
+
+
+def __sanitize_binary_out(out, output_shape, output_split):
+    """
+    Checks whether the output buffer of an element-wise binary operation matches the global shape and split of the
+    result.
+
+    Parameters
+    ----------
+    out: ht.DNDarray
+        The output buffer
+    output_shape: tuple of ints
+        The global shape of the result
+    output_split: int or None
+        The split axis of the result
+
+    Raises
+    -------
+    ValueError
+        If shape or split of out do not match the ones of the result.
+    """
+    if out.shape != output_shape:
+        raise ValueError("Expecting output buffer of shape {}, got {}".format(output_shape, out.shape))
+    if out.split != output_split:
+        raise ValueError("Expecting output buffer of split {}, got {}".format(output_split, out.split))
+
+
+def __binary_op_scalar(operation, t1, t2, out=None):
+    """
+    Fast path of __binary_op for an operation between a DNDarray and a Python or NumPy scalar. Instead of wrapping the
+    scalar into a DNDarray, it is directly converted into a one-element torch tensor of the promoted type. The type
+    promotion is identical to the one of __binary_op.
+
+    Parameters
+    ----------
+    operation : function
+        The operation to be performed. Function that performs operation elements-wise on the involved tensors,
+        e.g. add values from other to self
+    t1: dndarray or scalar
+        The first operand involved in the operation,
+    t2: dndarray or scalar
+        The second operand involved in the operation, exactly one of t1 and t2 is a scalar
+    out: ht.DNDarray, optional
+        A location in which to store the results, see __binary_op
+
+    Returns
+    -------
+    result: ht.DNDarray or None
+        A DNDarray containing the results of element-wise operation. None, if the scalar is not supported by the fast
+        path, e.g. a string
+    """
+    reflected = not isinstance(t1, dndarray.DNDarray)
+    x, scalar = (t2, t1) if reflected else (t1, t2)
+
+    # infer the type of the scalar in the same way as torch does for a sequence
+    if isinstance(scalar, np.generic):
+        try:
+            scalar_type = types.canonical_heat_type(type(scalar)).torch_type()
+        except TypeError:
+            return None
+    elif isinstance(scalar, bool):
+        scalar_type = torch.bool
+    elif isinstance(scalar, int):
+        scalar_type = torch.int64
+    elif isinstance(scalar, float):
+        scalar_type = torch.get_default_dtype()
+    else:
+        return None
+
+    try:
+        scalar = torch.tensor([scalar], dtype=scalar_type, device=x.device.torch_device)
+    except (OverflowError, RuntimeError, TypeError, ValueError):
+        return None
+
+    # a leading scalar is cast to the type of the array
+    if reflected:
+        promoted_type = x.dtype.torch_type()
+    else:
+        promoted_type = types.promote_types(
+            x.dtype, types.canonical_heat_type(scalar_type)
+        ).torch_type()
+    scalar = scalar.type(promoted_type)
+    operands = (scalar, x) if reflected else (x, scalar)
+
+    if out is not None:
+        __sanitize_binary_out(out, x.shape, x.split)
+    elif expressions.is_lazy():
+        deferred = expressions.defer(
+            operation, operands, promoted_type, x.shape, x.split, x.device, x.comm
+        )
+        if deferred is not None:
+            return deferred
+
+    if x.split is not None and len(x.lshape) > x.split and x.lshape[x.split] == 0:
+        result = x._DNDarray__array.type(promoted_type)
+    else:
+        local = x._DNDarray__array.type(promoted_type)
+        if reflected:
+            result = __apply_binary_op(operation, scalar, local, out)
+        else:
+            result = __apply_binary_op(operation, local, scalar, out)
+
+    if not isinstance(result, torch.Tensor):
+        result = torch.tensor(result)
+
+    if out is not None:
+        out._DNDarray__array = result.type(out.dtype.torch_type())
+        return out
+
+    return dndarray.DNDarray(result, x.shape, types.heat_type_of(result), x.split, x.device, x.comm)
+
+
 def __cum_op(x, partial_op, exscan_op, final_op, neutral, axis, dtype, out):
     """
     Generic wrapper for cumulative operations, i.e. cumsum(), cumprod(). Performs a three-stage cumulative operation. First, a partial
@@ -223,6 +387,7 @@ def __cum_op(x, partial_op, exscan_op, final_op, neutral, axis, dtype, out):
                 "out and a have different devices {} != {}".format(out.device, x.device)
             )
         dtype = out.dtype
+        expressions.evaluate_dependents(out)
 
     cumop = partial_op(
         x._DNDarray__array,
@@ -300,10 +465,17 @@ def __local_op(operation, x, out, no_cast=False, **kwargs):
         promoted_type = types.promote_types(x.dtype, types.float32)
         torch_type = promoted_type.torch_type()
     else:
-        torch_type = x._DNDarray__array.dtype
+        torch_type = x.dtype.torch_type()
 
     # no defined output tensor, return a freshly created one
     if out is None:
+        if expressions.is_lazy():
+            deferred = expressions.defer(
+                operation, (x,), torch_type, x.gshape, x.split, x.device, x.comm, **kwargs
+            )
+            if deferred is not None:
+                return deferred
+
         result = operation(x._DNDarray__array.type(torch_type), **kwargs)
         return dndarray.DNDarray(
             result, x.gshape, types.canonical_heat_type(result.dtype), x.split, x.device, x.comm
@@ -319,6 +491,7 @@ def __local_op(operation, x, out, no_cast=False, **kwargs):
     needs_repetition = builtins.any(multiple > 1 for multiple in multiples)
 
     # do an inplace operation into a provided buffer
+    expressions.evaluate_dependents(out)
     casted = x._DNDarray__array.type(torch_type)
     operation(
         casted.repeat(multiples) if needs_repetition else casted, out=out._DNDarray__array, **kwargs
@@ -349,6 +522,15 @@ def __reduce_op(x, partial_op, reduction_op, neutral=None, **kwargs):
         those cases where 'x.gshape[x.split] < x.comm.rank', that is, the shape of the distributed tensor is such
         that one or more processes will be left without data.
 
+    async_op: bool, optional
+        If True, the global reduction is performed with a non-blocking collective operation. The returned DNDarray is
+        pending, the reduction is completed on the first access to its data. Implied within a coalesce() context of the
+        communicator of x.
+
+    finalize: function, optional
+        Function applied to the process-local tensor once the global reduction has completed, e.g. the division by the
+        number of elements for implementing a distributed mean().
+
     Returns
     -------
     result: ht.DNDarray
@@ -372,7 +554,130 @@ def __reduce_op(x, partial_op, reduction_op, neutral=None, **kwargs):
     axis = stride_tricks.sanitize_axis(x.shape, kwargs.get("axis"))
     if isinstance(axis, int):
         axis = (axis,)
-    keepdim = kwargs.get("keepdim")
+
+    partial, output_shape = __reduce_partial(x, partial_op, neutral, axis, kwargs.get("keepdim"))
+
+    # Check shape of output buffer, if any
+    if out is not None and out.shape != output_shape:
+        raise ValueError(
+            "Expecting output buffer of shape {}, got {}".format(output_shape, out.shape)
+        )
+
+    # perform a reduction operation in case the tensor is distributed across the reduction axis
+    request = None
+    finalize = kwargs.get("finalize")
+    split = __reduced_split(x, axis, kwargs.get("keepdim"))
+    if x.split is not None and split is None:
+        if x.comm.is_distributed() and (kwargs.get("async_op") or x.comm.is_coalescing()):
+            request = x.comm.Iallreduce(MPI.IN_PLACE, partial, reduction_op)
+        elif x.comm.is_distributed():
+            x.comm.Allreduce(MPI.IN_PLACE, partial, reduction_op)
+    if request is None and finalize is not None:
+        partial = finalize(partial)
+
+    # if reduction_op is a Boolean operation, then resulting tensor is bool
+    tensor_type = bool if reduction_op in __BOOLEAN_OPS else partial.dtype
+
+    if out is None:
+        out = dndarray.DNDarray(
+            partial,
+            output_shape,
+            types.canonical_heat_type(tensor_type),
+            split=split,
+            device=x.device,
+            comm=x.comm,
+        )
+    else:
+        out._DNDarray__array = partial
+        out._DNDarray__dtype = types.canonical_heat_type(tensor_type)
+        out._DNDarray__split = split
+        out._DNDarray__device = x.device
+        out._DNDarray__comm = x.comm
+
+    # the pending reduction is completed on first access to the data of the result
+    if request is not None:
+        out._DNDarray__request = (request, finalize)
+
+    return out
+
+
+def __reduce_ops(x, reductions, axis=None, keepdim=None):
+    """
+    Generic wrapper for several reductions of the same DNDarray, e.g. the sum and the sum of squares or the minimum and
+    the maximum. The partial reductions are performed node-local one after the other, like in __reduce_op(). The
+    global reductions are coalesced into as few collective operations as possible, see MPICommunication.coalesce(): all
+    partial results of the same data type that are reduced with the same builtin MPI_Op are packed into a single buffer
+    and reduced with a single Allreduce. Minima are reduced as maxima of order-reversed values, such that the minimum
+    and the maximum of an array require a single Allreduce as well.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The heat DNDarray on which to perform the reduction operations
+
+    reductions : sequence of tuples
+        The reduction operations, each given as a tuple (partial_op, reduction_op, neutral), see __reduce_op()
+
+    axis : None or int or tuple of ints, optional
+        Axis or axes along which the reductions are performed, all of them by default
+
+    keepdim : bool, optional
+        Whether the reduced axes are kept as axes of length one
+
+    Returns
+    -------
+    results : tuple of ht.DNDarray
+        The results of the reduction operations, in the order of the reductions
+
+    Raises
+    ------
+    TypeError
+        If the input is not of type ht.DNDarray
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+
+    axis = stride_tricks.sanitize_axis(x.shape, axis)
+    if isinstance(axis, int):
+        axis = (axis,)
+    split = __reduced_split(x, axis, keepdim)
+
+    partials = []
+    output_shapes = []
+    for partial_op, _, neutral in reductions:
+        partial, output_shape = __reduce_partial(x, partial_op, neutral, axis, keepdim)
+        partials.append(partial)
+        output_shapes.append(output_shape)
+    reduction_ops = [reduction_op for _, reduction_op, _ in reductions]
+
+    # perform the reduction operations in case the tensor is distributed across the reduction axis
+    if x.split is not None and split is None:
+        if x.comm.is_distributed():
+            with x.comm.coalesce():
+                requests = [
+                    x.comm.Iallreduce(MPI.IN_PLACE, partial, reduction_op)
+                    for partial, reduction_op in zip(partials, reduction_ops)
+                ]
+            for request in requests:
+                request.Wait()
+
+    return tuple(
+        dndarray.DNDarray(
+            partial,
+            output_shape,
+            types.canonical_heat_type(bool if reduction_op in __BOOLEAN_OPS else partial.dtype),
+            split=split,
+            device=x.device,
+            comm=x.comm,
+        )
+        for partial, output_shape, reduction_op in zip(partials, output_shapes, reduction_ops)
+    )
+
+
+def __reduce_partial(x, partial_op, neutral, axis, keepdim):
+    """
+    Node-local stage of a reduction. Returns the partial result and the global shape of the reduction result.
+    """
     split = x.split
 
     # if local tensor is empty, replace it with the identity element
@@ -396,8 +701,8 @@ def __reduce_op(x, partial_op, reduction_op, neutral=None, **kwargs):
         output_shape = (1,)
     else:
         output_shape = x.gshape
+        partial = __reduce_axes(partial, partial_op, axis)
         for dim in axis:
-            partial = partial_op(partial, dim=dim, keepdim=True)
             output_shape = output_shape[:dim] + (1,) + output_shape[dim + 1 :]
         if not keepdim and not len(partial.shape) == 1:
             gshape_losedim = tuple(x.gshape[dim] for dim in range(len(x.gshape)) if dim not in axis)
@@ -411,35 +716,34 @@ def __reduce_op(x, partial_op, reduction_op, neutral=None, **kwargs):
             if len(lshape_losedim) > 0:
                 partial = partial.reshape(lshape_losedim)
 
-    # Check shape of output buffer, if any
-    if out is not None and out.shape != output_shape:
-        raise ValueError(
-            "Expecting output buffer of shape {}, got {}".format(output_shape, out.shape)
-        )
+    return partial, output_shape
 
-    # perform a reduction operation in case the tensor is distributed across the reduction axis
-    if x.split is not None and (axis is None or (x.split in axis)):
-        split = None
-        if x.comm.is_distributed():
-            x.comm.Allreduce(MPI.IN_PLACE, partial, reduction_op)
 
-    # if reduction_op is a Boolean operation, then resulting tensor is bool
-    tensor_type = bool if reduction_op in __BOOLEAN_OPS else partial.dtype
+def __reduce_axes(partial, partial_op, axis):
+    """
+    Reduces a torch tensor along one or several axes, keeping the reduced axes as axes of length one. Several axes are
+    passed to the partial reduction operation at once, such that the data is traversed in a single pass. Operations
+    that do not accept several axes reduce them one after the other.
+    """
+    if len(axis) > 1:
+        try:
+            return partial_op(partial, dim=tuple(axis), keepdim=True)
+        except (RuntimeError, TypeError):
+            pass
+    for dim in axis:
+        partial = partial_op(partial, dim=dim, keepdim=True)
 
-    if out is not None:
-        out._DNDarray__array = partial
-        out._DNDarray__dtype = types.canonical_heat_type(tensor_type)
-        out._DNDarray__split = split
-        out._DNDarray__device = x.device
-        out._DNDarray__comm = x.comm
+    return partial
 
-        return out
 
-    return dndarray.DNDarray(
-        partial,
-        output_shape,
-        types.canonical_heat_type(tensor_type),
-        split=split,
-        device=x.device,
-        comm=x.comm,
-    )
+def __reduced_split(x, axis, keepdim):
+    """
+    Determines the split axis of the result of a reduction. The result is not split if the split axis is reduced,
+    otherwise the split axis is shifted by the removed axes preceding it.
+    """
+    if x.split is None or axis is None or x.split in axis:
+        return None
+    if keepdim:
+        return x.split
+
+    return x.split - len([dim for dim in axis if dim < x.split])
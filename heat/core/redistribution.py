@@ -0,0 +1,290 @@
+"""
+Planning of the redistribution of differently distributed operands of element-wise binary operations.
+
+The two operands of an element-wise operation need to be distributed along the same axis in order to be combined
+process-locally. If they are not, one of the following redistributions is applied to each operand:
+
+    * "none": the operand already is distributed like the result or is not required to be distributed at all
+    * "slice": the operand is replicated, the chunk matching the distribution of the other operand is sliced out
+      without any communication
+    * "replicate": the operand is broadcast along the split axis of the result, i.e. all of it is required on every
+      process and it is gathered
+    * "alltoallv": the operand is redistributed along the split axis of the result in a single Alltoallv
+
+The split axis of the result is chosen among the split axes of the operands, such that the estimated number of bytes
+moved between the processes is minimal.
+"""
+
+import torch
+
+from . import dndarray
+from . import stride_tricks
+
+__all__ = ["RedistributionPlan", "redistribution_plan"]
+
+
+class RedistributionPlan:
+    """
+    Plan for lining up the distributions of the two operands of an element-wise binary operation.
+
+    Parameters
+    ----------
+    split : int or None
+        The split axis of the result with respect to the broadcast shape of the operands
+    actions : tuple of str
+        The redistribution of either operand, one of "none", "slice", "replicate" or "alltoallv"
+    nbytes : tuple of ints
+        The estimated number of bytes moved between the processes for the redistribution of either operand
+    """
+
+    def __init__(self, split, actions, nbytes):
+        self.split = split
+        self.actions = tuple(actions)
+        self.nbytes = tuple(nbytes)
+
+    def __repr__(self):
+        return "RedistributionPlan(split={}, actions={}, nbytes={})".format(
+            self.split, self.actions, self.nbytes
+        )
+
+    @property
+    def total_nbytes(self):
+        """
+        The estimated number of bytes moved between the processes in total.
+        """
+        return sum(self.nbytes)
+
+
+def redistribution_plan(t1, t2):
+    """
+    Determines the cheapest way to line up the distributions of two DNDarrays for an element-wise binary operation,
+    e.g. ht.add(t1, t2). The cost of each candidate split axis of the result is estimated as the number of bytes that
+    would be moved between the processes, based on the global shapes, the process-local shapes and the data types of
+    the operands. Ties are resolved in favor of the split axis of t1. Operands that are already aligned do not require
+    any communication for planning.
+
+    Parameters
+    ----------
+    t1 : ht.DNDarray
+        The first operand of the operation
+    t2 : ht.DNDarray
+        The second operand of the operation
+
+    Returns
+    -------
+    plan : RedistributionPlan
+        The chosen split axis of the result and the redistribution of either operand
+
+    Raises
+    ------
+    TypeError
+        If either operand is not a DNDarray.
+    ValueError
+        If the shapes of the operands cannot be broadcast.
+
+    Examples
+    --------
+    (4 processes)
+    >>> a = ht.ones((4, 1000), split=0)
+    >>> b = ht.ones((4, 1000), split=1)
+    >>> ht.redistribution_plan(a, b)
+    RedistributionPlan(split=0, actions=('none', 'alltoallv'), nbytes=(0, 12000))
+    >>> ht.redistribution_plan(a, ht.ones((1000,)))
+    RedistributionPlan(split=0, actions=('none', 'none'), nbytes=(0, 0))
+    >>> ht.redistribution_plan(ht.ones((1, 1000), split=0), ht.ones((4, 1000)))
+    RedistributionPlan(split=0, actions=('replicate', 'slice'), nbytes=(12000, 0))
+    """
+    if not isinstance(t1, dndarray.DNDarray) or not isinstance(t2, dndarray.DNDarray):
+        raise TypeError(
+            "expected two DNDarrays, but inputs were {} and {}".format(type(t1), type(t2))
+        )
+    output_shape = stride_tricks.broadcast_shape(t1.gshape, t2.gshape)
+    ndim = len(output_shape)
+
+    candidates = []
+    for operand in (t1, t2):
+        split = __aligned_split(operand, ndim)
+        if split is not None and 0 <= split < ndim and split not in candidates:
+            candidates.append(split)
+    if not candidates:
+        return RedistributionPlan(None, ("none", "none"), (0, 0))
+
+    best = None
+    lshape_maps = {}
+    for split in candidates:
+        actions = (__action(t1, split, output_shape), __action(t2, split, output_shape))
+        nbytes = (
+            __nbytes(t1, t2, actions, split, ndim, lshape_maps),
+            __nbytes(t2, t1, actions[::-1], split, ndim, lshape_maps),
+        )
+        plan = RedistributionPlan(split, actions, nbytes)
+        if best is None or plan.total_nbytes < best.total_nbytes:
+            best = plan
+
+    return best
+
+
+def __aligned_split(x, ndim):
+    """
+    Returns the split axis of a DNDarray with respect to a broadcast shape of the given dimensionality, i.e. with the
+    shape of the array aligned to the trailing dimensions.
+    """
+    return None if x.split is None else x.split + ndim - x.ndim
+
+
+def __action(x, split, output_shape):
+    """
+    Determines the redistribution of an operand for the given split axis of the result.
+    """
+    axis = split + x.ndim - len(output_shape)
+    # the operand is broadcast along the split axis of the result or does not reach it at all
+    broadcast = not 0 <= axis < len(x.gshape) or (x.gshape[axis] == 1 and output_shape[split] != 1)
+
+    if x.split is None:
+        return "none" if broadcast else "slice"
+    if broadcast:
+        return "replicate" if x.comm.is_distributed() else "none"
+    if x.split == axis:
+        return "none"
+    return "alltoallv"
+
+
+def __lshape_map(x, lshape_maps):
+    """
+    Memoized lshape map of an operand, the creation requires communication.
+    """
+    if id(x) not in lshape_maps:
+        lshape_maps[id(x)] = x.create_lshape_map()
+    return lshape_maps[id(x)]
+
+
+def __nbytes(x, other, actions, split, ndim, lshape_maps):
+    """
+    Estimates the number of bytes moved between the processes for the redistribution of an operand, actions holds the
+    redistribution of the operand and the other one.
+    """
+    if actions[0] not in ("replicate", "alltoallv"):
+        return 0
+
+    itemsize = torch.empty((), dtype=x.dtype.torch_type()).element_size()
+    counts = __lshape_map(x, lshape_maps)[:, x.split].tolist()
+    # number of elements per index along the split axis
+    stride = x.gnumel // x.gshape[x.split] if x.gshape[x.split] else 0
+
+    # every process receives all elements it does not hold yet
+    if actions[0] == "replicate":
+        return itemsize * sum(x.gnumel - count * stride for count in counts)
+
+    # a process keeps the intersection of its current and its future chunk
+    axis = split + x.ndim - ndim
+    target = __target_counts(x, axis, other, actions[1], split, ndim, lshape_maps)
+    stride = stride // x.gshape[axis] if x.gshape[axis] else 0
+    kept = sum(count * target_count * stride for count, target_count in zip(counts, target))
+
+    return itemsize * (x.gnumel - kept)
+
+
+def __target_counts(x, axis, other, other_action, split, ndim, lshape_maps):
+    """
+    Determines the process-local extents along the future split axis of an operand that is redistributed with an
+    Alltoallv. If the other operand already is distributed along the split axis of the result, its distribution is
+    matched. Otherwise, the regular chunking is used.
+    """
+    if other_action == "none" and __aligned_split(other, ndim) == split:
+        return __lshape_map(other, lshape_maps)[:, other.split].tolist()
+
+    return list(x.comm.counts_displs_shape(x.gshape, axis)[0])
+
+
+def __displacements(counts):
+    """
+    Exclusive prefix sum of the counts, i.e. the displacements of the respective chunks in a buffer.
+    """
+    displs = [0] * len(counts)
+    for i in range(1, len(counts)):
+        displs[i] = displs[i - 1] + counts[i - 1]
+
+    return displs
+
+
+def redistribute(plan, t1, t2):
+    """
+    Redistributes the two operands of an element-wise binary operation according to a plan.
+
+    Parameters
+    ----------
+    plan : RedistributionPlan
+        The plan, see redistribution_plan()
+    t1 : ht.DNDarray
+        The first operand of the operation
+    t2 : ht.DNDarray
+        The second operand of the operation
+
+    Returns
+    -------
+    operands : tuple of ht.DNDarray
+        The aligned operands, either the passed ones or redistributed copies
+    """
+    ndim = max(t1.ndim, t2.ndim)
+    lshape_maps = {}
+    operands = []
+
+    for x, other, actions in ((t1, t2, plan.actions), (t2, t1, plan.actions[::-1])):
+        if actions[0] == "slice":
+            axis = plan.split + x.ndim - ndim
+            target = __target_counts(x, axis, other, actions[1], plan.split, ndim, lshape_maps)
+            x = __slice(x, axis, target)
+        elif actions[0] == "replicate":
+            x = __replicate(x, __lshape_map(x, lshape_maps))
+        elif actions[0] == "alltoallv":
+            axis = plan.split + x.ndim - ndim
+            target = __target_counts(x, axis, other, actions[1], plan.split, ndim, lshape_maps)
+            x = __alltoallv(x, axis, target, __lshape_map(x, lshape_maps))
+        operands.append(x)
+
+    return tuple(operands)
+
+
+def __replicate(x, lshape_map):
+    """
+    Gathers a split DNDarray on all processes.
+    """
+    counts = lshape_map[:, x.split].tolist()
+    gathered = torch.empty(x.gshape, dtype=x.dtype.torch_type(), device=x.device.torch_device)
+    x.comm.Allgatherv(
+        x._DNDarray__array, (gathered, counts, __displacements(counts)), recv_axis=x.split
+    )
+
+    return dndarray.DNDarray(gathered, x.gshape, x.dtype, None, x.device, x.comm)
+
+
+def __slice(x, axis, target):
+    """
+    Distributes a replicated DNDarray along the given axis without communication, the process-local chunks have the
+    given extents along the axis.
+    """
+    offset = sum(target[: x.comm.rank])
+    local = x._DNDarray__array.narrow(axis, offset, target[x.comm.rank])
+
+    return dndarray.DNDarray(local, x.gshape, x.dtype, axis, x.device, x.comm)
+
+
+def __alltoallv(x, axis, target, lshape_map):
+    """
+    Redistributes a split DNDarray along another axis with a single Alltoallv. The blocks are cut out of the
+    process-local chunks and put in place by derived MPI data types, i.e. without packing them into separate buffers.
+    """
+    counts = lshape_map[:, x.split].tolist()
+
+    shape = list(x.gshape)
+    shape[axis] = target[x.comm.rank]
+    result = torch.empty(shape, dtype=x.dtype.torch_type(), device=x.device.torch_device)
+
+    x.comm.Alltoallv(
+        (x._DNDarray__array, target, __displacements(target)),
+        (result, counts, __displacements(counts)),
+        send_axis=axis,
+        recv_axis=x.split,
+    )
+
+    return dndarray.DNDarray(result, x.gshape, x.dtype, axis, x.device, x.comm)
@@ -0,0 +1,513 @@
+"""
+Distributed convolutions, stencils and rolling-window reductions. Split arrays exchange halos of the kernel or window
+extent with their neighboring processes only, the kernel is applied process-locally with the convolutions of PyTorch.
+"""
+
+import torch
+
+from . import dndarray
+from . import factories
+from . import manipulations
+from . import stride_tricks
+from . import types
+
+__all__ = ["convolve", "rolling_max", "rolling_mean", "rolling_sum", "stencil"]
+
+__BOUNDARIES = ("constant", "reflect", "replicate", "circular")
+
+
+def convolve(a, v, mode="full", boundary="constant", value=0, stride=1):
+    """
+    Returns the discrete, linear convolution of a DNDarray with a kernel. For one-dimensional inputs this is
+    numpy.convolve, for more dimensions scipy.signal.convolve, with additional boundary modes and strides.
+
+    The kernel is applied to the trailing kernel.ndim axes of a, up to three of them, the leading axes are treated as a
+    batch. If a is split along one of the convolved axes, the processes exchange halos of the kernel extent with their
+    neighbors only, see DNDarray.get_halo(). The result is distributed like a.
+
+    Parameters
+    ----------
+    a : ht.DNDarray
+        The input array
+    v : ht.DNDarray, torch.Tensor or array_like
+        The kernel, with at most three and at most a.ndim dimensions. A split kernel is gathered
+    mode : str, optional
+        'full': the convolution at every point of overlap, i.e. of shape n + k - 1 along each convolved axis.
+        'same': the output has the shape of a, centered with respect to the 'full' output.
+        'valid': the convolution where the kernel overlaps a completely, i.e. of shape n - k + 1.
+        Default is 'full'
+    boundary : str, optional
+        The values assumed beyond the borders of a, one of 'constant' (value), 'reflect' (mirrored at the outermost
+        element, which is not repeated), 'replicate' (the outermost element) or 'circular' (periodic).
+        Default is 'constant'
+    value : scalar, optional
+        The fill value for the 'constant' boundary. Default is 0
+    stride : int or tuple of ints, optional
+        The step between two outputs along each convolved axis. Default is 1
+
+    Returns
+    -------
+    convolved : ht.DNDarray
+        The convolution of a and v, of floating point data type
+
+    Raises
+    ------
+    ValueError
+        If mode or boundary are unknown, the kernel has too many dimensions or is larger than a in 'valid' mode.
+
+    Examples
+    --------
+    >>> ht.convolve(ht.arange(5, split=0), [1, 2, 1])
+    tensor([ 0.,  1.,  4.,  8., 12., 11.,  4.])
+    >>> ht.convolve(ht.arange(5, split=0), [1, 2, 1], mode="same", boundary="circular")
+    tensor([ 5.,  4.,  8., 12., 11.])
+    """
+    if mode not in ("full", "same", "valid"):
+        raise ValueError("mode must be one of 'full', 'same' or 'valid', but was {}".format(mode))
+    kernel = __sanitize_kernel(a, v)
+    kernel = kernel.flip(list(range(kernel.ndim)))
+
+    # the extents of the borders prepended and appended to the convolved axes
+    if mode == "full":
+        pads = [(k - 1, k - 1) for k in kernel.shape]
+    elif mode == "same":
+        pads = [(k // 2, (k - 1) // 2) for k in kernel.shape]
+    else:
+        pads = [(0, 0)] * kernel.ndim
+
+    return __apply(a, kernel, pads, boundary, value, stride)
+
+
+def rolling_max(x, window, axis=None):
+    """
+    Computes the maximum of every window of consecutive elements along an axis. The windows are those fitting into the
+    axis completely, i.e. the result has window - 1 elements less along the axis than x.
+
+    The maxima of all windows are computed in linear time, independent of the window size, from the running maxima of
+    blocks of window elements in forward and in backward direction (van Herk/Gil-Werman). If x is split along the
+    axis, halos of window - 1 elements are exchanged with the neighboring processes only.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The input array
+    window : int
+        The number of elements per window
+    axis : int, optional
+        The axis along which the windows are taken. Defaults to the split axis, or the last axis if x is not split
+
+    Returns
+    -------
+    maxima : ht.DNDarray
+        The maxima of the windows, balanced and split like x
+
+    Examples
+    --------
+    >>> ht.rolling_max(ht.array([3, 1, 4, 1, 5, 9, 2, 6], split=0), 3)
+    tensor([4, 4, 5, 9, 9, 9])
+    """
+    local, windowed, axis = __windows(x, window, axis)
+
+    # running maxima from the start and from the end of every block of window elements, appended by the windows
+    # reaching into the padding that makes the axis a multiple of the window size
+    extent = local.shape[axis]
+    count = max(extent - window + 1, 0)
+    blocks = -(-extent // window)
+    shape = list(local.shape)
+    shape[axis] = blocks * window - extent
+    padded = torch.cat((local, local.new_empty(shape)), axis) if shape[axis] > 0 else local
+    shape[axis : axis + 1] = [blocks, window]
+    padded = padded.reshape(shape)
+    forward = padded.cummax(axis + 1)[0].flatten(axis, axis + 1)
+    backward = padded.flip(axis + 1).cummax(axis + 1)[0].flip(axis + 1).flatten(axis, axis + 1)
+    maxima = torch.max(backward.narrow(axis, 0, count), forward.narrow(axis, window - 1, count))
+
+    return __window_result(maxima, windowed, axis, window, x.dtype, x.split)
+
+
+def rolling_mean(x, window, axis=None):
+    """
+    Computes the mean of every window of consecutive elements along an axis, see rolling_sum().
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The input array
+    window : int
+        The number of elements per window
+    axis : int, optional
+        The axis along which the windows are taken. Defaults to the split axis, or the last axis if x is not split
+
+    Returns
+    -------
+    means : ht.DNDarray
+        The means of the windows, of floating point data type, balanced and split like x
+
+    Examples
+    --------
+    >>> ht.rolling_mean(ht.arange(6, split=0), 4)
+    tensor([1.5000, 2.5000, 3.5000])
+    """
+    sums = rolling_sum(x, window, axis)
+    dtype = types.promote_types(x.dtype, types.float32)
+    sums._DNDarray__array = sums._DNDarray__array.type(dtype.torch_type()) / window
+    sums._DNDarray__dtype = dtype
+
+    return sums
+
+
+def rolling_sum(x, window, axis=None):
+    """
+    Computes the sum of every window of consecutive elements along an axis. The windows are those fitting into the axis
+    completely, i.e. the result has window - 1 elements less along the axis than x.
+
+    The sums of all windows are differences of the prefix sums of the local data, their cost is independent of the
+    window size. Floating point prefix sums are accumulated in double precision. If x is split along the axis, halos of
+    window - 1 elements are exchanged with the neighboring processes only.
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The input array
+    window : int
+        The number of elements per window
+    axis : int, optional
+        The axis along which the windows are taken. Defaults to the split axis, or the last axis if x is not split
+
+    Returns
+    -------
+    sums : ht.DNDarray
+        The sums of the windows, balanced and split like x
+
+    Examples
+    --------
+    >>> ht.rolling_sum(ht.arange(6, split=0), 4)
+    tensor([ 6, 10, 14])
+    """
+    local, windowed, axis = __windows(x, window, axis)
+
+    # the sums of bool and integer values are integers like in sum()
+    dtype = x.dtype
+    if dtype is types.bool or types.heat_type_is_exact(dtype):
+        dtype = types.promote_types(dtype, types.int64)
+        accumulator = torch.int64
+    else:
+        accumulator = torch.float64
+    shape = list(local.shape)
+    shape[axis] = 1
+    prefix = local.cumsum(axis, dtype=accumulator)
+    prefix = torch.cat((prefix.new_zeros(shape), prefix), axis)
+    count = max(local.shape[axis] - window + 1, 0)
+    sums = prefix.narrow(axis, window, count) - prefix.narrow(axis, 0, count)
+
+    return __window_result(sums.type(dtype.torch_type()), windowed, axis, window, dtype, x.split)
+
+
+def stencil(x, kernel, boundary="constant", value=0, stride=1):
+    """
+    Applies a stencil, i.e. the weighted sum of the neighborhood of every element, to a DNDarray. The weights are given
+    as a kernel centered on the element, its element kernel[k // 2] is the weight of the element itself. Unlike
+    convolve(), the kernel is not flipped and the output has the shape of x (divided by the stride).
+
+    The kernel is applied to the trailing kernel.ndim axes of x, up to three of them. If x is split along one of them,
+    halos of kernel_size // 2 elements are exchanged with the neighboring processes only, see DNDarray.get_halo().
+
+    Parameters
+    ----------
+    x : ht.DNDarray
+        The input array
+    kernel : ht.DNDarray, torch.Tensor or array_like
+        The weights of the neighborhood, with at most three and at most x.ndim dimensions
+    boundary : str, optional
+        The values assumed beyond the borders of x, one of 'constant', 'reflect', 'replicate' or 'circular', see
+        convolve(). Default is 'constant'
+    value : scalar, optional
+        The fill value for the 'constant' boundary. Default is 0
+    stride : int or tuple of ints, optional
+        The step between two outputs along each axis of the kernel. Default is 1
+
+    Returns
+    -------
+    result : ht.DNDarray
+        The stencil applied to x, of floating point data type
+
+    Examples
+    --------
+    >>> x = ht.arange(6, dtype=ht.float32, split=0) ** 2
+    >>> ht.stencil(x, [1, -2, 1], boundary="replicate")  # second differences
+    tensor([1., 2., 2., 2., 2., -9.])
+    """
+    kernel = __sanitize_kernel(x, kernel)
+    pads = [(k // 2, (k - 1) // 2) for k in kernel.shape]
+
+    return __apply(x, kernel, pads, boundary, value, stride)
+
+
+def __sanitize_kernel(x, kernel):
+    """
+    Checks the input array and converts the kernel into a process-local tensor on the device of x.
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if isinstance(kernel, dndarray.DNDarray):
+        kernel = manipulations.resplit(kernel, None)._DNDarray__array
+    elif not isinstance(kernel, torch.Tensor):
+        kernel = factories.array(kernel, device=x.device)._DNDarray__array
+
+    if not 0 < kernel.ndim <= min(x.ndim, 3):
+        raise ValueError(
+            "kernel must have between 1 and {} dimensions, but had {}".format(
+                min(x.ndim, 3), kernel.ndim
+            )
+        )
+    if kernel.numel() == 0:
+        raise ValueError("kernel must not be empty")
+
+    return kernel.to(x.device.torch_device)
+
+
+def __apply(x, kernel, pads, boundary, value, stride):
+    """
+    Correlates x with the kernel along its trailing axes. The convolved axes are padded with pads[i] = (before, after)
+    boundary elements, the outputs are the positions of the kernel within the padded axes, in steps of stride.
+
+    Along the split axis, every process computes the outputs starting within its chunk of the padded axis. Its
+    neighbors provide the missing elements as halos, only the first and the last process pad the axis.
+    """
+    if boundary not in __BOUNDARIES:
+        raise ValueError(
+            "boundary must be one of {}, but was {}".format(", ".join(__BOUNDARIES), boundary)
+        )
+    strides = (stride,) * kernel.ndim if isinstance(stride, int) else tuple(stride)
+    if len(strides) != kernel.ndim or not all(isinstance(s, int) and s > 0 for s in strides):
+        raise ValueError("stride must be a positive int per kernel axis, but was {}".format(stride))
+
+    offset = x.ndim - kernel.ndim
+    axes = list(range(offset, x.ndim))
+    totals = []
+    for axis, k, (before, after) in zip(axes, kernel.shape, pads):
+        total = x.gshape[axis] + before + after - k + 1
+        if total <= 0:
+            raise ValueError(
+                "kernel of extent {} is larger than axis {} of extent {}".format(
+                    k, axis, x.gshape[axis]
+                )
+            )
+        if boundary == "reflect" and max(before, after) >= x.gshape[axis]:
+            raise ValueError(
+                "reflect boundary of {} elements requires more elements along axis {}".format(
+                    max(before, after), axis
+                )
+            )
+        totals.append(total)
+
+    dtype = types.promote_types(x.dtype, types.canonical_heat_type(kernel.dtype))
+    dtype = types.promote_types(dtype, types.float32)
+    kernel = kernel.type(dtype.torch_type())
+
+    split = x.split
+    distributed = x.is_distributed() and split in axes
+    if distributed:
+        index = split - offset
+        before, after = pads[index]
+        k = kernel.shape[index]
+        # halos of the elements preceding and succeeding the chunk that the outputs starting in it need, the first and
+        # the last process additionally need elements of their own or, if circular, of the other end for the boundary
+        halos = (before, k - 1 - before)
+        required = {
+            "constant": (0, 0),
+            "reflect": (before + (before > 0), after + (after > 0)),
+            "replicate": (int(before > 0), int(after > 0)),
+            "circular": (after, before),
+        }[boundary]
+        if not __chunks_suffice(x, halos, required):
+            x = x.copy()
+            x.balance_()
+        if not __chunks_suffice(x, halos, required):
+            # too many processes for the extent of the axis, it is processed as a whole by every process instead
+            x = manipulations.resplit(x, None)
+            distributed = False
+        else:
+            x.get_halo(halos)
+
+    local = x._DNDarray__array.type(dtype.torch_type())
+    if local.ndim != x.ndim:
+        # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+        shape = list(x.gshape)
+        shape[split] = 0
+        local = local.reshape(shape)
+
+    # the split axis is extended first, the halos are not padded along the other axes
+    for index, axis in sorted(enumerate(axes), key=lambda item: item[1] != split):
+        before, after = pads[index]
+        if axis != split or not distributed:
+            local = torch.cat(
+                [
+                    __boundary(local, axis, before, boundary, value, True),
+                    local,
+                    __boundary(local, axis, after, boundary, value, False),
+                ],
+                axis,
+            )
+            continue
+
+        # split axis, the chunk is extended by the halos of the neighbors and by the boundary at the ends
+        rank, size = x.comm.rank, x.comm.size
+        torch_type = dtype.torch_type()
+        blocks = [x.halo_prev, x.halo_next]
+        blocks = [block if block is None else block.type(torch_type) for block in blocks]
+        blocks.insert(1, local)
+        if rank == 0:
+            blocks[0] = __boundary(local, axis, before, boundary, value, True)
+        if rank == size - 1:
+            blocks[2] = __boundary(local, axis, after, boundary, value, False)
+        if boundary == "circular":
+            blocks = __wrap(x, local, axis, before, after, blocks)
+        local = torch.cat([block for block in blocks if block is not None], axis)
+
+        # the outputs starting in the chunk, aligned to the stride, the last process also owns those of the boundary
+        start = x.create_lshape_map()[:rank, split].sum().item()
+        end = start + x.lshape[split] if rank < size - 1 else totals[index]
+        end = min(end, totals[index])
+        first = start + (-start) % strides[index]
+        count = max((end - first - 1) // strides[index] + 1, 0)
+        length = (count - 1) * strides[index] + k if count > 0 else 0
+        local = local.narrow(axis, first - start, length) if count > 0 else local.narrow(axis, 0, 0)
+
+    # the leading axes are a batch of a single channel
+    batch = local.shape[:offset]
+    local = local.reshape((batch.numel(), 1) + tuple(local.shape[offset:]))
+    convolution = (
+        torch.nn.functional.conv1d,
+        torch.nn.functional.conv2d,
+        torch.nn.functional.conv3d,
+    )[kernel.ndim - 1]
+    if all(extent >= k for extent, k in zip(local.shape[2:], kernel.shape)):
+        result = convolution(local, kernel.reshape((1, 1) + kernel.shape), stride=strides)
+    else:
+        shape = [
+            max((extent - k) // s + 1, 0)
+            for extent, k, s in zip(local.shape[2:], kernel.shape, strides)
+        ]
+        result = local.new_empty([local.shape[0], 1] + shape)
+    result = result.reshape(tuple(batch) + tuple(result.shape[2:]))
+
+    gshape = x.gshape[:offset] + tuple(
+        (total - 1) // s + 1 for total, s in zip(totals, strides)
+    )
+
+    result = dndarray.DNDarray(result, gshape, dtype, x.split, x.device, x.comm)
+    if result.split != split:
+        result.resplit_(split)
+
+    return result
+
+
+def __chunks_suffice(x, halos, required):
+    """
+    Checks whether all chunks of x along the split axis can provide the halos and whether the first and the last chunk
+    hold the required number of elements for the boundary.
+    """
+    counts = x.create_lshape_map()[:, x.split].tolist()
+    return min(counts) >= max(halos) and counts[0] >= required[0] and counts[-1] >= required[1]
+
+
+def __windows(x, window, axis, strict=True):
+    """
+    Returns the process-local data of x extended along the axis by the halo of the window - 1 following elements, i.e.
+    holding all windows that start within the local chunk, together with the possibly redistributed x and the
+    sanitized axis. Chunks too small for the halo are balanced first and, if still too small, the axis is gathered.
+    Windows larger than the axis are an error if strict, otherwise there are no windows at all.
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if not isinstance(window, int) or window < 1:
+        raise ValueError("window must be a positive int, but was {}".format(window))
+    axis = stride_tricks.sanitize_axis(x.gshape, axis if axis is not None else x.split)
+    if axis is None:
+        axis = x.ndim - 1
+    if strict and window > x.gshape[axis]:
+        raise ValueError(
+            "window of {} elements is larger than axis {} of extent {}".format(
+                window, axis, x.gshape[axis]
+            )
+        )
+
+    halo = window - 1
+    if x.is_distributed() and x.split == axis and halo > 0:
+        if not __chunks_suffice(x, (0, halo), (0, 0)):
+            x = x.copy()
+            x.balance_()
+        if not __chunks_suffice(x, (0, halo), (0, 0)):
+            x = manipulations.resplit(x, None)
+        else:
+            x.get_halo((0, halo))
+            return x.array_with_halos, x, axis
+
+    local = x._DNDarray__array
+    if local.ndim != x.ndim:
+        # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+        shape = list(x.gshape)
+        shape[x.split] = 0
+        local = local.reshape(shape)
+
+    return local, x, axis
+
+
+def __window_result(result, x, axis, window, dtype, split):
+    """
+    Wraps the results of the windows starting within the local chunks of x into a balanced DNDarray of the given split.
+    """
+    gshape = list(x.gshape)
+    gshape[axis] = max(gshape[axis] - window + 1, 0)
+    result = dndarray.DNDarray(result, tuple(gshape), dtype, x.split, x.device, x.comm)
+    if result.split != split:
+        result.resplit_(split)
+    elif split == axis:
+        result.balance_()
+
+    return result
+
+
+def __boundary(tensor, axis, width, boundary, value, head):
+    """
+    Returns the boundary of the given width preceding (head) or succeeding the tensor along the axis.
+    """
+    extent = tensor.shape[axis]
+    if boundary == "constant" or width == 0:
+        shape = list(tensor.shape)
+        shape[axis] = width
+        return tensor.new_full(shape, value)
+    if boundary == "replicate":
+        shape = list(tensor.shape)
+        shape[axis] = width
+        return tensor.narrow(axis, 0 if head else extent - 1, 1).expand(shape)
+    if boundary == "reflect":
+        return tensor.narrow(axis, 1 if head else extent - 1 - width, width).flip(axis)
+    # circular, the axis is repeated as often as required
+    indices = torch.arange(-width, 0) if head else torch.arange(width)
+    return tensor.index_select(axis, (indices % extent).to(tensor.device))
+
+
+def __wrap(x, local, axis, before, after, blocks):
+    """
+    Exchanges the elements wrapped around the ends of the split axis between the first and the last process.
+    """
+    comm, rank, last = x.comm, x.comm.rank, x.comm.size - 1
+    requests = []
+    if rank == 0 and after > 0:
+        requests.append(comm.Isend(local.narrow(axis, 0, after).contiguous(), dest=last))
+    if rank == last and before > 0:
+        requests.append(
+            comm.Isend(local.narrow(axis, local.shape[axis] - before, before).contiguous(), dest=0)
+        )
+    if rank == 0 and before > 0:
+        blocks[0] = torch.empty_like(blocks[0])
+        comm.Recv(blocks[0], source=last)
+    if rank == last and after > 0:
+        blocks[2] = torch.empty_like(blocks[2])
+        comm.Recv(blocks[2], source=0)
+    for request in requests:
+        request.Wait()
+
+    return blocks
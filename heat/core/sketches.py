@@ -0,0 +1,249 @@
+"""
+Mergeable sketches summarizing large or streamed data in a small, fixed amount of memory.
+"""
+
+import torch
+
+from . import communication
+from . import dndarray
+
+__all__ = ["QuantileSketch"]
+
+
+class QuantileSketch:
+    """
+    Approximate quantile sketch in the spirit of KLL. The items are kept in a hierarchy of compactors, an item on level
+    h represents 2**h items of the input. A level exceeding the capacity is compacted by sorting it and promoting every
+    other item to the next level. The rank error of a quantile is of the order of log2(n / capacity) / capacity.
+
+    Sketches are built process-locally in a single pass over the data. They can be updated with any number of batches,
+    e.g. chunks of a file read one after another, merged locally with merge() and merged across all processes with
+    allmerge(), which exchanges their compact serialized form only.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The maximum number of items per level, controls the accuracy and the size of the sketch.
+        Default is 2048
+    comm : Communication, optional
+        The communicator used by allmerge(), defaults to the one of the first DNDarray passed to update() or to the
+        global default.
+
+    Examples
+    --------
+    >>> sketch = ht.QuantileSketch()
+    >>> for batch in range(10):
+    ...     sketch.update(ht.load_hdf5("data.h5", "batch{}".format(batch), split=0))
+    >>> sketch.allmerge().percentile([50.0, 99.0])
+    tensor([ 0.0012,  2.3281], dtype=torch.float64)
+    """
+
+    def __init__(self, capacity=2048, comm=None):
+        if not isinstance(capacity, int) or capacity < 2:
+            raise ValueError("capacity must be an int larger than 1, but was {}".format(capacity))
+
+        self.capacity = capacity
+        self.comm = comm
+        self.__levels = []
+        # alternating offset of the items promoted during a compaction, deterministic on all processes
+        self.__parity = 0
+
+    @property
+    def count(self):
+        """
+        The number of items summarized by the sketch.
+        """
+        return sum(level.numel() << height for height, level in enumerate(self.__levels))
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes of the serialized sketch.
+        """
+        return 16 * sum(level.numel() for level in self.__levels)
+
+    def update(self, x):
+        """
+        Adds the process-local elements of x to the sketch.
+
+        Parameters
+        ----------
+        x : ht.DNDarray or torch.Tensor
+            The data, for a DNDarray only the process-local chunk is added
+
+        Returns
+        -------
+        sketch : QuantileSketch
+            The updated sketch itself
+        """
+        if isinstance(x, dndarray.DNDarray):
+            if self.comm is None:
+                self.comm = x.comm
+            x = x._DNDarray__array
+        elif not isinstance(x, torch.Tensor):
+            raise TypeError("expected a DNDarray or torch.Tensor, but was {}".format(type(x)))
+
+        # the data is added in slices of at most the capacity, only these are copied, converted and sorted at a time
+        x = x.detach()
+        x = x.reshape(-1) if x.is_contiguous() or x.ndim < 2 else x
+        rows = max(1, self.capacity // max(1, x[0].numel())) if x.numel() > 0 else 1
+        for batch in torch.split(x, rows):
+            batch = batch.reshape(-1)
+            for start in range(0, batch.numel(), self.capacity):
+                items = batch[start : start + self.capacity]
+                self.__insert(0, items.cpu().type(torch.float64))
+
+        return self
+
+    def merge(self, other):
+        """
+        Merges another sketch into this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            The sketch to merge
+
+        Returns
+        -------
+        sketch : QuantileSketch
+            The merged sketch itself
+        """
+        if not isinstance(other, QuantileSketch):
+            raise TypeError("expected a QuantileSketch, but was {}".format(type(other)))
+
+        for height, level in enumerate(other.__levels):
+            self.__insert(height, level)
+
+        return self
+
+    def allmerge(self):
+        """
+        Merges the sketches of all processes. The serialized sketches are gathered on all processes and merged there,
+        the result is identical on all processes.
+
+        Returns
+        -------
+        sketch : QuantileSketch
+            A new sketch summarizing the data of all processes
+        """
+        comm = communication.sanitize_comm(self.comm)
+        serialized = self.serialize()
+
+        counts = torch.empty((comm.size,), dtype=torch.int64)
+        comm.Allgather(torch.tensor([serialized.shape[0]]), counts)
+        counts = counts.tolist()
+        displs = [sum(counts[:rank]) for rank in range(comm.size)]
+        gathered = torch.empty((sum(counts), 2), dtype=torch.float64)
+        comm.Allgatherv(serialized, (gathered, counts, displs))
+
+        merged = QuantileSketch(self.capacity, comm)
+        for rank in range(comm.size):
+            serialized = gathered[displs[rank] : displs[rank] + counts[rank]]
+            merged.merge(QuantileSketch.deserialize(serialized, self.capacity))
+
+        return merged
+
+    def serialize(self):
+        """
+        Compact serialized form of the sketch, a tensor of (value, level) pairs.
+
+        Returns
+        -------
+        serialized : torch.Tensor
+            Tensor of shape (n, 2) and type float64
+        """
+        if not self.__levels:
+            return torch.empty((0, 2), dtype=torch.float64)
+
+        return torch.cat(
+            [
+                torch.stack([level, torch.full_like(level, height)], dim=1)
+                for height, level in enumerate(self.__levels)
+            ]
+        )
+
+    @classmethod
+    def deserialize(cls, serialized, capacity=2048, comm=None):
+        """
+        Restores a sketch from its serialized form, see serialize().
+
+        Parameters
+        ----------
+        serialized : torch.Tensor
+            The serialized sketch
+        capacity : int, optional
+            The maximum number of items per level
+        comm : Communication, optional
+            The communicator used by allmerge()
+
+        Returns
+        -------
+        sketch : QuantileSketch
+            The restored sketch
+        """
+        sketch = cls(capacity, comm)
+        heights = serialized[:, 1].type(torch.int64)
+        for height in range(int(heights.max().item()) + 1 if heights.numel() else 0):
+            sketch.__insert(height, serialized[heights == height, 0])
+
+        return sketch
+
+    def percentile(self, q):
+        """
+        Approximate percentiles of the summarized data.
+
+        Parameters
+        ----------
+        q : scalar or list of scalars or torch.Tensor
+            Percentile or sequence of percentiles to compute, must belong to the interval [0, 100].
+
+        Returns
+        -------
+        percentiles : torch.Tensor
+            Tensor of type float64 holding one element per percentile, NaN if the sketch is empty
+        """
+        q = torch.as_tensor(q, dtype=torch.float64).reshape(-1)
+        if self.count == 0:
+            return torch.full(q.shape, float("nan"), dtype=torch.float64)
+
+        values = torch.cat(self.__levels)
+        weights = torch.cat(
+            [torch.full_like(level, 2 ** height) for height, level in enumerate(self.__levels)]
+        )
+        values, order = torch.sort(values)
+        cumulative = torch.cumsum(weights[order], dim=0)
+
+        # the item covering the rank of each percentile
+        ranks = q / 100 * (self.count - 1)
+        positions = (cumulative.unsqueeze(0) <= ranks.unsqueeze(1)).sum(dim=1)
+
+        return values[positions.clamp(max=values.numel() - 1)]
+
+    def __insert(self, height, items):
+        """
+        Adds items to a level and compacts all levels exceeding the capacity.
+        """
+        while len(self.__levels) <= height:
+            self.__levels.append(torch.empty((0,), dtype=torch.float64))
+        self.__levels[height] = torch.cat([self.__levels[height], items])
+
+        while height < len(self.__levels):
+            level = self.__levels[height]
+            if level.numel() > self.capacity:
+                level, _ = torch.sort(level)
+                # an odd item stays on its level, hence the total weight is preserved
+                even = level.numel() - level.numel() % 2
+                promoted = level[self.__parity : even : 2]
+                self.__parity = 1 - self.__parity
+                self.__levels[height] = level[even:]
+                if height + 1 == len(self.__levels):
+                    self.__levels.append(promoted)
+                else:
+                    self.__levels[height + 1] = torch.cat([self.__levels[height + 1], promoted])
+            height += 1
+
+    def __repr__(self):
+        return "QuantileSketch(capacity={}, count={}, nbytes={})".format(
+            self.capacity, self.count, self.nbytes
+        )
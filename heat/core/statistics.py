@@ -9,6 +9,7 @@ from . import factories
 from . import linalg
 from . import manipulations
 from . import operations
+from . import sketches
 from . import dndarray
 from . import types
 from . import stride_tricks
@@ -27,12 +28,29 @@ __all__ = [
     "median",
     "min",
     "minimum",
+    "moments",
     "percentile",
     "skew",
     "std",
     "var",
 ]
 
+# number of elements per block in the single-pass computation of moments, a block should fit into the cache
+__MOMENTS_BLOCK_SIZE = 2 ** 20
+
+# predefined MPI (value, int) pair types used with MPI_MAXLOC and MPI_MINLOC and the numpy type of their values
+__MPI_ARG_PAIR_TYPES = {
+    torch.uint8: (MPI.TWOINT, np.int32),
+    torch.int8: (MPI.TWOINT, np.int32),
+    torch.int16: (MPI.TWOINT, np.int32),
+    torch.int32: (MPI.TWOINT, np.int32),
+    torch.int64: (MPI.LONG_INT, np.int64),
+    torch.float32: (MPI.DOUBLE_INT, np.float64),
+    torch.float64: (MPI.DOUBLE_INT, np.float64),
+}
+# pair of doubles, MPI_ARGMAX and MPI_ARGMIN are applied to whole (value, index) pairs
+__MPI_DOUBLE_PAIR = MPI.DOUBLE.Create_contiguous(2).Commit()
+
 
 def argmax(x, axis=None, out=None, **kwargs):
     """
@@ -72,66 +90,7 @@ def argmax(x, axis=None, out=None, **kwargs):
             [0]])
     """
 
-    def local_argmax(*args, **kwargs):
-        axis = kwargs.get("dim", -1)
-        shape = x.shape
-
-        # case where the argmax axis is set to None
-        # argmax will be the flattened index, computed standalone and the actual maximum value obtain separately
-        if len(args) <= 1 and axis < 0:
-            indices = torch.argmax(*args, **kwargs).reshape(1)
-            maxima = args[0].flatten()[indices]
-            # artificially flatten the input tensor shape to correct the offset computation
-            axis = 0
-            shape = [np.prod(shape)]
-        # usual case where indices and maximum values are both returned. Axis is not equal to None
-        else:
-            maxima, indices = torch.max(*args, **kwargs)
-
-        # add offset of data chunks if reduction is computed across split axis
-        if axis == x.split:
-            offset, _, _ = x.comm.chunk(shape, x.split)
-            indices += torch.tensor(offset, dtype=indices.dtype)
-
-        return torch.cat([maxima.double(), indices.double()])
-
-    # axis sanitation
-    if axis is not None and not isinstance(axis, int):
-        raise TypeError("axis must be None or int, but was {}".format(type(axis)))
-
-    # perform the global reduction
-    smallest_value = -constants.sanitize_infinity(x._DNDarray__array.dtype)
-    reduced_result = operations.__reduce_op(
-        x, local_argmax, MPI_ARGMAX, axis=axis, out=None, neutral=smallest_value, **kwargs
-    )
-
-    # correct the tensor
-    reduced_result._DNDarray__array = reduced_result._DNDarray__array.chunk(2)[-1].type(torch.int64)
-    reduced_result._DNDarray__dtype = types.int64
-
-    # address lshape/gshape mismatch when axis is 0
-    if axis is not None:
-        if isinstance(axis, int):
-            axis = (axis,)
-        if 0 in axis:
-            reduced_result._DNDarray__gshape = (1,) + reduced_result._DNDarray__gshape
-            if not kwargs.get("keepdim"):
-                reduced_result = reduced_result.squeeze(axis=0)
-
-    # set out parameter correctly, i.e. set the storage correctly
-    if out is not None:
-        if out.shape != reduced_result.shape:
-            raise ValueError(
-                "Expecting output buffer of shape {}, got {}".format(
-                    reduced_result.shape, out.shape
-                )
-            )
-        out._DNDarray__array.storage().copy_(reduced_result._DNDarray__array.storage())
-        out._DNDarray__array = out._DNDarray__array.type(torch.int64)
-        out._DNDarray__dtype = types.int64
-        return out
-
-    return reduced_result
+    return __arg_reduce(x, axis, out, kwargs.get("keepdim"), largest=True)
 
 
 def argmin(x, axis=None, out=None, **kwargs):
@@ -172,67 +131,121 @@ def argmin(x, axis=None, out=None, **kwargs):
             [2]])
     """
 
-    def local_argmin(*args, **kwargs):
-        axis = kwargs.get("dim", -1)
-        shape = x.shape
+    return __arg_reduce(x, axis, out, kwargs.get("keepdim"), largest=False)
 
-        # case where the argmin axis is set to None
-        # argmin will be the flattened index, computed standalone and the actual minimum value obtain separately
-        if len(args) <= 1 and axis < 0:
-            indices = torch.argmin(*args, **kwargs).reshape(1)
-            minimums = args[0].flatten()[indices]
 
-            # artificially flatten the input tensor shape to correct the offset computation
-            axis = 0
-            shape = [np.prod(shape)]
-        # usual case where indices and minimum values are both returned. Axis is not equal to None
-        else:
-            minimums, indices = torch.min(*args, **kwargs)
-
-        # add offset of data chunks if reduction is computed across split axis
-        if axis == x.split:
-            offset, _, _ = x.comm.chunk(shape, x.split)
-            indices += torch.tensor(offset, dtype=indices.dtype)
-
-        return torch.cat([minimums.double(), indices.double()])
-
-    # axis sanitation
+def __arg_reduce(x, axis, out, keepdim, largest):
+    """
+    Indices of the maxima (largest=True) or of the minima of x along an axis. The process-local extrema are determined
+    along with their global indices. If the axis is the split axis, the (value, index) pairs of all processes are
+    combined with a single Allreduce, see __allreduce_arg(). Ties are resolved in favor of the smaller index and NaN
+    values are extremal.
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
     if axis is not None and not isinstance(axis, int):
         raise TypeError("axis must be None or int, but was {}".format(type(axis)))
+    axis = stride_tricks.sanitize_axis(x.shape, axis)
 
-    # perform the global reduction
-    largest_value = constants.sanitize_infinity(x._DNDarray__array.dtype)
-    reduced_result = operations.__reduce_op(
-        x, local_argmin, MPI_ARGMIN, axis=axis, out=None, neutral=largest_value, **kwargs
-    )
+    local = x._DNDarray__array
+    dim = 0 if axis is None else axis
+    data = local.reshape(-1) if axis is None else local
+    distributed = x.split is not None and (axis is None or axis == x.split)
+    if distributed:
+        # the chunks are not necessarily balanced, e.g. after slicing, the actual local shapes determine the offset
+        offset = x.create_lshape_map()[: x.comm.rank, x.split].sum().item()
+
+    if data.numel() == 0:
+        # no local data, the neutral element with an out-of-range index loses all comparisons and ties
+        shape = data.shape[:dim] + data.shape[dim + 1 :]
+        if distributed and axis is not None:
+            # empty chunks, e.g. after slicing, do not necessarily retain the dimensions of the global shape
+            shape = x.gshape[:axis] + x.gshape[axis + 1 :]
+        if local.is_floating_point():
+            neutral = -float("inf") if largest else float("inf")
+        else:
+            neutral = torch.iinfo(local.dtype).min if largest else torch.iinfo(local.dtype).max
+        values = torch.full(shape, neutral, dtype=local.dtype, device=local.device)
+        indices = torch.full(shape, x.gnumel, dtype=torch.int64, device=local.device)
+    else:
+        values, indices = torch.max(data, dim=dim) if largest else torch.min(data, dim=dim)
+        if distributed:
+            if axis is None:
+                # translate the flattened local index into a flattened global one
+                position = list(np.unravel_index(indices.item(), local.shape))
+                position[x.split] += offset
+                indices.fill_(int(np.ravel_multi_index(position, x.gshape)))
+            else:
+                indices += offset
 
-    # correct the tensor
-    reduced_result._DNDarray__array = reduced_result._DNDarray__array.chunk(2)[-1].type(torch.int64)
-    reduced_result._DNDarray__dtype = types.int64
+    if distributed and x.comm.is_distributed():
+        indices = __allreduce_arg(x.comm, values, indices, largest, x.gnumel)
 
-    # address lshape/gshape mismatch when axis is 0
-    if axis is not None:
-        if isinstance(axis, int):
-            axis = (axis,)
-        if 0 in axis:
-            reduced_result._DNDarray__gshape = (1,) + reduced_result._DNDarray__gshape
-            if not kwargs.get("keepdim"):
-                reduced_result = reduced_result.squeeze(axis=0)
+    # determine the global shape and split axis of the result
+    if axis is None:
+        indices = indices.reshape(1)
+        gshape, split = (1,), None
+    elif keepdim:
+        indices = indices.unsqueeze(axis)
+        gshape = x.gshape[:axis] + (1,) + x.gshape[axis + 1 :]
+        split = None if axis == x.split else x.split
+    else:
+        gshape = x.gshape[:axis] + x.gshape[axis + 1 :]
+        split = x.split
+        if split is not None and axis <= split:
+            split = None if axis == split else split - 1
 
-    # set out parameter correctly, i.e. set the storage correctly
     if out is not None:
-        if out.shape != reduced_result.shape:
+        if out.shape != gshape:
             raise ValueError(
-                "Expecting output buffer of shape {}, got {}".format(
-                    reduced_result.shape, out.shape
-                )
+                "Expecting output buffer of shape {}, got {}".format(gshape, out.shape)
             )
-        out._DNDarray__array.storage().copy_(reduced_result._DNDarray__array.storage())
-        out._DNDarray__array = out._DNDarray__array.type(torch.int64)
+        out._DNDarray__array = indices
         out._DNDarray__dtype = types.int64
+        out._DNDarray__split = split
+        out._DNDarray__device = x.device
+        out._DNDarray__comm = x.comm
         return out
 
-    return reduced_result
+    return dndarray.DNDarray(indices, gshape, types.int64, split, x.device, x.comm)
+
+
+def __allreduce_arg(comm, values, indices, largest, index_bound):
+    """
+    Combines the process-local extrema and their global indices into the global ones with a single Allreduce of packed
+    (value, index) pairs. Values of up to 64 bits with indices representable as 32 bit integers are reduced with the
+    builtin MPI_MAXLOC or MPI_MINLOC operation on a predefined MPI pair type. All others are packed into pairs of
+    doubles and reduced with the vectorized MPI_ARGMAX or MPI_ARGMIN operation.
+    """
+    pair_type = __MPI_ARG_PAIR_TYPES.get(values.dtype)
+
+    if pair_type is not None and index_bound <= np.iinfo(np.int32).max:
+        mpi_type, value_type = pair_type
+        packed = np.empty(
+            values.numel(), dtype=np.dtype([("value", value_type), ("index", np.int32)], align=True)
+        )
+        if values.is_floating_point():
+            # MPI_MAXLOC and MPI_MINLOC do not order NaN, they are mapped to infinity, infinite values of the input to
+            # the largest finite magnitude of the packed type
+            sign = 1.0 if largest else -1.0
+            bound = np.finfo(np.float64).max if values.dtype == torch.float64 else 2.0 ** 200
+            values = values.double()
+            extreme = torch.isinf(values) & ((values > 0) == largest)
+            values = values.masked_fill(extreme, sign * bound)
+            values = values.masked_fill(torch.isnan(values), sign * float("inf"))
+        packed["value"] = values.cpu().numpy().reshape(-1)
+        packed["index"] = indices.cpu().numpy().reshape(-1)
+        comm.Allreduce(MPI.IN_PLACE, [packed, mpi_type], MPI.MAXLOC if largest else MPI.MINLOC)
+
+        return torch.from_numpy(packed["index"].astype(np.int64)).reshape(indices.shape).to(
+            indices.device
+        )
+
+    packed = torch.stack([values.double().reshape(-1), indices.double().reshape(-1)], dim=1).cpu()
+    op = MPI_ARGMAX if largest else MPI_ARGMIN
+    comm.Allreduce(MPI.IN_PLACE, [packed.numpy(), packed.shape[0], __MPI_DOUBLE_PAIR], op)
+
+    return packed[:, 1].type(torch.int64).reshape(indices.shape).to(indices.device)
 
 
 def average(x, axis=None, weights=None, returned=False):
@@ -472,15 +485,8 @@ def kurtosis(x, axis=None, unbiased=True, Fischer=True):
         function as data is transferred between processes
     """
     if axis is None or (isinstance(axis, int) and x.split == axis):  # no axis given
-        # TODO: determine if this is a valid (and fast implementation)
-        mu = mean(x, axis=axis)
-        if axis is not None and axis > 0:
-            mu = mu.expand_dims(axis)
-        diff = x - mu
+        _, m2, _, m4 = moments(x, axis=axis, order=4)
         n = float(x.shape[axis]) if axis is not None else x.gnumel
-
-        m4 = arithmetics.sum(arithmetics.pow(diff, 4.0), axis) / n
-        m2 = arithmetics.sum(arithmetics.pow(diff, 2.0), axis) / n
         res = m4 / arithmetics.pow(m2, 2.0)
         if unbiased:
             res = ((n - 1.0) / ((n - 2.0) * (n - 3.0))) * ((n + 1.0) * res - 3 * (n - 1.0)) + 3.0
@@ -493,7 +499,7 @@ def kurtosis(x, axis=None, unbiased=True, Fischer=True):
         return __moment_w_axis(__torch_kurtosis, x, axis, None, unbiased, Fischer)
 
 
-def max(x, axis=None, out=None, keepdim=None):
+def max(x, axis=None, out=None, keepdim=None, async_op=False):
     # TODO: initial : scalar, optional Issue #101
     """
     Return the maximum along a given axis.
@@ -512,6 +518,9 @@ def max(x, axis=None, out=None, keepdim=None):
     keepdim : bool, optional
         If this is set to True, the axes which are reduced are left in the result as dimensions with size one.
         With this option, the result will broadcast correctly against the original arr.
+    async_op : bool, optional
+        If True, the global reduction is performed with a non-blocking collective operation and a pending DNDarray is
+        returned. The reduction is completed on the first access to the data of the result. Default: False
 
     Returns
     -------
@@ -545,13 +554,21 @@ def max(x, axis=None, out=None, keepdim=None):
 
     smallest_value = -constants.sanitize_infinity(x._DNDarray__array.dtype)
     return operations.__reduce_op(
-        x, local_max, MPI.MAX, axis=axis, out=out, neutral=smallest_value, keepdim=keepdim
+        x,
+        local_max,
+        MPI.MAX,
+        axis=axis,
+        out=out,
+        neutral=smallest_value,
+        keepdim=keepdim,
+        async_op=async_op,
     )
 
 
 def maximum(x1, x2, out=None):
     """
     Compares two tensors and returns a new tensor containing the element-wise maxima.
+    The result is distributed like the operands, equally split operands are compared without any communication.
     If one of the elements being compared is a NaN, then that element is returned. TODO: Check this: If both elements are NaNs then the first is returned.
     The latter distinction is important for complex NaNs, which are defined as at least one of the real or imaginary parts being a NaN. The net effect is that NaNs are propagated.
 
@@ -563,8 +580,8 @@ def maximum(x1, x2, out=None):
             For broadcasting semantics, see: https://pytorch.org/docs/stable/notes/broadcasting.html
 
     out : ht.DNDarray or None, optional
-        A location into which the result is stored. If provided, it must have a shape that the inputs broadcast to.
-        If not provided or None, a freshly-allocated tensor is returned.
+        A location into which the result is stored. If provided, it must have the shape that the inputs broadcast to
+        and the split axis of the result. If not provided or None, a freshly-allocated tensor is returned.
 
     Returns:
     --------
@@ -619,80 +636,16 @@ def maximum(x1, x2, out=None):
     >>> ht.maximum(a, d)
     ValueError: operands could not be broadcast, input shapes (3, 4) (3, 4, 5)
     """
-    # perform sanitation
     if not isinstance(x1, dndarray.DNDarray) or not isinstance(x2, dndarray.DNDarray):
         raise TypeError(
             "expected x1 and x2 to be a ht.DNDarray, but were {}, {} ".format(type(x1), type(x2))
         )
-    if out is not None and not isinstance(out, dndarray.DNDarray):
-        raise TypeError("expected out to be None or an ht.DNDarray, but was {}".format(type(out)))
-
-    # apply split semantics
-    if x1.split is not None or x2.split is not None:
-        if x1.split is None:
-            x1.resplit_(x2.split)
-        if x2.split is None:
-            x2.resplit_(x1.split)
-        if x1.split != x2.split:
-            if np.prod(x1.gshape) < np.prod(x2.gshape):
-                x1.resplit_(x2.split)
-            if np.prod(x2.gshape) < np.prod(x1.gshape):
-                x2.resplit_(x1.split)
-            else:
-                if x1.split < x2.split:
-                    x2.resplit_(x1.split)
-                else:
-                    x1.resplit_(x2.split)
-        split = x1.split
-    else:
-        split = None
-
-    # locally: apply torch.max(x1, x2)
-    output_lshape = stride_tricks.broadcast_shape(x1.lshape, x2.lshape)
-    lresult = factories.empty(output_lshape, dtype=x1.dtype)
-    lresult._DNDarray__array = torch.max(x1._DNDarray__array, x2._DNDarray__array)
-    lresult._DNDarray__dtype = types.promote_types(x1.dtype, x2.dtype)
-    lresult._DNDarray__split = split
-    if x1.split is not None or x2.split is not None:
-        if x1.comm.is_distributed():  # assuming x1.comm = x2.comm
-            output_gshape = stride_tricks.broadcast_shape(x1.gshape, x2.gshape)
-            result = factories.empty(output_gshape, dtype=x1.dtype)
-            x1.comm.Allgather(lresult, result)
-            # TODO: adopt Allgatherv() as soon as it is fixed, Issue #233
-            result._DNDarray__dtype = lresult._DNDarray__dtype
-            result._DNDarray__split = split
-
-            if out is not None:
-                if out.shape != output_gshape:
-                    raise ValueError(
-                        "Expecting output buffer of shape {}, got {}".format(
-                            output_gshape, out.shape
-                        )
-                    )
-                out._DNDarray__array = result._DNDarray__array
-                out._DNDarray__dtype = result._DNDarray__dtype
-                out._DNDarray__split = split
-                out._DNDarray__device = x1.device
-                out._DNDarray__comm = x1.comm
-
-                return out
-            return result
-
-    if out is not None:
-        if out.shape != output_lshape:
-            raise ValueError(
-                "Expecting output buffer of shape {}, got {}".format(output_lshape, out.shape)
-            )
-        out._DNDarray__array = lresult._DNDarray__array
-        out._DNDarray__dtype = lresult._DNDarray__dtype
-        out._DNDarray__split = split
-        out._DNDarray__device = x1.device
-        out._DNDarray__comm = x1.comm
 
-    return lresult
+    # equally split operands are compared process-locally, others are lined up beforehand
+    return operations.__binary_op(torch.max, x1, x2, out)
 
 
-def mean(x, axis=None):
+def mean(x, axis=None, async_op=False):
     """
     Calculates and returns the mean of a tensor.
     If a axis is given, the mean will be taken in that direction.
@@ -704,6 +657,9 @@ def mean(x, axis=None):
         The dtype of x must be a float
     axis : None, Int, iterable, defaults to None
         Axis which the mean is taken in. Default None calculates mean of all data items.
+    async_op : bool, optional
+        If True, the global reduction is performed with a non-blocking collective operation and a pending DNDarray is
+        returned. The reduction is completed on the first access to the data of the result. Default: False
 
     Returns
     -------
@@ -770,20 +726,21 @@ def mean(x, axis=None):
 
         mu_shape = list(mu.shape) if list(mu.shape) else [1]
 
-        mu_tot = factories.zeros(([x.comm.size] + mu_shape), device=x.device)
-        n_tot = factories.zeros(x.comm.size, device=x.device)
-        n_tot[x.comm.rank] = float(x.lshape[x.split])
-        mu_tot[x.comm.rank, :] = mu
-        x.comm.Allreduce(MPI.IN_PLACE, n_tot, MPI.SUM)
+        # means and element counts are exchanged in a single collective
+        mu_tot = factories.zeros(([x.comm.size, 2] + mu_shape), device=x.device)
+        mu_tot[x.comm.rank, 0, :] = mu
+        mu_tot[x.comm.rank, 1, :] = float(x.lshape[x.split])
         x.comm.Allreduce(MPI.IN_PLACE, mu_tot, MPI.SUM)
 
         for i in range(1, x.comm.size):
-            mu_tot[0, :], n_tot[0] = __merge_moments(
-                (mu_tot[0, :], n_tot[0]), (mu_tot[i, :], n_tot[i])
+            mu_tot[0, 0, :], mu_tot[0, 1, :] = __merge_moments(
+                (mu_tot[0, 0, :], mu_tot[0, 1, :]), (mu_tot[i, 0, :], mu_tot[i, 1, :])
             )
-        return mu_tot[0][0] if mu_tot[0].size == 1 else mu_tot[0]
+        return mu_tot[0, 0, :][0] if mu_tot[0, 0, :].size == 1 else mu_tot[0, 0, :]
 
     # ----------------------------------------------------------------------------------------------
+    if async_op:
+        return __mean_async(x, axis)
     if axis is None:
         # full matrix calculation
         if not x.is_distributed():
@@ -809,6 +766,36 @@ def mean(x, axis=None):
     return __moment_w_axis(torch.mean, x, axis, reduce_means_elementwise)
 
 
+def __mean_async(x, axis):
+    """
+    Non-blocking mean, the sum of the elements is reduced with a non-blocking collective operation and divided by the
+    number of elements once the reduction has completed.
+    """
+    if isinstance(axis, list):
+        axis = tuple(axis)
+    reduced_axes = stride_tricks.sanitize_axis(x.shape, axis)
+    if reduced_axes is None:
+        reduced_axes = tuple(range(x.ndim))
+    elif isinstance(reduced_axes, int):
+        reduced_axes = (reduced_axes,)
+    n = float(np.prod([x.gshape[dim] for dim in reduced_axes]))
+    torch_type = x.dtype.torch_type() if types.heat_type_is_inexact(x.dtype) else torch.float32
+
+    def local_sum(t, *args, **kwargs):
+        return torch.sum(t.type(torch_type), *args, **kwargs)
+
+    def local_mean(t):
+        return t / n if axis is not None else (t / n).reshape(())
+
+    result = operations.__reduce_op(
+        x, local_sum, MPI.SUM, axis=axis, neutral=0, async_op=True, finalize=local_mean
+    )
+    if axis is None:
+        result._DNDarray__gshape = ()
+
+    return result
+
+
 def median(x, axis=None, keepdim=False):
     """
     Compute the median of the data along the specified axis.
@@ -910,7 +897,7 @@ def __merge_moments(m1, m2, unbiased=True):
     #     return k, skew_m, var_m, mu, n
 
 
-def min(x, axis=None, out=None, keepdim=None):
+def min(x, axis=None, out=None, keepdim=None, async_op=False):
     # TODO: initial : scalar, optional Issue #101
     """
     Return the minimum along a given axis.
@@ -929,6 +916,9 @@ def min(x, axis=None, out=None, keepdim=None):
     keepdim : bool, optional
         If this is set to True, the axes which are reduced are left in the result as dimensions with size one.
         With this option, the result will broadcast correctly against the original arr.
+    async_op : bool, optional
+        If True, the global reduction is performed with a non-blocking collective operation and a pending DNDarray is
+        returned. The reduction is completed on the first access to the data of the result. Default: False
 
     Returns
     -------
@@ -962,13 +952,21 @@ def min(x, axis=None, out=None, keepdim=None):
 
     largest_value = constants.sanitize_infinity(x._DNDarray__array.dtype)
     return operations.__reduce_op(
-        x, local_min, MPI.MIN, axis=axis, out=out, neutral=largest_value, keepdim=keepdim
+        x,
+        local_min,
+        MPI.MIN,
+        axis=axis,
+        out=out,
+        neutral=largest_value,
+        keepdim=keepdim,
+        async_op=async_op,
     )
 
 
 def minimum(x1, x2, out=None):
     """
     Compares two tensors and returns a new tensor containing the element-wise minima.
+    The result is distributed like the operands, equally split operands are compared without any communication.
     If one of the elements being compared is a NaN, then that element is returned. TODO: Check this: If both elements are NaNs then the first is returned.
     The latter distinction is important for complex NaNs, which are defined as at least one of the real or imaginary parts being a NaN. The net effect is that NaNs are propagated.
 
@@ -980,8 +978,8 @@ def minimum(x1, x2, out=None):
             For broadcasting semantics, see: https://pytorch.org/docs/stable/notes/broadcasting.html
 
     out : ht.DNDarray or None, optional
-        A location into which the result is stored. If provided, it must have a shape that the inputs broadcast to.
-        If not provided or None, a freshly-allocated tensor is returned.
+        A location into which the result is stored. If provided, it must have the shape that the inputs broadcast to
+        and the split axis of the result. If not provided or None, a freshly-allocated tensor is returned.
 
     Returns:
     --------
@@ -1036,77 +1034,13 @@ def minimum(x1, x2, out=None):
     >>> ht.minimum(a,d)
     ValueError: operands could not be broadcast, input shapes (3, 4) (3, 4, 5)
     """
-    # perform sanitation
     if not isinstance(x1, dndarray.DNDarray) or not isinstance(x2, dndarray.DNDarray):
         raise TypeError(
             "expected x1 and x2 to be a ht.DNDarray, but were {}, {} ".format(type(x1), type(x2))
         )
-    if out is not None and not isinstance(out, dndarray.DNDarray):
-        raise TypeError("expected out to be None or an ht.DNDarray, but was {}".format(type(out)))
-
-    # apply split semantics
-    if x1.split is not None or x2.split is not None:
-        if x1.split is None:
-            x1.resplit_(x2.split)
-        if x2.split is None:
-            x2.resplit_(x1.split)
-        if x1.split != x2.split:
-            if np.prod(x1.gshape) < np.prod(x2.gshape):
-                x1.resplit_(x2.split)
-            if np.prod(x2.gshape) < np.prod(x1.gshape):
-                x2.resplit_(x1.split)
-            else:
-                if x1.split < x2.split:
-                    x2.resplit_(x1.split)
-                else:
-                    x1.resplit_(x2.split)
-        split = x1.split
-    else:
-        split = None
-
-    # locally: apply torch.min(x1, x2)
-    output_lshape = stride_tricks.broadcast_shape(x1.lshape, x2.lshape)
-    lresult = factories.empty(output_lshape, dtype=x1.dtype)
-    lresult._DNDarray__array = torch.min(x1._DNDarray__array, x2._DNDarray__array)
-    lresult._DNDarray__dtype = types.promote_types(x1.dtype, x2.dtype)
-    lresult._DNDarray__split = split
-    if x1.split is not None or x2.split is not None:
-        if x1.comm.is_distributed():  # assuming x1.comm = x2.comm
-            output_gshape = stride_tricks.broadcast_shape(x1.gshape, x2.gshape)
-            result = factories.empty(output_gshape, dtype=x1.dtype)
-            x1.comm.Allgather(lresult, result)
-            # TODO: adopt Allgatherv() as soon as it is fixed, Issue #233
-            result._DNDarray__dtype = lresult._DNDarray__dtype
-            result._DNDarray__split = split
-
-            if out is not None:
-                if out.shape != output_gshape:
-                    raise ValueError(
-                        "Expecting output buffer of shape {}, got {}".format(
-                            output_gshape, out.shape
-                        )
-                    )
-                out._DNDarray__array = result._DNDarray__array
-                out._DNDarray__dtype = result._DNDarray__dtype
-                out._DNDarray__split = split
-                out._DNDarray__device = x1.device
-                out._DNDarray__comm = x1.comm
-
-                return out
-            return result
-
-    if out is not None:
-        if out.shape != output_lshape:
-            raise ValueError(
-                "Expecting output buffer of shape {}, got {}".format(output_lshape, out.shape)
-            )
-        out._DNDarray__array = lresult._DNDarray__array
-        out._DNDarray__dtype = lresult._DNDarray__dtype
-        out._DNDarray__split = split
-        out._DNDarray__device = x1.device
-        out._DNDarray__comm = x1.comm
 
-    return lresult
+    # equally split operands are compared process-locally, others are lined up beforehand
+    return operations.__binary_op(torch.min, x1, x2, out)
 
 
 def __moment_w_axis(function, x, axis, elementwise_function, unbiased=None, Fischer=None):
@@ -1179,42 +1113,218 @@ def __moment_w_axis(function, x, axis, elementwise_function, unbiased=None, Fisc
     )
 
 
-def mpi_argmax(a, b, _):
-    lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64))
-    rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64))
+def moments(x, axis=None, order=2):
+    """
+    Computes the mean and the central moments up to the given order of a tensor in a single pass over the data. Each
+    process traverses its local data once, in blocks that fit into the cache, and accumulates the element count, the
+    mean and the sums of the powers of the deviations from the mean. If the moments are computed along the split axis,
+    the packed moments of all processes are exchanged with a single Allgather and merged pairwise (see Reference 1 of
+    __merge_moments).
 
-    # extract the values and minimal indices from the buffers (first half are values, second are indices)
-    values = torch.stack((lhs.chunk(2)[0], rhs.chunk(2)[0]), dim=1)
-    indices = torch.stack((lhs.chunk(2)[1], rhs.chunk(2)[1]), dim=1)
+    Parameters
+    ----------
+    x : ht.DNDarray
+        Values for which the moments are calculated for.
+    axis : None, int or tuple of ints, optional
+        Axis or axes along which the moments are calculated. Default None calculates the moments of all data items.
+    order : int, optional
+        The highest order of the central moments, between 1 and 4. Default: 2
 
-    # determine the minimum value and select the indices accordingly
-    max, max_indices = torch.max(values, dim=1)
-    result = torch.cat((max, indices[torch.arange(values.shape[0]), max_indices]))
+    Returns
+    -------
+    moments : tuple of ht.DNDarray
+        The mean followed by the central moments of order 2 to order, i.e. the mean of the k-th power of the
+        deviations from the mean (not corrected for bias). The moments have the same shape and split semantics as
+        the result of mean().
 
-    rhs.copy_(result)
+    Raises
+    ------
+    TypeError
+        If x is not a DNDarray or the order is not an integer.
+    ValueError
+        If the order is out of range or the axis contains duplicates.
+
+    Examples
+    --------
+    >>> x = ht.array([[1.0, 2.0], [3.0, 6.0]], split=0)
+    >>> mu, var, m3 = ht.moments(x, axis=0, order=3)
+    >>> mu
+    tensor([2., 4.])
+    >>> var
+    tensor([1., 4.])
+    >>> m3
+    tensor([0., 0.])
+    """
+    if not isinstance(x, dndarray.DNDarray):
+        raise TypeError("expected x to be a ht.DNDarray, but was {}".format(type(x)))
+    if not isinstance(order, int) or isinstance(order, bool):
+        raise TypeError("order must be an int, currently {}".format(type(order)))
+    if order < 1 or order > 4:
+        raise ValueError("order must be between 1 and 4, currently {}".format(order))
+
+    if isinstance(axis, list):
+        axis = tuple(axis)
+    axis = stride_tricks.sanitize_axis(x.shape, axis)
+    if axis is None:
+        axis = tuple(range(x.ndim))
+    elif isinstance(axis, int):
+        axis = (axis,)
+    if len(set(axis)) != len(axis):
+        raise ValueError("duplicate value in axis")
+
+    # flatten the reduced axes into the first one, this is a view for leading reduced axes
+    torch_type = x.dtype.torch_type() if types.heat_type_is_inexact(x.dtype) else torch.float32
+    local = x._DNDarray__array.type(torch_type)
+    kept = [dim for dim in range(x.ndim) if dim not in axis]
+    local = local.permute(*axis, *kept).reshape(
+        [int(np.prod([local.shape[dim] for dim in axis]))] + [local.shape[dim] for dim in kept]
+    )
+    local_moments = __local_moments(local, order)
+
+    split = x.split
+    if split is not None and split in axis:
+        split = None
+        if x.comm.is_distributed():
+            # exchange the element counts, means and central moment sums of all processes at once, in double precision
+            # to represent the element counts exactly
+            packed = torch.stack(
+                [torch.full_like(local_moments[1], local_moments[0])] + local_moments[1:]
+            ).double()
+            gathered = torch.empty(
+                (x.comm.size, packed.numel()), dtype=packed.dtype, device=packed.device
+            )
+            x.comm.Allgather(packed.reshape(1, -1), gathered)
+            gathered = gathered.reshape((x.comm.size,) + tuple(packed.shape))
+
+            local_moments = [0.0] + [torch.zeros_like(packed[0])] * order
+            for rank_moments in gathered:
+                count = rank_moments[0].reshape(-1)[0].item() if rank_moments[0].numel() else 0.0
+                local_moments = __merge_central_moments(
+                    local_moments, [count] + list(rank_moments[1:])
+                )
+    elif split is not None:
+        # the split axis is shifted by the reduced axes preceding it
+        split -= len([dim for dim in axis if dim < split])
+
+    count = local_moments[0]
+    results = [local_moments[1]] + [central_sum / count for central_sum in local_moments[2:]]
+    gshape = tuple(x.gshape[dim] for dim in kept)
+
+    return tuple(
+        dndarray.DNDarray(
+            result.type(torch_type),
+            gshape,
+            types.canonical_heat_type(torch_type),
+            split,
+            x.device,
+            x.comm,
+        )
+        for result in results
+    )
+
+
+def __local_moments(t, order):
+    """
+    Element count, mean and sums of the powers of the deviations from the mean up to the given order along the first
+    axis of a torch tensor, i.e. [n, mean, M2, ..., M_order]. The tensor is traversed once, in blocks that fit into the
+    cache, the moments of the blocks are merged pairwise.
+    """
+    kept_numel = int(np.prod(t.shape[1:]))
+    length = __MOMENTS_BLOCK_SIZE // kept_numel if kept_numel else t.shape[0]
+
+    moments = [0.0] + [torch.zeros(t.shape[1:], dtype=t.dtype, device=t.device)] * order
+    if t.shape[0] == 0:
+        return moments
+
+    for block in torch.split(t, length if length > 0 else 1, dim=0):
+        mean = block.mean(dim=0)
+        deviations = block - mean
+        block_moments = [float(block.shape[0]), mean]
+        power = deviations
+        for _ in range(2, order + 1):
+            power = power * deviations
+            block_moments.append(power.sum(dim=0))
+        moments = __merge_central_moments(moments, block_moments)
+
+    return moments
+
+
+def __merge_central_moments(a, b):
+    """
+    Merges the moments [n, mean, M2, ..., M_order] of two disjoint data sets, where n is the number of elements and M_k
+    is the sum of the k-th powers of the deviations from the mean, with the pairwise update formulas of Reference 1 of
+    __merge_moments. Orders up to 4 are supported.
+    """
+    n_a, n_b = a[0], b[0]
+    if n_b == 0:
+        return a
+    if n_a == 0:
+        return b
+
+    n = n_a + n_b
+    delta = b[1] - a[1]
+    merged = [n, a[1] + delta * (n_b / n)]
+    if len(a) > 2:
+        merged.append(a[2] + b[2] + delta ** 2 * (n_a * n_b / n))
+    if len(a) > 3:
+        merged.append(
+            a[3]
+            + b[3]
+            + delta ** 3 * (n_a * n_b * (n_a - n_b) / n ** 2)
+            + 3.0 * delta * (n_a * b[2] - n_b * a[2]) / n
+        )
+    if len(a) > 4:
+        merged.append(
+            a[4]
+            + b[4]
+            + delta ** 4 * (n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3)
+            + 6.0 * delta ** 2 * (n_a ** 2 * b[2] + n_b ** 2 * a[2]) / n ** 2
+            + 4.0 * delta * (n_a * b[3] - n_b * a[3]) / n
+        )
+
+    return merged
+
+
+def mpi_argmax(a, b, _):
+    lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64)).reshape(-1, 2)
+    rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64)).reshape(-1, 2)
+
+    rhs.copy_(__select_arg(lhs, rhs, largest=True))
 
 
 MPI_ARGMAX = MPI.Op.Create(mpi_argmax, commute=True)
 
 
 def mpi_argmin(a, b, _):
-    lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64))
-    rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64))
-    # extract the values and minimal indices from the buffers (first half are values, second are indices)
-    values = torch.stack((lhs.chunk(2)[0], rhs.chunk(2)[0]), dim=1)
-    indices = torch.stack((lhs.chunk(2)[1], rhs.chunk(2)[1]), dim=1)
-
-    # determine the minimum value and select the indices accordingly
-    min, min_indices = torch.min(values, dim=1)
-    result = torch.cat((min, indices[torch.arange(values.shape[0]), min_indices]))
+    lhs = torch.from_numpy(np.frombuffer(a, dtype=np.float64)).reshape(-1, 2)
+    rhs = torch.from_numpy(np.frombuffer(b, dtype=np.float64)).reshape(-1, 2)
 
-    rhs.copy_(result)
+    rhs.copy_(__select_arg(lhs, rhs, largest=False))
 
 
 MPI_ARGMIN = MPI.Op.Create(mpi_argmin, commute=True)
 
 
-def percentile(x, q, axis=None, out=None, interpolation="linear", keepdim=False):
+def __select_arg(lhs, rhs, largest):
+    """
+    Element-wise selection of the (value, index) pairs of the larger (largest=True) or smaller value. NaN values are
+    extremal, ties are resolved in favor of the smaller index, which makes the selection commutative.
+    """
+    lhs_values, lhs_indices = lhs[:, 0], lhs[:, 1]
+    rhs_values, rhs_indices = rhs[:, 0], rhs[:, 1]
+    lhs_nan, rhs_nan = torch.isnan(lhs_values), torch.isnan(rhs_values)
+
+    better = rhs_values > lhs_values if largest else rhs_values < lhs_values
+    better = (better & ~lhs_nan) | (rhs_nan & ~lhs_nan)
+    tie = (rhs_values == lhs_values) | (rhs_nan & lhs_nan)
+    select_rhs = better | (tie & (rhs_indices < lhs_indices))
+
+    return torch.where(select_rhs.unsqueeze(1), rhs, lhs)
+
+
+def percentile(
+    x, q, axis=None, out=None, interpolation="linear", keepdim=False, method="exact"
+):
     """
     Compute the q-th percentile of the data along the specified axis.
     Returns the q-th percentile(s) of the tensor elements.
@@ -1246,6 +1356,11 @@ def percentile(x, q, axis=None, out=None, interpolation="linear", keepdim=False)
         If True, the axes which are reduced are left in the result as dimensions with size one.
         With this option, the result can broadcast correctly against the original array x.
 
+    method : str, optional
+        Either 'exact' (default) or 'sketch'. The latter approximates the percentiles of the flattened array with a
+        QuantileSketch built in a single pass over the process-local data, the sketches of all processes are merged by
+        exchanging their compact serialized form only. Requires axis to be None, interpolation is ignored.
+
     Returns
     -------
     DNDarray
@@ -1293,6 +1408,10 @@ def percentile(x, q, axis=None, out=None, interpolation="linear", keepdim=False)
 
             percentile = lows + weights * (torch.sub(highs, lows))
 
+        # NaNs are sorted last, fibers containing NaNs have NaN percentiles like in numpy
+        nans = torch.isnan(data.narrow(axis, data.shape[axis] - 1, 1))
+        percentile = percentile.masked_fill(nans, float("nan"))
+
         if axis != 0:
             # permute to have the number of percentiles at dimension 0
             dims = tuple(range(percentile.ndim))
@@ -1311,13 +1430,22 @@ def percentile(x, q, axis=None, out=None, interpolation="linear", keepdim=False)
         raise TypeError("expected x to be a DNDarray, but was {}".format(type(x)))
     if isinstance(axis, list) or isinstance(axis, tuple):
         raise NotImplementedError("ht.percentile(), tuple axis not implemented yet")
+    if method not in ("exact", "sketch"):
+        raise ValueError("method must be 'exact' or 'sketch', but was {}".format(method))
+    if method == "sketch" and axis is not None:
+        raise NotImplementedError("ht.percentile(), method 'sketch' requires axis to be None")
+
+    # order statistics along the split axis are selected without sorting or gathering the data
+    selection = x.comm.is_distributed() and x.split is not None and axis in (None, x.split)
+    flat = axis is None
 
     if axis is None:
-        if x.ndim > 1:
+        if x.ndim > 1 and not selection and method == "exact":
             x = x.flatten()
         axis = 0
-
-    gshape = x.gshape
+        gshape = (x.gnumel,) if x.ndim > 0 else x.gshape
+    else:
+        gshape = x.gshape
     split = x.split
     t_x = x._DNDarray__array
 
@@ -1392,61 +1520,46 @@ def percentile(x, q, axis=None, out=None, interpolation="linear", keepdim=False)
             "Invalid interpolation method. Interpolation can be 'lower', 'higher', 'midpoint', 'nearest', or 'linear'."
         )
 
-    if x.comm.is_distributed() and split is not None:
-        # MPI coordinates
-        rank = x.comm.rank
-        size = x.comm.size
-
-        # calculate dimension along which local percentile chunks will be joined
-        if axis == split:
-            join = 0
-        elif axis > split:
-            join = split + 1
-        elif axis < split:
-            join = split
-
-        if split == axis:
-            # map percentile location: which q on what rank
-            t_indices_map = torch.ones((size, nperc), dtype=t_indices.dtype, device=t_q.device) * -1
-            t_local_indices = torch.ones((1, nperc), dtype=t_indices.dtype, device=t_q.device) * -1
-            offset, _, chunk = x.comm.chunk(gshape, split)
-            chunk_start = chunk[split].start
-            chunk_stop = chunk[split].stop
-            t_ind_on_rank = t_indices[(t_indices < chunk_stop) & (t_indices >= chunk_start)]
-            for el_id, el in enumerate(t_ind_on_rank):
-                t_which_q = torch.where(t_indices == el)
-                t_local_indices[:, t_which_q] = el - offset
-            x.comm.Allgather(t_local_indices, t_indices_map)
-
-    # sort data
-    data = manipulations.sort(x, axis=axis)[0].astype(perc_dtype)
-    t_data = data._DNDarray__array
-
-    if x.comm.is_distributed() and split is not None and axis == split:
-        # allocate memory on all ranks
-        percentile = factories.empty(output_shape, dtype=perc_dtype, split=None, device=x.device)
-        perc_slice = percentile.ndim * (slice(None, None, None),)
-        data.get_halo(1)
-        t_data = data.array_with_halos
-        # fill out percentile
-        t_ind_on_rank -= offset
-        t_map_sum = t_indices_map.sum(axis=1)
-        perc_ranks = torch.where(t_map_sum > -1 * nperc)[0].tolist()
-        for r_id, r in enumerate(perc_ranks):
-            # chunk of the global percentile that will be populated by rank r
-            _, _, perc_chunk = x.comm.chunk(output_shape, join, rank=r_id, w_size=len(perc_ranks))
-            perc_slice = perc_slice[:join] + (perc_chunk[join],) + perc_slice[join + 1 :]
-            local_p = factories.zeros(percentile[perc_slice].shape, dtype=perc_dtype, comm=x.comm)
-            if rank == r:
-                if rank > 0:
-                    # correct indices for halo
-                    t_ind_on_rank += 1
-                local_p = factories.array(local_percentile(t_data, axis, t_ind_on_rank))
-            x.comm.Bcast(local_p, root=r)
-            percentile[perc_slice] = local_p
+    if method == "sketch":
+        sketch = sketches.QuantileSketch().update(x)
+        if x.is_distributed():
+            # replicated data would be counted once per process
+            sketch = sketch.allmerge()
+        t_percentile = sketch.percentile(t_q.cpu())
+        percentile = dndarray.DNDarray(
+            t_percentile.type(t_perc_dtype).reshape(output_shape).to(t_x.device),
+            output_shape,
+            perc_dtype,
+            None,
+            x.device,
+            x.comm,
+        )
+    elif selection:
+        if t_indices.is_floating_point():
+            lows, highs = t_indices.floor().long(), t_indices.ceil().long()
+        else:
+            lows, highs = t_indices.long(), t_indices.long()
+        ranks, positions = torch.unique(torch.cat([lows, highs]), return_inverse=True)
+        selected = __select(x, None if flat else axis, ranks).type(t_perc_dtype)
+        lows, highs = selected[positions[:nperc]], selected[positions[nperc:]]
+
+        # interpolate between the neighboring order statistics
+        weights = (t_indices - t_indices.floor()).type(t_perc_dtype)
+        weights = weights.reshape((nperc,) + (1,) * (lows.ndim - 1))
+        t_percentile = lows + weights * (highs - lows)
+        if keepdim:
+            t_percentile = t_percentile.unsqueeze(axis + 1)
+        percentile = dndarray.DNDarray(
+            t_percentile, output_shape, perc_dtype, None, x.device, x.comm
+        )
     else:
+        # sort data
+        data = manipulations.sort(x, axis=axis)[0].astype(perc_dtype)
+        t_data = data._DNDarray__array
+
         if x.comm.is_distributed() and split is not None:
             # split != axis, calculate percentiles locally, then gather
+            join = split + 1 if axis > split else split
             percentile = factories.empty(
                 output_shape, dtype=perc_dtype, split=join, device=x.device
             )
@@ -1466,6 +1579,85 @@ def percentile(x, q, axis=None, out=None, interpolation="linear", keepdim=False)
     return percentile
 
 
+def __select(x, axis, ranks):
+    """
+    Exact distributed selection of the elements of the given global ranks in the sorted order of x along its split
+    axis, or of all elements if axis is None. All ranks of all fibers along the axis are selected at once. In every
+    round, each process proposes the median of its remaining candidates, weighted by their number. The weighted median
+    of the proposals is the pivot, at least a quarter of the candidates are eliminated by counting the elements smaller
+    than and equal to it. Hence, O(log n) rounds of small collective operations are required.
+
+    Returns a tensor of the shape (len(ranks),) + the shape of x without the axis.
+    """
+    comm = x.comm
+    local = x._DNDarray__array
+    if axis is None:
+        trailing = ()
+        local = local.reshape(-1, 1)
+    else:
+        trailing = local.shape[:axis] + local.shape[axis + 1 :]
+        local = local.permute((axis,) + tuple(i for i in range(local.ndim) if i != axis))
+        local = local.reshape(local.shape[0], int(np.prod(trailing)))
+    local, _ = torch.sort(local, dim=0)
+    length, fibers = local.shape
+    device = local.device
+    # candidates and their weights are packed into a common type that represents both exactly
+    packed_type = torch.float64 if local.is_floating_point() else torch.int64
+
+    shape = (ranks.numel(), fibers)
+    ranks = ranks.to(device).reshape(-1, 1).expand(shape)
+    # NaNs are sorted last and never candidates, fibers containing NaNs select NaN for all ranks like numpy
+    nans = torch.isnan(local).sum(dim=0)
+    global_nans = nans.clone()
+    comm.Allreduce(MPI.IN_PLACE, global_nans, MPI.SUM)
+    low = torch.zeros(shape, dtype=torch.int64, device=device)
+    high = (length - nans).expand(shape).clone()
+    done = (global_nans > 0).expand(shape).clone()
+    result = torch.zeros(shape, dtype=local.dtype, device=device)
+    if local.is_floating_point():
+        result.masked_fill_(done, float("nan"))
+
+    while True:
+        # the local candidates of every rank are the sorted elements in [low, high)
+        weights = (high - low).masked_fill(done, 0)
+        if length > 0:
+            proposals = local.gather(0, (low + (weights - 1) // 2).clamp(0, length - 1))
+        else:
+            proposals = torch.zeros(shape, dtype=local.dtype, device=device)
+        gathered = torch.empty((comm.size, 2) + shape, dtype=packed_type, device=device)
+        proposals = torch.stack([proposals.type(packed_type), weights.type(packed_type)])
+        comm.Allgather(proposals.unsqueeze(0), gathered)
+
+        total = gathered[:, 1].sum(dim=0)
+        active = total > 0
+        if not active.any():
+            break
+
+        # weighted median of the proposals
+        values, order = torch.sort(gathered[:, 0], dim=0)
+        cumulative = torch.cumsum(gathered[:, 1].gather(0, order), dim=0)
+        median = (2 * cumulative < total).sum(dim=0, keepdim=True).clamp(max=comm.size - 1)
+        pivot = values.gather(0, median)[0].type(local.dtype)
+
+        # global number of elements smaller than and equal to the pivot
+        less = manipulations.__search_sorted(
+            length, lambda i: local.gather(0, i) < pivot, shape, device
+        )
+        less_equal = manipulations.__search_sorted(
+            length, lambda i: local.gather(0, i) <= pivot, shape, device
+        )
+        counts = torch.stack([less, less_equal])
+        comm.Allreduce(MPI.IN_PLACE, counts, MPI.SUM)
+
+        found = active & (counts[0] <= ranks) & (ranks < counts[1])
+        result = torch.where(found, pivot, result)
+        done |= found
+        low = torch.where(active & (ranks >= counts[1]), torch.max(low, less_equal), low)
+        high = torch.where(active & (ranks < counts[0]), torch.min(high, less), high)
+
+    return result.reshape((shape[0],) + tuple(trailing))
+
+
 def skew(x, axis=None, unbiased=True):
     """
     Compute the sample skewness of a data set.
@@ -1488,16 +1680,8 @@ def skew(x, axis=None, unbiased=True):
         function as data is transferred between processes
     """
     if axis is None or (isinstance(axis, int) and x.split == axis):  # no axis given
-        # TODO: determine if this is a valid (and fast implementation)
-        mu = mean(x, axis=axis)
-        if axis is not None and axis > 0:
-            mu = mu.expand_dims(axis)
-        diff = x - mu
-
+        _, m2, m3 = moments(x, axis=axis, order=3)
         n = float(x.shape[axis]) if axis is not None else x.gnumel
-
-        m3 = arithmetics.sum(arithmetics.pow(diff, 3.0), axis) / n
-        m2 = arithmetics.sum(arithmetics.pow(diff, 2.0), axis) / n
         res = m3 / arithmetics.pow(m2, 1.5)
         if unbiased:
             res *= ((n * (n - 1.0)) ** 0.5) / (n - 2.0)
@@ -1696,8 +1880,7 @@ def var(x, axis=None, ddof=0, **kwargs):
         """
 
         if x.lshape[x.split] != 0:
-            mu = torch.mean(x._DNDarray__array, dim=axis)
-            var = torch.var(x._DNDarray__array, dim=axis, unbiased=unbiased)
+            var, mu = torch.var_mean(x._DNDarray__array, dim=axis, unbiased=unbiased)
         else:
             mu = factories.zeros(output_shape_i, dtype=x.dtype, device=x.device)
             var = factories.zeros(output_shape_i, dtype=x.dtype, device=x.device)
@@ -1725,8 +1908,7 @@ def var(x, axis=None, ddof=0, **kwargs):
             return factories.array(ret)
 
         else:  # case for full matrix calculation (axis is None)
-            mu_in = torch.mean(x._DNDarray__array)
-            var_in = torch.var(x._DNDarray__array, unbiased=unbiased)
+            var_in, mu_in = torch.var_mean(x._DNDarray__array, unbiased=unbiased)
             # Nan is returned when local tensor is empty
             if torch.isnan(var_in):
                 var_in = 0.0
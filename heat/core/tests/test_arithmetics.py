@@ -34,8 +34,26 @@ class TestArithmetics(TestCase):
         self.assertTrue(ht.equal(ht.add(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.add(self.a_split_tensor, self.a_tensor), result))
 
+        # output buffer
+        out = ht.empty((2, 2))
+        self.assertIs(ht.add(self.a_tensor, self.another_tensor, out=out), out)
+        self.assertTrue(ht.equal(out, result))
+        out = ht.empty((2, 2), split=0)
+        self.assertIs(ht.add(self.a_split_tensor, self.an_int_scalar, out=out), out)
+        self.assertTrue(ht.equal(out, ht.full((2, 2), 4.0)))
+        out = ht.empty((2, 2), dtype=ht.float64)
+        ht.add(self.a_tensor, self.a_vector, out=out)
+        self.assertEqual(out.dtype, ht.float64)
+        self.assertTrue(ht.equal(out, result))
+
         with self.assertRaises(ValueError):
             ht.add(self.a_tensor, self.another_vector)
+        with self.assertRaises(ValueError):
+            ht.add(self.a_tensor, self.another_tensor, out=ht.empty((2,)))
+        with self.assertRaises(ValueError):
+            ht.add(self.a_split_tensor, self.a_tensor, out=ht.empty((2, 2)))
+        with self.assertRaises(TypeError):
+            ht.add(self.a_tensor, self.another_tensor, out=torch.empty((2, 2)))
         with self.assertRaises(TypeError):
             ht.add(self.a_tensor, self.errorneous_type)
         with self.assertRaises(TypeError):
@@ -279,6 +297,18 @@ class TestArithmetics(TestCase):
         self.assertEqual(ht_diff.split, 1)
         self.assertEqual(ht_diff.dtype, ht_array.dtype)
 
+        # higher differences of unbalanced and of small chunks along the split axis
+        size = ht.MPI_WORLD.size
+        np_array = np.arange(size * 12).reshape(size * 6, 2) ** 3
+        ht_array = ht.array(np_array, split=0)[size * 2 - 1 :]
+        for nl in (2, 4, size * 4 + 2):
+            ht_diff = ht.diff(ht_array, n=nl, axis=0)
+            np_diff = np.diff(np_array[size * 2 - 1 :], n=nl, axis=0)
+            self.assertEqual(ht_diff.shape, np_diff.shape)
+            self.assertTrue((ht_diff.numpy() == np_diff).all())
+            self.assertTrue(ht_diff.is_balanced())
+        self.assertTrue((ht_array.numpy() == np_array[size * 2 - 1 :]).all())
+
         # raises
         with self.assertRaises(ValueError):
             ht.diff(ht_array, n=-2)
@@ -358,6 +388,9 @@ class TestArithmetics(TestCase):
 
         self.assertTrue(ht.equal(ht.left_shift(int_tensor, 1), int_result))
         self.assertTrue(ht.equal(ht.left_shift(int_tensor.copy().resplit_(0), 1), int_result))
+        out = ht.empty((2, 2), dtype=ht.int64)
+        self.assertIs(ht.left_shift(int_tensor, 1, out=out), out)
+        self.assertTrue(ht.equal(out, int_result))
 
         with self.assertRaises(TypeError):
             ht.left_shift(int_tensor, 2.4)
@@ -642,6 +675,16 @@ class TestArithmetics(TestCase):
         self.assertEqual(shape_split_axis_tuple_sum.split, None)
         self.assertTrue((shape_split_axis_tuple_sum == expected_result).all())
 
+        # non-blocking reduction
+        shape_split_async_sum = ht.sum(shape_split_axis_tuple, axis=1, async_op=True)
+        self.assertEqual(shape_split_async_sum.shape, (3, 5))
+        self.assertEqual(shape_split_async_sum.split, None)
+        self.assertTrue((shape_split_async_sum == ht.full((3, 5), 4.0)).all())
+        self.assertIsNone(shape_split_async_sum._DNDarray__request)
+        out_async = ht.zeros((3, 5))
+        ht.sum(shape_split_axis_tuple, axis=1, out=out_async, async_op=True)
+        self.assertTrue((out_async == ht.full((3, 5), 4.0)).all())
+
         # exceptions
         with self.assertRaises(ValueError):
             ht.ones(array_len).sum(axis=1)
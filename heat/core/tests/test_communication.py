@@ -65,6 +65,18 @@ class TestCommunication(TestCase):
         self.assertIsInstance(chunks, tuple)
         self.assertEqual(len(chunks), len(self.data.shape))
 
+        # the chunk tables of all processes agree with the counts and displacements
+        shape = (11, 4, 3)
+        counts, displs, output_shape = comm.counts_displs_shape(list(shape), -3)
+        self.assertEqual(sum(counts), shape[0])
+        self.assertEqual(output_shape, (comm.size * counts[comm.rank], 4, 3))
+        for rank in range(comm.size):
+            offset, lshape, chunks = comm.chunk(shape, 0, rank=rank)
+            self.assertEqual(offset, displs[rank])
+            self.assertEqual(lshape, (counts[rank], 4, 3))
+            self.assertEqual(chunks[0], slice(offset, offset + counts[rank]))
+        self.assertEqual(comm.chunk(shape, 0), comm.chunk(torch.Size(shape), 0))
+
     def test_cuda_aware_mpi(self):
         self.assertTrue(hasattr(ht.communication, "CUDA_AWARE_MPI"))
         self.assertIsInstance(ht.communication.CUDA_AWARE_MPI, bool)
@@ -194,6 +206,74 @@ class TestCommunication(TestCase):
         if ht.get_device().device_type == "cpu" or ht.communication.CUDA_AWARE_MPI:
             self.assertFalse(both_non_contiguous_out._DNDarray__array.is_contiguous())
 
+    def test_persistent_requests(self):
+        comm = ht.MPI_WORLD
+        data = torch.arange(12, dtype=torch.float32, device=self.device.torch_device).reshape(3, 4)
+        received = torch.zeros((4, 3), device=self.device.torch_device)
+
+        # non-contiguous buffers, the duplicated data types outlive the cache
+        send = comm.Send_init(data[:, 1:], dest=comm.rank)
+        recv = comm.Recv_init(received.T[:, 1:], source=comm.rank)
+        self.assertIsInstance(send, ht.communication.MPIPersistentRequest)
+        ht.MPI_WORLD.datatype_cache_clear()
+
+        # the requests are restarted with the current content of the buffers
+        for factor in range(1, 4):
+            data.mul_(factor)
+            recv.Start()
+            send.Start()
+            send.Wait()
+            recv.Wait()
+            self.assertTrue(torch.equal(received.T[:, 1:], data[:, 1:]))
+            self.assertTrue((received[0] == 0).all())
+
+        send.Free()
+        recv.Free()
+        self.assertEqual(send.handle, ht.MPI.REQUEST_NULL)
+        self.assertIsNone(recv.datatype)
+
+    def test_datatype_cache(self):
+        comm = ht.MPI_WORLD
+        comm.datatype_cache_clear()
+        self.assertEqual(comm.datatype_cache_info(), (0, 0, comm.DATATYPE_CACHE_SIZE, 0))
+
+        # a transposed view requires a derived data type, which is reused for buffers of the same layout
+        data = torch.arange(12, dtype=torch.float32, device=self.device.torch_device).reshape(4, 3).T
+        comm.Bcast(data, root=0)
+        info = comm.datatype_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 1, 1))
+        comm.Bcast(data.clone().reshape(4, 3).T, root=0)
+        comm.Bcast(data, root=0)
+        info = comm.datatype_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+        # the element type is part of the key
+        comm.Bcast(data.double().reshape(4, 3).T, root=0)
+        self.assertEqual(comm.datatype_cache_info().misses, 2)
+
+        # least recently used data types are evicted
+        maxsize = comm.DATATYPE_CACHE_SIZE
+        try:
+            ht.communication.MPICommunication.DATATYPE_CACHE_SIZE = 2
+            cache = comm._MPICommunication__datatype_cache
+            evicted = list(cache.values())
+            for rows in range(2, 6):
+                comm.Bcast(torch.zeros((rows, 3), device=self.device.torch_device).T, root=0)
+            info = comm.datatype_cache_info()
+            self.assertEqual((info.maxsize, info.currsize), (2, 2))
+            # evicted data types are freed right away
+            self.assertTrue(all(datatype == ht.MPI.DATATYPE_NULL for datatype in evicted))
+        finally:
+            ht.communication.MPICommunication.DATATYPE_CACHE_SIZE = maxsize
+
+        # collectives keep working with the remaining and the evicted types
+        gathered = torch.zeros((3, 4 * comm.size), device=self.device.torch_device)
+        comm.Allgather(torch.ones((4, 3), device=self.device.torch_device).T, gathered, recv_axis=1)
+        self.assertTrue((gathered == 1).all())
+
+        comm.datatype_cache_clear()
+        self.assertEqual(comm.datatype_cache_info(), (0, 0, maxsize, 0))
+
     def test_default_comm(self):
         # default comm is world
         a = ht.zeros((4, 5))
@@ -752,6 +832,56 @@ class TestCommunication(TestCase):
             ).all()
         )
 
+    def test_coalesce(self):
+        comm = ht.MPI_WORLD
+        size = comm.size
+        self.assertFalse(comm.is_coalescing())
+
+        a = torch.tensor([1.0, 2.0], device=self.device.torch_device)
+        b = torch.tensor([comm.rank], device=self.device.torch_device)
+        c = torch.tensor([float(comm.rank)], device=self.device.torch_device)
+        d = torch.tensor([comm.rank], device=self.device.torch_device)
+        with comm.coalesce():
+            self.assertTrue(comm.is_coalescing())
+            requests = [
+                comm.Iallreduce(ht.MPI.IN_PLACE, a, ht.MPI.SUM),
+                comm.Iallreduce(ht.MPI.IN_PLACE, b, ht.MPI.SUM),
+                comm.Iallreduce(ht.MPI.IN_PLACE, c, ht.MPI.MIN),
+                comm.Iallreduce(ht.MPI.IN_PLACE, d, ht.MPI.MAX),
+            ]
+            # the reductions are queued
+            self.assertFalse(requests[0].Test())
+            self.assertEqual(a.tolist(), [1.0, 2.0])
+
+            # reductions of heat return pending arrays that are completed on first use
+            x = ht.ones((size * 2, 3), split=0)
+            total = x.sum(axis=0)
+            maximum = ht.max(x)
+            self.assertTrue(ht.equal(total, ht.full((3,), size * 2.0)))
+
+            # waiting for any request flushes the queue
+            requests[1].Wait()
+            self.assertTrue(requests[0].Test())
+            self.assertEqual(a.tolist(), [size, 2.0 * size])
+            self.assertEqual(maximum.item(), 1.0)
+        self.assertFalse(comm.is_coalescing())
+
+        self.assertEqual(b.item(), size * (size - 1) // 2)
+        self.assertEqual(c.item(), 0.0)
+        self.assertEqual(d.item(), size - 1)
+        for request in requests:
+            request.Wait()
+            self.assertTrue(request.Test())
+
+        # nested contexts are flushed on exit of the outermost one
+        e = torch.ones(1, device=self.device.torch_device)
+        with comm.coalesce():
+            with comm.coalesce():
+                request = comm.Iallreduce(ht.MPI.IN_PLACE, e, ht.MPI.SUM)
+            self.assertTrue(comm.is_coalescing())
+        self.assertTrue(request.Test())
+        self.assertEqual(e.item(), size)
+
     def test_exscan(self):
         # contiguous data
         data = ht.ones((5, 3), dtype=ht.int64)
@@ -2535,7 +2665,60 @@ class TestCommunication(TestCase):
         )
         self.assertTrue(torch.equal(redistributed4, comparison4._DNDarray__array))
 
-        with self.assertRaises(NotImplementedError):
-            test4.comm.Alltoallv(test4._DNDarray__array, redistributed4, send_axis=2, recv_axis=2)
         with self.assertRaises(NotImplementedError):
             test4.comm.Alltoallv(test4._DNDarray__array, redistributed4, send_axis=None)
+
+    def test_derived_datatypes(self):
+        comm = ht.MPI_WORLD
+        rank, size = comm.rank, comm.size
+        device = self.device.torch_device
+
+        # uneven chunks, process r holds r + 1 slices
+        counts = tuple(range(1, size + 1))
+        displs = tuple(sum(counts[:r]) for r in range(size))
+        total = sum(counts)
+        chunk = slice(displs[rank], displs[rank] + counts[rank])
+
+        # allgatherv along a minor axis, from a contiguous and a non-contiguous chunk
+        data = torch.arange(2 * total * 3, device=device).reshape(2, total, 3)
+        local = data[:, chunk].clone()
+        for sendbuf in (local, local.transpose(0, 2).contiguous().transpose(0, 2)):
+            gathered = torch.zeros_like(data)
+            comm.Allgatherv(sendbuf, (gathered, counts, displs), recv_axis=1)
+            self.assertTrue(torch.equal(gathered, data))
+
+        # gatherv along the last axis
+        data = torch.arange(3 * 4 * total, device=device).reshape(3, 4, total)
+        gathered = torch.zeros_like(data)
+        comm.Gatherv(data[..., chunk].clone(), (gathered, counts, displs), root=0, axis=2)
+        if rank == 0:
+            self.assertTrue(torch.equal(gathered, data))
+
+        # scatterv along a minor axis
+        data = torch.arange(2 * total * 3, device=device).reshape(2, total, 3)
+        scattered = torch.zeros((2, counts[rank], 3), dtype=data.dtype, device=device)
+        comm.Scatterv((data, counts, displs), scattered, root=0, axis=1)
+        self.assertTrue(torch.equal(scattered, data[:, chunk]))
+
+        # alltoallv along the same minor axis on either side
+        data = torch.arange(2 * 3 * total, device=device).reshape(2, 3, total)
+        received = torch.zeros((2, 3, size * counts[rank]), dtype=data.dtype, device=device)
+        recv_displs = tuple(counts[rank] * r for r in range(size))
+        comm.Alltoallv(
+            (data + 1000 * rank, counts, displs),
+            (received, (counts[rank],) * size, recv_displs),
+            send_axis=2,
+        )
+        expected = torch.cat([data[..., chunk] + 1000 * r for r in range(size)], dim=2)
+        self.assertTrue(torch.equal(received, expected))
+
+        # alltoallv from a split along axis 0 to a split along axis 2
+        data = torch.arange(total * 3 * total, device=device).reshape(total, 3, total)
+        received = torch.zeros((total, 3, counts[rank]), dtype=data.dtype, device=device)
+        comm.Alltoallv(
+            (data[chunk].clone(), counts, displs),
+            (received, counts, displs),
+            send_axis=2,
+            recv_axis=0,
+        )
+        self.assertTrue(torch.equal(received, data[..., chunk]))
@@ -119,6 +119,49 @@ class TestDNDarray(TestCase):
             with self.assertRaises(ValueError):
                 data.get_halo(4)
 
+        # asymmetric halos along any split axis, received into the borders of a padded local tensor
+        size, rank = ht.MPI_WORLD.size, ht.MPI_WORLD.rank
+        expected = torch.arange(size * 60, device=self.device.torch_device).reshape(4, size * 3, 5)
+        data = ht.array(expected, split=1)
+        prev = 2 if rank > 0 else 0
+        next = 1 if rank < size - 1 else 0
+        data.get_halo((2, 1))
+        with_halos = data.array_with_halos
+        self.assertTrue(torch.equal(with_halos, expected[:, rank * 3 - prev : rank * 3 + 3 + next]))
+        if rank > 0:
+            self.assertTrue(torch.equal(data.halo_prev, expected[:, rank * 3 - 2 : rank * 3]))
+        else:
+            self.assertIsNone(data.halo_prev)
+        if rank < size - 1:
+            self.assertTrue(torch.equal(data.halo_next, expected[:, rank * 3 + 3 : rank * 3 + 4]))
+        else:
+            self.assertIsNone(data.halo_next)
+
+        # the exchange is repeated with the current local data, the padded tensor is reused
+        data._DNDarray__array.mul_(2)
+        data.get_halo((2, 1))
+        self.assertEqual(data.array_with_halos.data_ptr(), with_halos.data_ptr())
+        self.assertTrue(
+            torch.equal(with_halos, 2 * expected[:, rank * 3 - prev : rank * 3 + 3 + next])
+        )
+        self.assertTrue(ht.equal(data, ht.array(2 * expected, split=1)))
+
+        # halos of another size or of replaced local data are set up again
+        data.get_halo((0, 3))
+        self.assertIsNone(data.halo_prev)
+        self.assertEqual(data.array_with_halos.shape[1], 6 if rank < size - 1 else 3)
+        data._DNDarray__array = data._DNDarray__array + 1
+        data.get_halo((0, 3))
+        if rank < size - 1:
+            self.assertTrue(
+                torch.equal(data.halo_next, 2 * expected[:, rank * 3 + 3 : rank * 3 + 6] + 1)
+            )
+
+        with self.assertRaises(TypeError):
+            data.get_halo((1, 2, 3))
+        with self.assertRaises(ValueError):
+            data.get_halo((1, -1))
+
     def test_astype(self):
         data = ht.float32([[1, 2, 3], [4, 5, 6]])
 
@@ -163,6 +206,46 @@ class TestDNDarray(TestCase):
         data.balance_()
         self.assertTrue(data.is_balanced())
 
+        # the lshape map is cached, returned as a copy and updated on redistribution
+        data = ht.zeros((70, 20), split=0)[:50]
+        lshape_map = data.create_lshape_map()
+        lshape_map[...] = -1
+        self.assertTrue((data.create_lshape_map() >= 0).all())
+        data.balance_()
+        counts, _, _ = data.comm.counts_displs_shape(data.gshape, 0)
+        self.assertEqual(data.create_lshape_map()[:, 0].tolist(), list(counts))
+        self.assertTrue(torch.equal(data.create_lshape_map(), data.create_lshape_map(True)))
+        self.assertTrue(data.is_balanced(force_check=True))
+        data.resplit_(1)
+        self.assertEqual(data.create_lshape_map()[:, 0].tolist(), [50] * data.comm.size)
+        self.assertEqual(data.create_lshape_map()[:, 1].sum().item(), 20)
+        self.assertTrue(data.is_balanced())
+        data.resplit_(None)
+        self.assertEqual(data.create_lshape_map().tolist(), [[50, 20]] * data.comm.size)
+        self.assertTrue(data.is_balanced())
+
+        # data is only moved if the imbalance exceeds the tolerance
+        size = ht.MPI_WORLD.size
+        data = ht.arange(size * 100, split=0)[5:]
+        lshape_map = data.create_lshape_map()
+        data.balance_(tolerance=0.2)
+        self.assertTrue(torch.equal(data.create_lshape_map(force_check=True), lshape_map))
+        data.balance_(tolerance=0.01)
+        self.assertTrue(data.is_balanced(force_check=True))
+        self.assertTrue((data.numpy() == np.arange(5, size * 100)).all())
+        with self.assertRaises(ValueError):
+            data.balance_(tolerance=-1)
+
+        # resplitting back to the original axis does not reuse the map of the unbalanced data
+        data = ht.zeros((70, 20), split=0)[:50]
+        balanced = data.is_balanced()
+        data.resplit_(1)
+        data.resplit_(0)
+        self.assertTrue(data.is_balanced())
+        self.assertEqual(data.create_lshape_map()[:, 0].sum().item(), 50)
+        if data.comm.size > 1:
+            self.assertFalse(balanced)
+
         data = ht.zeros((4, 120), split=1, dtype=ht.int64)
         data = data[:, 40:70]
         data.balance_()
@@ -323,6 +406,61 @@ class TestDNDarray(TestCase):
             with self.assertRaises(TypeError):
                 float(ht.full((ht.MPI_WORLD.size,), 2, split=0))
 
+    def test_inplace_operations(self):
+        a = ht.ones((4, 3), split=0)
+        local = a._DNDarray__array
+        b = a
+        b += 1
+        self.assertIs(b, a)
+        self.assertIs(a._DNDarray__array, local)
+        self.assertTrue(ht.equal(a, ht.full((4, 3), 2.0)))
+
+        a *= ht.arange(3, dtype=ht.float32)
+        a -= 1
+        a /= 2.0
+        a **= 2
+        self.assertIs(a, b)
+        self.assertEqual(a.dtype, ht.float32)
+        self.assertTrue(ht.equal(a, ht.array([[0.25, 0.25, 2.25]] * 4)))
+
+        # results that do not fit into the tensor are not written in-place
+        c = ht.arange(4, dtype=ht.int32, split=0)
+        d = c
+        d += 1.5
+        self.assertIsNot(d, c)
+        self.assertTrue(issubclass(d.dtype, ht.floating))
+        self.assertTrue(ht.equal(c, ht.arange(4, dtype=ht.int32)))
+        d = c
+        d /= 2
+        self.assertIsNot(d, c)
+        self.assertTrue(ht.equal(d, ht.arange(4) / 2))
+        g = ht.ones((4,))
+        h = g
+        h += ht.ones((3, 4))
+        self.assertIsNot(h, g)
+        self.assertEqual(h.shape, (3, 4))
+
+        c += 2
+        c //= 2
+        c %= 2
+        c <<= 2
+        c >>= 1
+        c |= 1
+        c ^= 3
+        c &= 6
+        self.assertEqual(c.dtype, ht.int32)
+        self.assertTrue(ht.equal(c, ht.array([0, 0, 2, 2], dtype=ht.int32)))
+
+        # evaluated in-place inside of a lazy context, the aliases observe the modification
+        e = ht.zeros((4,), split=0)
+        f = e
+        with ht.lazy():
+            g = e * 2
+            f += 1
+            self.assertIs(f, e)
+            self.assertTrue(ht.equal(e, ht.ones((4,))))
+        self.assertTrue(ht.equal(g, ht.zeros((4,))))
+
     def test_int_cast(self):
         # simple scalar tensor
         a = ht.ones(1)
@@ -546,6 +684,20 @@ class TestDNDarray(TestCase):
             with self.assertRaises(ValueError):
                 st.redistribute_(target_map=torch.zeros((2, 4)))
 
+        # the data keeps its global order for arbitrary source and target distributions
+        size = ht.MPI_WORLD.size
+        expected = np.arange(size * 42).reshape(3, size * 7, 2)
+        st = ht.array(expected, split=1)
+        for shift in range(size):
+            target_map = torch.tensor([3, 0, 2], device=self.device.torch_device).repeat(size, 1)
+            target_map[shift, 1] = size * 7
+            st.redistribute_(target_map=target_map)
+            self.assertEqual(st.lshape, tuple(target_map[st.comm.rank].tolist()))
+            self.assertTrue((st.numpy() == expected).all())
+        st.balance_()
+        self.assertTrue(st.is_balanced(force_check=True))
+        self.assertTrue((st.numpy() == expected).all())
+
     def test_resplit(self):
         # resplitting with same axis, should leave everything unchanged
         shape = (ht.MPI_WORLD.size, ht.MPI_WORLD.size)
@@ -706,6 +858,57 @@ class TestDNDarray(TestCase):
         self.assertEqual(resplit_a.dtype, ht.int64)
         del a
 
+        # unbalanced chunks, e.g. after slicing, are resplit into balanced ones
+        test = torch.arange(ht.MPI_WORLD.size * 30, device=self.device.torch_device)
+        a = ht.array(test.reshape(-1, 6), split=0)[ht.MPI_WORLD.size * 2 - 1 :]
+        expected = a.numpy()
+        a.resplit_(axis=1)
+        self.assertEqual(a.split, 1)
+        self.assertTrue(a.is_balanced())
+        self.assertTrue((a.numpy() == expected).all())
+        a.resplit_(axis=0)
+        self.assertTrue(a.is_balanced())
+        self.assertTrue((a.numpy() == expected).all())
+
+    def test_resplit_async(self):
+        size = ht.MPI_WORLD.size
+        test = torch.arange(size * 24, device=self.device.torch_device).reshape(-1, 4, 3)
+        expected = test.cpu().numpy()
+
+        # the exchange overlaps computations on other arrays, the new split axis is set right away
+        a = ht.array(test, split=0)
+        b = ht.ones((size * 5, 7), split=0)
+        request = a.resplit_async(1)
+        self.assertEqual(a.split, 1)
+        b = ht.exp(b)
+        request.wait()
+        self.assertTrue(request.Test())
+        self.assertTrue(a.is_balanced())
+        self.assertTrue((a.numpy() == expected).all())
+        self.assertTrue(ht.allclose(b, ht.exp(ht.ones((size * 5, 7), split=0))))
+
+        # accessing the local data completes the exchange implicitly
+        request = a.resplit_async(None)
+        self.assertEqual(a.lshape, tuple(test.shape))
+        self.assertTrue(torch.equal(a._DNDarray__array, test))
+        request.Wait()
+
+        # unchanged axes and splitting a non-distributed array do not communicate
+        self.assertTrue(a.resplit_async(None).Test())
+        request = a.resplit_async(2)
+        self.assertTrue(request.Test())
+        self.assertEqual(a.split, 2)
+        self.assertTrue((a.numpy() == expected).all())
+
+        # unbalanced chunks, e.g. after slicing
+        a = ht.array(test, split=0)[size * 2 - 1 :]
+        a.resplit_async(2).wait()
+        self.assertTrue(a.is_balanced())
+        self.assertTrue((a.numpy() == expected[size * 2 - 1 :]).all())
+
+        with self.assertRaises(ValueError):
+            a.resplit_async(3)
+
     def test_rshift(self):
         int_tensor = ht.array([[0, 2], [4, 8]])
         int_result = ht.array([[0, 0], [1, 2]])
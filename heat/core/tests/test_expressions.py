@@ -0,0 +1,148 @@
+import torch
+
+import heat as ht
+from .test_suites.basic_test import TestCase
+
+
+class TestExpressions(TestCase):
+    def test_is_lazy(self):
+        self.assertFalse(ht.is_lazy())
+        with ht.lazy():
+            self.assertTrue(ht.is_lazy())
+            with ht.lazy():
+                self.assertTrue(ht.is_lazy())
+            self.assertTrue(ht.is_lazy())
+        self.assertFalse(ht.is_lazy())
+
+        # the mode is reset even if the context is left by an exception
+        with self.assertRaises(ValueError):
+            with ht.lazy():
+                raise ValueError()
+        self.assertFalse(ht.is_lazy())
+
+    def test_lazy(self):
+        x = ht.arange(24, dtype=ht.float32, split=0).reshape((6, 4))
+        mu = ht.mean(x, axis=0)
+        var = ht.var(x, axis=0)
+        expected = ((x - mu) ** 2 / var).sum(axis=0)
+
+        with ht.lazy():
+            standardized = (x - mu) ** 2 / var
+            self.assertIsNotNone(standardized._DNDarray__expression)
+            self.assertEqual(standardized.shape, (6, 4))
+            self.assertEqual(standardized.split, 0)
+            # the integer exponent promotes to float64, just like in the eager evaluation
+            self.assertEqual(standardized.dtype, ht.float64)
+            self.assertEqual(standardized.lshape, x.lshape)
+            # reductions are evaluation boundaries
+            result = standardized.sum(axis=0)
+        self.assertIsNone(standardized._DNDarray__expression)
+        self.assertTrue(ht.allclose(result, expected))
+
+        # evaluation when leaving the context
+        with ht.lazy():
+            y = ht.exp(ht.sin(x) * 2.0) + 1
+            self.assertIsNotNone(y._DNDarray__expression)
+        self.assertIsNone(y._DNDarray__expression)
+        self.assertTrue(ht.allclose(y, ht.exp(ht.sin(x) * 2.0) + 1))
+
+        # in-place modifications of operands after the deferral are not visible in the results
+        a = ht.zeros((6,), split=0)
+        with ht.lazy():
+            b = a + 1
+            c = b * 2
+            a[0] = 100
+            self.assertIsNone(b._DNDarray__expression)
+        self.assertTrue(ht.equal(b, ht.ones((6,), split=0)))
+        self.assertTrue(ht.equal(c, ht.full((6,), 2.0, split=0)))
+
+        a = ht.zeros((6,), split=0)
+        with ht.lazy():
+            b = a + 1
+            a.lloc[:] = 5
+            ht.add(a, 1, out=a)
+            d = ht.exp(a)
+            ht.exp(a, out=a)
+        self.assertTrue(ht.equal(b, ht.ones((6,), split=0)))
+        self.assertTrue(ht.allclose(d, ht.exp(ht.full((6,), 6.0, split=0))))
+
+        a = ht.zeros((6,), split=0)
+        with ht.lazy():
+            c = a + 1
+        a += 1
+        self.assertTrue(ht.equal(c, ht.ones((6,), split=0)))
+
+        # shared subexpressions and intermediates evaluated on their own
+        with ht.lazy():
+            a = x * 3
+            b = a * a - a
+            c = a + 1
+        self.assertTrue(ht.equal(c, x * 3 + 1))
+        self.assertTrue(ht.equal(b, (x * 3) * (x * 3) - x * 3))
+        self.assertTrue(ht.equal(a, x * 3))
+
+        # type promotion and operations changing the type
+        z = ht.arange(6, dtype=ht.int32, split=0)
+        with ht.lazy():
+            promoted = z + 1.5
+            compared = z > 2
+            rooted = ht.sqrt(z)
+        self.assertEqual(promoted.dtype, ht.float32)
+        self.assertEqual(compared.dtype, ht.bool)
+        self.assertEqual(rooted.dtype, ht.float32)
+        self.assertTrue(ht.equal(promoted, ht.arange(6, split=0) + 1.5))
+        self.assertTrue(ht.equal(compared, ht.arange(6, split=0) > 2))
+        self.assertTrue(ht.allclose(rooted, ht.sqrt(ht.arange(6, dtype=ht.float32, split=0))))
+
+        # item() is an evaluation boundary
+        with ht.lazy():
+            scalar = ht.array([2.0]) * 4
+            self.assertEqual(scalar.item(), 8.0)
+
+        # operations with out buffers are not deferred
+        out = ht.zeros((6, 4), split=0)
+        with ht.lazy():
+            ht.exp(x, out=out)
+        self.assertIsNone(out._DNDarray__expression)
+        self.assertTrue(ht.allclose(out, ht.exp(x)))
+
+        # non-element-wise results are computed eagerly
+        with ht.lazy():
+            self.assertTrue(ht.equal(x, x))
+
+    def test_fusion(self):
+        x = ht.arange(12, dtype=ht.float32, split=0)
+        expected = ht.exp((x - 1.0) * 0.5) / 2.0
+        kernels = getattr(ht.core.expressions, "__fused_kernels")
+
+        # recurring chains are compiled once and reused afterwards
+        for _ in range(3):
+            with ht.lazy(fuse=True):
+                y = ht.exp((x - 1.0) * 0.5) / 2.0
+                self.assertTrue(y._DNDarray__expression.fuse)
+            self.assertTrue(ht.allclose(y, expected))
+        self.assertGreater(len(kernels), 0)
+
+        # shared intermediates are not fused away
+        with ht.lazy(fuse=True):
+            a = ht.sin(x) * 2.0
+            b = a + a * 3.0
+        self.assertTrue(ht.allclose(b, ht.sin(x) * 2.0 * 4.0))
+
+        # fusion is opt-in
+        with ht.lazy():
+            z = x * 2.0
+            self.assertFalse(z._DNDarray__expression.fuse)
+
+    def test_evaluate(self):
+        x = ht.ones((4, 3), split=0)
+        with ht.lazy():
+            y = (x + 1) * 2 - 1
+            expression = y._DNDarray__expression
+        local = ht.core.expressions.evaluate(expression)
+        self.assertIsInstance(local, torch.Tensor)
+        self.assertEqual(tuple(local.shape), x.lshape)
+        self.assertTrue((local == 3).all())
+
+        # the inputs are never overwritten
+        self.assertTrue((x._DNDarray__array == 1).all())
@@ -6,6 +6,51 @@ from .test_suites.basic_test import TestCase
 
 
 class TestManipulations(TestCase):
+    def test_argsort(self):
+        size = ht.MPI_WORLD.size
+        # skewed data with many duplicates, global indices
+        data = torch.arange(size * 10, device=self.device.torch_device) % 3
+        data[: size * 5] = 1
+        for split in (None, 0):
+            x = ht.array(data, split=split)
+            for descending in (False, True):
+                keys = -data.cpu().numpy() if descending else data.cpu().numpy()
+                expected = np.argsort(keys, kind="stable")
+                result = ht.argsort(x, descending=descending, stable=True)
+                self.assertEqual(result.dtype, ht.int64)
+                self.assertEqual(result.split, split)
+                self.assertEqual(result.lshape, x.lshape)
+                self.assertTrue((result.numpy() == expected).all())
+
+                result = ht.argsort(x, descending=descending)
+                self.assertTrue((keys[result.numpy()] == keys[expected]).all())
+
+        # multi-dimensional data along the split axis
+        data = ht.random.randn(size * 3, 4, 2, split=0)
+        result = ht.argsort(data, axis=0, stable=True)
+        expected = np.argsort(data.numpy(), axis=0, kind="stable")
+        self.assertEqual(result.lshape, data.lshape)
+        self.assertTrue((result.numpy() == expected).all())
+        result = ht.argsort(ht.resplit(data, 1), axis=0, descending=True)
+        expected = np.take_along_axis(data.numpy(), expected[::-1], 0)
+        self.assertTrue((np.take_along_axis(data.numpy(), result.numpy(), 0) == expected).all())
+
+        # multi-dimensional data with duplicates along and across the split axis
+        values = np.arange(size * 12).reshape(size * 3, 4) * 7 % 5
+        for split, axis in ((0, 0), (1, 1), (0, 1), (1, 0)):
+            x = ht.array(values, split=split)
+            result = ht.argsort(x, axis=axis, stable=True)
+            self.assertEqual(result.lshape, x.lshape)
+            self.assertTrue(result._DNDarray__array.is_contiguous())
+            self.assertTrue((result.numpy() == np.argsort(values, axis=axis, kind="stable")).all())
+            result = ht.argsort(x, axis=axis)
+            self.assertTrue(result._DNDarray__array.is_contiguous())
+            result = np.take_along_axis(values, result.numpy(), axis)
+            self.assertTrue((result == np.sort(values, axis=axis)).all())
+
+        with self.assertRaises(ValueError):
+            ht.argsort(data, axis=3)
+
     def test_concatenate(self):
         # cases to test:
         # Matrices / Vectors
@@ -971,6 +1016,47 @@ class TestManipulations(TestCase):
         res = ht.hstack((a, b))
         self.assertEqual(res.shape, (24,))
 
+    def test_pad(self):
+        size = ht.MPI_WORLD.size
+        data = np.arange(size * 12).reshape(size * 4, 3) * 7 % 11
+
+        # numpy semantics in all modes, the result is balanced along the split axis
+        for split in (None, 0, 1):
+            x = ht.array(data, split=split)
+            for mode in ("constant", "edge", "reflect", "wrap"):
+                for pad_width in (1, (0, 2), ((2, 1), (1, 0))):
+                    padded = ht.pad(x, pad_width, mode=mode)
+                    expected = np.pad(data, pad_width, mode=mode)
+                    self.assertEqual(padded.split, split)
+                    self.assertEqual(padded.shape, expected.shape)
+                    self.assertTrue((padded.numpy() == expected).all())
+                    self.assertTrue(padded.is_balanced())
+            padded = ht.pad(x, ((size * 5, 0), (0, 0)), constant_values=-1)
+            expected = np.pad(data, ((size * 5, 0), (0, 0)), constant_values=-1)
+            self.assertTrue((padded.numpy() == expected).all())
+
+        # paddings exceeding the first and the last chunk, empty chunks after slicing
+        x = ht.arange(size * 2, split=0)[size:]
+        for mode in ("edge", "wrap"):
+            padded = ht.pad(x, (3, size + 1), mode=mode)
+            expected = np.pad(np.arange(size, size * 2), (3, size + 1), mode=mode)
+            self.assertTrue((padded.numpy() == expected).all())
+            self.assertTrue(padded.is_balanced())
+
+        x = ht.array(data, split=0)
+        with self.assertRaises(TypeError):
+            ht.pad(data, 1)
+        with self.assertRaises(ValueError):
+            ht.pad(x, 1, mode="symmetric")
+        with self.assertRaises(ValueError):
+            ht.pad(x, -1)
+        with self.assertRaises(ValueError):
+            ht.pad(x, (1, 2, 3))
+        with self.assertRaises(ValueError):
+            ht.pad(x, 3, mode="reflect")
+        with self.assertRaises(ValueError):
+            ht.pad(ht.zeros((0, 3), split=0), 1, mode="edge")
+
     def test_reshape(self):
         # split = None
         a = ht.zeros((3, 4))
@@ -1069,6 +1155,43 @@ class TestManipulations(TestCase):
         with self.assertRaises(TypeError):
             ht.reshape(ht.zeros((4, 3)), "(5, 7)")
 
+    def test_roll(self):
+        size = ht.MPI_WORLD.size
+        data = np.arange(size * 12).reshape(size * 4, 3)
+
+        # numpy semantics for shifts within, across and beyond the chunks of the split axis
+        for split in (None, 0, 1):
+            x = ht.array(data, split=split)
+            for shift in (0, 1, -2, 5, size * 4 + 1, -size * 9):
+                for axis in (0, 1, None, (0, 1)):
+                    rolled = ht.roll(x, shift, axis)
+                    self.assertEqual(rolled.split, split)
+                    self.assertEqual(rolled.shape, x.shape)
+                    self.assertTrue((rolled.numpy() == np.roll(data, shift, axis)).all())
+                    self.assertTrue(rolled.is_balanced())
+            rolled = ht.roll(x, (1, -2, 3), (0, 1, 0))
+            self.assertTrue((rolled.numpy() == np.roll(data, (1, -2, 3), (0, 1, 0))).all())
+
+        # unbalanced inputs with empty chunks are balanced
+        x = ht.arange(size * 2, split=0)[size * 2 - 1 :]
+        rolled = ht.roll(x, 1)
+        self.assertTrue(rolled.is_balanced())
+        self.assertTrue((rolled.numpy() == [size * 2 - 1]).all())
+        x = ht.arange(size * 3, split=0)[size:]
+        rolled = ht.roll(x, 3)
+        self.assertTrue(rolled.is_balanced())
+        self.assertTrue((rolled.numpy() == np.roll(np.arange(size, size * 3), 3)).all())
+
+        x = ht.array(data, split=0)
+        with self.assertRaises(TypeError):
+            ht.roll(data, 1)
+        with self.assertRaises(TypeError):
+            ht.roll(x, 1.5, 0)
+        with self.assertRaises(ValueError):
+            ht.roll(x, (1, 2), (0, 1, 0))
+        with self.assertRaises(ValueError):
+            ht.roll(x, 1, 2)
+
     def test_rot90(self):
         size = ht.MPI_WORLD.size
         m = ht.arange(size ** 3, dtype=ht.int).reshape((size, size, size))
@@ -1267,6 +1390,29 @@ class TestManipulations(TestCase):
                         ).all()
                     )
 
+        # stable sorting of skewed data, the result is balanced unless requested otherwise
+        data = ht.zeros(size * 10, dtype=ht.int32, split=0)
+        data[-1] = -1
+        result, indices = ht.sort(data, stable=True)
+        self.assertEqual(result.lshape, data.lshape)
+        self.assertEqual(result.numpy()[0], -1)
+        self.assertTrue(ht.equal(indices[1:], ht.arange(size * 10 - 1, dtype=ht.int32)))
+        result, indices = ht.sort(data, descending=True, stable=True, balance=False)
+        self.assertEqual(result.shape, data.shape)
+        indices.balance_()
+        self.assertTrue((indices.numpy() == np.arange(size * 10)).all())
+
+        # NaNs are the largest values, first in descending order, and ties between them are broken by position
+        data_np = np.arange(size * 10) * 7 % 9.0
+        data_np[data_np % 3 == 1] = np.nan
+        keys = np.where(np.isnan(data_np), np.inf, data_np)
+        data = ht.array(data_np, split=0)
+        for descending in (False, True):
+            result, indices = ht.sort(data, descending=descending, stable=True)
+            expected = np.argsort(-keys if descending else keys, kind="stable")
+            self.assertTrue((indices.numpy() == expected).all())
+            self.assertTrue(np.array_equal(result.numpy(), data_np[expected], equal_nan=True))
+
     def test_resplit(self):
         if ht.MPI_WORLD.size > 1:
             # resplitting with same axis, should leave everything unchanged
@@ -1390,6 +1536,19 @@ class TestManipulations(TestCase):
                             del a
                             del resplit_a
 
+            # unbalanced and non-contiguous sources are received in balanced chunks
+            test = torch.arange(ht.MPI_WORLD.size * 24).reshape(-1, 2, 3)
+            a = ht.array(test, split=0)[ht.MPI_WORLD.size * 2 - 1 :]
+            for axis in (1, 2, None):
+                resplit_a = ht.resplit(a, axis=axis)
+                self.assertEqual(resplit_a.split, axis)
+                if axis is not None:
+                    self.assertTrue(resplit_a.is_balanced())
+                self.assertTrue((resplit_a.numpy() == a.numpy()).all())
+            a = ht.array(test, split=1).transpose((2, 0, 1))
+            resplit_a = ht.resplit(a, axis=0)
+            self.assertTrue((resplit_a.numpy() == test.permute(2, 0, 1).numpy()).all())
+
     def test_squeeze(self):
         torch.manual_seed(1)
         data = ht.random.randn(1, 4, 5, 1)
@@ -1506,9 +1665,11 @@ class TestManipulations(TestCase):
 
         split_one = ht.array(torch_array, dtype=ht.int32, split=1)
 
-        exp_axis_none = ht.arange(size, dtype=ht.int32)
+        exp_axis_none = np.arange(size, dtype=np.int32)
         res = ht.unique(split_one, sorted=True)
-        self.assertTrue((res._DNDarray__array == exp_axis_none._DNDarray__array).all())
+        self.assertEqual(res.split, 0)
+        self.assertTrue(res.is_balanced())
+        self.assertTrue((res.numpy() == exp_axis_none).all())
 
         exp_axis_zero = ht.array([rank], dtype=ht.int32).expand_dims(0)
         res = ht.unique(split_one, sorted=False, axis=0)
@@ -1555,7 +1716,51 @@ class TestManipulations(TestCase):
 
         data_split_zero = ht.array(torch_array, split=0)
         res, inv = ht.unique(data_split_zero, return_inverse=True, sorted=True)
-        self.assertTrue(torch.equal(inv, exp_inv.to(dtype=inv.dtype)))
+        self.assertIsInstance(inv, ht.DNDarray)
+        self.assertEqual(inv.split, 0)
+        self.assertEqual(inv.lshape, data_split_zero.lshape)
+        self.assertTrue(torch.equal(ht.resplit(inv, None)._DNDarray__array, exp_inv))
+        self.assertTrue(torch.equal(ht.resplit(res, None)._DNDarray__array, exp_res))
+
+        # hash-partitioned unique elements with counts and inverse indices
+        data = torch.arange(size * 20, device=self.device.torch_device) % (size * 7)
+        for dtype in (torch.int64, torch.float32):
+            x = ht.array(data.to(dtype), split=0)
+            exp_res, exp_inv, exp_counts = data.to(dtype).unique(
+                sorted=True, return_inverse=True, return_counts=True
+            )
+            result = ht.unique(x, return_inverse=True, return_counts=True)
+            self.assertIsInstance(result, tuple)
+            res, inv, counts = result
+            self.assertEqual(res.shape, exp_res.shape)
+            self.assertEqual(res.split, 0)
+            self.assertEqual(counts.dtype, ht.int64)
+            self.assertTrue((res.numpy()[inv.numpy()] == x.numpy()).all())
+            order = torch.argsort(torch.from_numpy(res.numpy()))
+            self.assertTrue(torch.equal(torch.from_numpy(counts.numpy())[order], exp_counts.cpu()))
+
+            res, counts = ht.unique(x, sorted=True, return_counts=True)
+            self.assertTrue(torch.equal(ht.resplit(res, None)._DNDarray__array, exp_res))
+            self.assertTrue(torch.equal(ht.resplit(counts, None)._DNDarray__array, exp_counts))
+            x = ht.array(data.to(dtype), split=None)
+            res, counts = ht.unique(x, sorted=True, return_counts=True)
+            self.assertTrue(torch.equal(counts._DNDarray__array, exp_counts))
+
+        # unique slices with counts along and across the split axis
+        data_np = np.array([[1, 1, 0, 1], [0, 0, 1, 0], [1, 1, 0, 1], [2, 2, 1, 0]] * size)
+        exp_res, exp_counts = np.unique(data_np, axis=0, return_counts=True)
+        res, counts = ht.unique(ht.array(data_np, split=0), sorted=True, axis=0, return_counts=True)
+        self.assertTrue((res.numpy() == exp_res).all())
+        self.assertTrue((counts.numpy() == exp_counts).all())
+        res, inv, counts = ht.unique(
+            ht.array(data_np, split=0), axis=1, return_inverse=True, return_counts=True
+        )
+        self.assertEqual(res.split, 0)
+        self.assertTrue((res.numpy() == data_np[:, [0, 2, 3]]).all())
+        self.assertTrue((inv.cpu().numpy() == [0, 0, 1, 2]).all())
+        self.assertTrue((counts.numpy() == [2, 1, 1]).all())
+        with self.assertRaises(ValueError):
+            ht.unique(ht.array(data_np, split=0), sorted=True, axis=1)
 
     def test_vstack(self):
         # cases to test:
@@ -73,7 +73,124 @@ class TestOperations(TestCase):
 
         with self.assertRaises(TypeError):
             ht.bitwise_and(ht.ones((1, 2)), "wrong type")
-        with self.assertRaises(NotImplementedError):
-            ht.bitwise_or(
-                ht.ones((1, 2), dtype=ht.int32, split=0), ht.ones((1, 2), dtype=ht.int32, split=1)
-            )
+
+        # differently split operands are redistributed
+        result = ht.bitwise_or(
+            ht.ones((1, 2), dtype=ht.int32, split=0), ht.ones((1, 2), dtype=ht.int32, split=1)
+        )
+        self.assertTrue(ht.equal(result, ht.ones((1, 2), dtype=ht.int32)))
+        left_tensor = ht.arange(12, split=0).reshape((4, 3))
+        right_tensor = ht.resplit(left_tensor, 1)
+        result = left_tensor + right_tensor
+        self.assertEqual(result.split, 0)
+        self.assertEqual(result.lshape, left_tensor.lshape)
+        self.assertTrue(ht.equal(result, 2 * ht.arange(12).reshape((4, 3))))
+        result = ht.ones((1, 3), split=0) + left_tensor.resplit_(1)
+        if result.comm.is_distributed():
+            self.assertEqual(result.split, 1)
+        self.assertTrue(ht.equal(result, ht.arange(1, 13).reshape((4, 3))))
+
+    def test___binary_op_scalar(self):
+        int_tensor = ht.arange(4, dtype=ht.int32, split=0)
+        float_tensor = ht.arange(4, dtype=ht.float32, split=0)
+
+        # type promotion matches wrapping the scalar into an array
+        for tensor in (int_tensor, float_tensor):
+            for scalar in (2, 2.0, True, ht.np.int16(2), ht.np.float64(2.0)):
+                result = tensor + scalar
+                expected = tensor + ht.array([scalar])
+                self.assertEqual(result.dtype, expected.dtype)
+                self.assertEqual(result.split, tensor.split)
+                self.assertEqual(result.shape, tensor.shape)
+                self.assertTrue(ht.equal(result, expected))
+
+        # a leading scalar is cast to the type of the array
+        result = ht.sub(10.5, int_tensor)
+        self.assertEqual(result.dtype, ht.int32)
+        self.assertTrue(ht.equal(result, ht.array([10, 9, 8, 7], split=0)))
+
+        # more processes than elements leave some ranks without data
+        small = ht.ones((1, 3), split=0)
+        result = small * 3.0
+        self.assertEqual(result.shape, (1, 3))
+        self.assertEqual(result.lshape, small.lshape)
+
+        # unsupported scalars take the regular path
+        with self.assertRaises(TypeError):
+            float_tensor + "s"
+        with self.assertRaises(TypeError):
+            float_tensor + 2 ** 64
+
+        # the fast path is deferred in lazy mode
+        with ht.lazy():
+            deferred = float_tensor * 2.0 + 1.0
+            self.assertIsNotNone(deferred._DNDarray__expression)
+        self.assertTrue(ht.equal(deferred, ht.array([1.0, 3.0, 5.0, 7.0], split=0)))
+
+    def test___reduce_op(self):
+        size = ht.MPI_WORLD.size
+        data = torch.arange(size * 24, dtype=torch.float32).reshape(size * 2, 3, 4)
+
+        # several axes are reduced in a single pass, independent of their order
+        for split in (None, 0, 1, 2):
+            x = ht.array(data, split=split)
+            for axis in ((0, 2), (2, 0), (1, 2), (0, 1, 2)):
+                result = ht.sum(x, axis=axis)
+                self.assertTrue((result.numpy() == data.sum(dim=axis).numpy()).all())
+                result = ht.max(x, axis=axis, keepdim=True)
+                expected = data
+                for dim in axis:
+                    expected = expected.max(dim=dim, keepdim=True)[0]
+                self.assertEqual(result.shape, tuple(expected.shape))
+                self.assertTrue((result.numpy() == expected.numpy()).all())
+
+    def test___reduce_ops(self):
+        reduce_ops = getattr(ht.core.operations, "__reduce_ops")
+        size = ht.MPI_WORLD.size
+        data = torch.arange(size * 6, dtype=torch.float32).reshape(size * 2, 3) - 5
+
+        def local_max(*args, **kwargs):
+            result = torch.max(*args, **kwargs)
+            return result[0] if isinstance(result, tuple) else result
+
+        def local_min(*args, **kwargs):
+            result = torch.min(*args, **kwargs)
+            return result[0] if isinstance(result, tuple) else result
+
+        def local_square_sum(t, *args, **kwargs):
+            return torch.sum(t * t, *args, **kwargs)
+
+        for dtype in (torch.float32, torch.int64):
+            largest = float("inf") if dtype.is_floating_point else torch.iinfo(dtype).max
+            for split in (None, 0, 1):
+                x = ht.array(data.type(dtype), split=split)
+                minimum, maximum, total, squares = reduce_ops(
+                    x,
+                    (
+                        (local_min, ht.MPI.MIN, largest),
+                        (local_max, ht.MPI.MAX, -largest),
+                        (torch.sum, ht.MPI.SUM, 0),
+                        (local_square_sum, ht.MPI.SUM, 0),
+                    ),
+                    axis=0,
+                )
+                self.assertTrue(ht.equal(minimum, ht.min(x, axis=0)))
+                self.assertTrue(ht.equal(maximum, ht.max(x, axis=0)))
+                self.assertTrue(ht.equal(total, ht.sum(x, axis=0)))
+                self.assertTrue(ht.equal(squares, ht.sum(x * x, axis=0)))
+                self.assertEqual(total.split, None if split in (None, 0) else 0)
+
+        def local_all(t, *args, **kwargs):
+            return torch.all(t != 0, *args, **kwargs)
+
+        def local_any(t, *args, **kwargs):
+            return torch.any(t != 0, *args, **kwargs)
+
+        x = ht.array(data, split=0)
+        is_all, is_any = reduce_ops(x, ((local_all, ht.MPI.LAND, 1), (local_any, ht.MPI.LOR, 0)))
+        self.assertEqual(is_all.dtype, ht.bool)
+        self.assertFalse(is_all.item())
+        self.assertTrue(is_any.item())
+
+        with self.assertRaises(TypeError):
+            reduce_ops(data, ((torch.sum, ht.MPI.SUM, 0),))
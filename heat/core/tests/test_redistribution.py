@@ -0,0 +1,79 @@
+import heat as ht
+from .test_suites.basic_test import TestCase
+
+
+class TestRedistribution(TestCase):
+    def test_redistribution_plan(self):
+        size = ht.MPI_WORLD.size
+        a = ht.ones((size, 10), split=0)
+        b = ht.ones((size, 10), split=1)
+
+        # aligned operands
+        plan = ht.redistribution_plan(a, a)
+        self.assertEqual(plan.split, 0)
+        self.assertEqual(plan.actions, ("none", "none"))
+        self.assertEqual(plan.total_nbytes, 0)
+        plan = ht.redistribution_plan(ht.ones((size, 10)), ht.ones((10,)))
+        self.assertIsNone(plan.split)
+        self.assertEqual(plan.actions, ("none", "none"))
+
+        # replicated operands are sliced or broadcast
+        plan = ht.redistribution_plan(ht.ones((size, 10)), b)
+        self.assertEqual(plan.split, 1)
+        self.assertEqual(plan.actions, ("slice", "none"))
+        plan = ht.redistribution_plan(a, ht.ones((10,)))
+        self.assertEqual(plan.actions, ("none", "none"))
+        self.assertEqual(plan.total_nbytes, 0)
+
+        # differently split operands
+        plan = ht.redistribution_plan(a, b)
+        self.assertEqual(plan.split, 0)
+        self.assertEqual(plan.actions, ("none", "alltoallv"))
+        self.assertEqual(plan.nbytes[0], 0)
+        self.assertEqual(plan.nbytes[1], 4 * (size * 10 - 10))
+        plan = ht.redistribution_plan(ht.ones((size, 1000), split=1), ht.ones((size, 1), split=0))
+        if size > 1:
+            self.assertEqual(plan.split, 1)
+            self.assertEqual(plan.actions, ("none", "replicate"))
+            self.assertEqual(plan.nbytes, (0, 4 * size * (size - 1)))
+        self.assertIn("RedistributionPlan", repr(plan))
+
+        with self.assertRaises(TypeError):
+            ht.redistribution_plan(a, 1)
+        with self.assertRaises(ValueError):
+            ht.redistribution_plan(a, ht.ones((3, 3)))
+
+    def test_redistribute(self):
+        size = ht.MPI_WORLD.size
+        data = ht.arange(size * 6, dtype=ht.float32).reshape((size * 2, 3))
+        a = ht.array(data, split=0)
+        b = ht.array(data, split=1)
+
+        for first, second in ((a, b), (b, a)):
+            result = first * second
+            self.assertEqual(result.split, first.split)
+            self.assertEqual(result.lshape, first.lshape)
+            self.assertTrue(ht.equal(result, data * data))
+
+        # unbalanced operands are matched
+        c = ht.array(data, split=0)
+        if size > 1:
+            target_map = c.create_lshape_map()
+            target_map[0, 0] += target_map[-1, 0]
+            target_map[-1, 0] = 0
+            c.redistribute_(target_map=target_map)
+        result = c - b
+        self.assertEqual(result.split, 0)
+        self.assertEqual(result.lshape, c.lshape)
+        self.assertTrue(ht.equal(result, ht.zeros((size * 2, 3))))
+        # replicated operands are sliced like the unbalanced one
+        for result in (c + data, data + c):
+            self.assertEqual(result.split, 0)
+            self.assertEqual(result.lshape, c.lshape)
+            self.assertTrue(ht.equal(result, data * 2))
+
+        # operands broadcast along the split axis
+        row = ht.array(data[:1], split=0)
+        result = b + row
+        self.assertTrue(ht.equal(result, data + data[:1]))
+        self.assertEqual(row.lshape, ht.array(data[:1], split=0).lshape)
@@ -0,0 +1,155 @@
+import numpy as np
+import torch
+
+import heat as ht
+from .test_suites.basic_test import TestCase
+
+
+class TestSignal(TestCase):
+    def test_convolve(self):
+        size = ht.MPI_WORLD.size
+        data = np.arange(size * 7) % 5 - 2.0
+        kernel = np.array([1.0, -2.0, 3.0, 0.5])
+
+        # numpy semantics for all modes, along the split axis and process-locally
+        for mode in ("full", "same", "valid"):
+            expected = np.convolve(data, kernel, mode=mode)
+            for split in (None, 0):
+                a = ht.array(data, split=split)
+                convolved = ht.convolve(a, kernel, mode=mode)
+                self.assertIsInstance(convolved, ht.DNDarray)
+                self.assertEqual(convolved.split, split)
+                self.assertEqual(convolved.dtype, ht.float64)
+                self.assertEqual(convolved.shape, expected.shape)
+                self.assertTrue(np.allclose(convolved.numpy(), expected))
+        self.assertIs(ht.signal.convolve, ht.convolve)
+
+        # integer inputs, kernels given as DNDarrays, strides and boundaries
+        a = ht.arange(size * 7, split=0)
+        kernel = ht.array([1, 2, 1], dtype=ht.int32, split=0)
+        convolved = ht.convolve(a, kernel, mode="same", stride=2)
+        expected = np.convolve(np.arange(size * 7), [1, 2, 1], mode="same")[::2]
+        self.assertEqual(convolved.dtype, ht.float32)
+        self.assertTrue(np.allclose(convolved.numpy(), expected))
+        convolved = ht.convolve(a, [1, 2, 1], mode="same", boundary="circular")
+        padded = np.concatenate(([size * 7 - 1], np.arange(size * 7), [0]))
+        self.assertTrue(np.allclose(convolved.numpy(), np.convolve(padded, [1, 2, 1], "valid")))
+
+        # two-dimensional kernels along a split axis
+        data = np.arange(size * 30).reshape(size * 5, 6) % 7
+        kernel = np.array([[1.0, 0.0], [2.0, -1.0], [0.5, 3.0]])
+        padded = np.pad(data, ((2, 2), (1, 1)))
+        flipped = kernel[::-1, ::-1]
+        expected = np.zeros((size * 5 + 2, 7))
+        for i in range(expected.shape[0]):
+            for j in range(expected.shape[1]):
+                expected[i, j] = (padded[i : i + 3, j : j + 2] * flipped).sum()
+        for split in (None, 0, 1):
+            convolved = ht.convolve(ht.array(data, split=split), kernel)
+            self.assertEqual(convolved.shape, expected.shape)
+            self.assertTrue(np.allclose(convolved.numpy(), expected))
+
+        with self.assertRaises(TypeError):
+            ht.convolve(data, kernel)
+        with self.assertRaises(ValueError):
+            ht.convolve(a, [1, 2, 1], mode="periodic")
+        with self.assertRaises(ValueError):
+            ht.convolve(a, [1, 2, 1], boundary="wrap")
+        with self.assertRaises(ValueError):
+            ht.convolve(a, [1, 2, 1], stride=0)
+        with self.assertRaises(ValueError):
+            ht.convolve(a, [[1, 2, 1]])
+        with self.assertRaises(ValueError):
+            ht.convolve(a, np.ones(size * 7 + 1), mode="valid")
+
+    def test_stencil(self):
+        size = ht.MPI_WORLD.size
+        data = torch.arange(size * 8, dtype=torch.float64, device=self.device.torch_device) ** 2
+
+        # second differences, the boundary values are assumed beyond the ends of the split axis
+        for split in (None, 0):
+            x = ht.array(data, split=split)
+            for boundary, padded in (
+                ("constant", torch.cat((data.new_zeros(1), data, data.new_zeros(1)))),
+                ("replicate", torch.cat((data[:1], data, data[-1:]))),
+                ("reflect", torch.cat((data[1:2], data, data[-2:-1]))),
+                ("circular", torch.cat((data[-1:], data, data[:1]))),
+            ):
+                result = ht.stencil(x, [1, -2, 1], boundary=boundary)
+                expected = padded[:-2] - 2 * padded[1:-1] + padded[2:]
+                self.assertEqual(result.split, split)
+                self.assertEqual(result.shape, x.shape)
+                self.assertTrue(np.allclose(result.numpy(), expected.cpu().numpy()))
+
+        # five-point stencil with a constant boundary value and strides, split along either axis
+        data = np.arange(size * 24).reshape(size * 4, 6) % 5
+        kernel = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]])
+        padded = np.pad(data, 1, constant_values=2)
+        expected = (
+            padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+        ) - 4 * data
+        for split in (None, 0, 1):
+            x = ht.array(data, split=split)
+            result = ht.stencil(x, kernel, value=2)
+            self.assertTrue(np.allclose(result.numpy(), expected))
+            result = ht.stencil(x, kernel, value=2, stride=(2, 3))
+            self.assertEqual(result.shape, (size * 2, 2))
+            self.assertTrue(np.allclose(result.numpy(), expected[::2, ::3]))
+
+        # the kernel is applied to the trailing axes, the leading ones are a batch
+        data = np.arange(size * 30).reshape(size * 3, 10) % 4
+        for split in (0, 1):
+            result = ht.stencil(ht.array(data, split=split), [1, 1, 1])
+            padded = np.pad(data, ((0, 0), (1, 1)))
+            expected = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+            self.assertEqual(result.split, split)
+            self.assertTrue(np.allclose(result.numpy(), expected))
+
+        # chunks smaller than the halos
+        x = ht.arange(size * 2, dtype=ht.float32, split=0)
+        result = ht.stencil(x, np.ones(7), boundary="circular")
+        expected = np.arange(size * 2)[(np.arange(size * 2)[:, None] + np.arange(-3, 4)) % (size * 2)]
+        self.assertEqual(result.split, 0)
+        self.assertTrue(np.allclose(result.numpy(), expected.sum(axis=1)))
+
+        with self.assertRaises(ValueError):
+            ht.stencil(ht.array(data, split=0), np.ones((3, 3, 3)))
+        with self.assertRaises(ValueError):
+            ht.stencil(ht.array(data, split=0), [])
+
+    def test_rolling(self):
+        size = ht.MPI_WORLD.size
+        data = np.arange(size * 20).reshape(size * 10, 2) * 7919 % 13 - 6.0
+        for split in (None, 0, 1):
+            x = ht.array(data, split=split)
+            for window in (1, 3, 8):
+                windows = np.lib.stride_tricks.sliding_window_view(data, window, axis=0)
+                for function, expected in (
+                    (ht.rolling_sum, windows.sum(-1)),
+                    (ht.rolling_mean, windows.mean(-1)),
+                    (ht.rolling_max, windows.max(-1)),
+                ):
+                    result = function(x, window, axis=0)
+                    self.assertEqual(result.split, split)
+                    self.assertEqual(result.dtype, ht.float64)
+                    self.assertEqual(result.shape, expected.shape)
+                    self.assertTrue(np.allclose(result.numpy(), expected))
+                    self.assertTrue(result.is_balanced())
+
+        # the windows are taken along the split axis by default, integers are summed exactly
+        x = ht.arange(size * 5, split=0)
+        self.assertTrue((ht.rolling_sum(x, 5).numpy() == np.arange(size * 5 - 4) * 5 + 10).all())
+        self.assertEqual(ht.rolling_sum(x, 5).dtype, ht.int64)
+        self.assertEqual(ht.rolling_mean(x, 5).dtype, ht.float32)
+        self.assertTrue((ht.rolling_max(x, size * 5).numpy() == [size * 5 - 1]).all())
+        self.assertEqual(ht.rolling_max(x, size * 5).dtype, ht.int32)
+        self.assertTrue((ht.rolling_max(ht.arange(10), 4).numpy() == np.arange(3, 10)).all())
+
+        with self.assertRaises(TypeError):
+            ht.rolling_sum(data, 2)
+        with self.assertRaises(ValueError):
+            ht.rolling_sum(x, 0)
+        with self.assertRaises(ValueError):
+            ht.rolling_mean(x, size * 5 + 1)
+        with self.assertRaises(ValueError):
+            ht.rolling_max(x, 2, axis=1)
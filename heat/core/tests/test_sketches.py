@@ -0,0 +1,65 @@
+import numpy as np
+import torch
+
+import heat as ht
+from .test_suites.basic_test import TestCase
+
+
+class TestQuantileSketch(TestCase):
+    def test_quantile_sketch(self):
+        q = [0.0, 1.0, 25.0, 50.0, 75.0, 99.0, 100.0]
+
+        # below the capacity the sketch is exact
+        data = torch.arange(100, dtype=torch.float32).flip(0)
+        sketch = ht.QuantileSketch().update(data)
+        self.assertEqual(sketch.count, 100)
+        self.assertEqual(sketch.nbytes, 1600)
+        p = sketch.percentile(q)
+        self.assertEqual(p.dtype, torch.float64)
+        p_np = np.percentile(data.numpy(), q, method="lower")
+        self.assertTrue(np.allclose(p.numpy(), p_np))
+        self.assertIn("QuantileSketch", repr(sketch))
+
+        # streamed batches, the rank error stays small and the sketch stays compact
+        sketch = ht.QuantileSketch(capacity=1024)
+        batches = [torch.arange(batch, 100000, 10, dtype=torch.float64) for batch in range(10)]
+        for batch in batches:
+            sketch.update(batch)
+        self.assertEqual(sketch.count, 100000)
+        self.assertLess(sketch.nbytes, 100000)
+        p = sketch.percentile(q)
+        self.assertTrue(np.allclose(p.numpy(), np.percentile(np.arange(100000), q), atol=1000))
+
+        # serialization and local merging
+        restored = ht.QuantileSketch.deserialize(sketch.serialize(), capacity=1024)
+        self.assertEqual(restored.count, sketch.count)
+        self.assertTrue(torch.equal(restored.percentile(q), p))
+        merged = ht.QuantileSketch(capacity=1024).merge(sketch).merge(restored)
+        self.assertEqual(merged.count, 2 * sketch.count)
+
+        # merged across processes
+        size = ht.MPI_WORLD.size
+        x = ht.arange(20000 * size, dtype=ht.float32, split=0)
+        sketch = ht.QuantileSketch(capacity=1024).update(x)
+        self.assertEqual(sketch.count, x.lshape[0])
+        merged = sketch.allmerge()
+        self.assertEqual(merged.count, x.gnumel)
+        p = merged.percentile(q)
+        p_np = np.percentile(np.arange(x.gnumel), q)
+        self.assertTrue(np.allclose(p.numpy(), p_np, atol=0.01 * x.gnumel))
+        # identical on all processes
+        gathered = torch.empty((size, len(q)), dtype=torch.float64)
+        ht.MPI_WORLD.Allgather(p.unsqueeze(0), gathered)
+        self.assertTrue((gathered == p).all())
+
+        # empty sketch
+        self.assertTrue(torch.isnan(ht.QuantileSketch().percentile(50)).all())
+        self.assertEqual(ht.QuantileSketch().serialize().shape, (0, 2))
+        self.assertEqual(ht.QuantileSketch().allmerge().count, 0)
+
+        with self.assertRaises(ValueError):
+            ht.QuantileSketch(capacity=1)
+        with self.assertRaises(TypeError):
+            ht.QuantileSketch().update(np.arange(10))
+        with self.assertRaises(TypeError):
+            ht.QuantileSketch().merge(data)
@@ -73,7 +73,9 @@ class TestStatistics(TestCase):
         self.assertEqual(result.split, None)
         # skip test on gpu; argmax works different
         if not (torch.cuda.is_available() and result.device == ht.gpu):
-            self.assertTrue((result._DNDarray__array != 0).all())
+            # ties are resolved in favor of the smaller index, like numpy does
+            expected = np.argmax(data.numpy(), axis=0)
+            self.assertTrue((result._DNDarray__array.cpu().numpy() == expected).all())
 
         # 2D split tensor, across the axis, output tensor
         size = ht.MPI_WORLD.size * 2
@@ -90,7 +92,33 @@ class TestStatistics(TestCase):
         self.assertEqual(output.split, None)
         # skip test on gpu; argmax works different
         if not (torch.cuda.is_available() and output.device == ht.gpu):
-            self.assertTrue((output._DNDarray__array != 0).all())
+            # ties are resolved in favor of the smaller index, like numpy does
+            expected = np.argmax(data.numpy(), axis=0)
+            self.assertTrue((output._DNDarray__array.cpu().numpy() == expected).all())
+
+        # ties, NaN and global flattened indices across the split axis
+        size = ht.MPI_WORLD.size
+        ties = ht.zeros((size * 3, 4), split=0)
+        self.assertEqual(ht.argmax(ties).item(), 0)
+        self.assertTrue((ht.argmax(ties, axis=0)._DNDarray__array == 0).all())
+        for split in (0, 1):
+            values = ht.arange(size * 12, dtype=ht.float32).reshape((size * 3, 4))
+            values = ht.array(values, split=split)
+            self.assertEqual(ht.argmax(values).item(), size * 12 - 1)
+            values[-1, 1] = float("nan")
+            self.assertEqual(ht.argmax(values).item(), size * 12 - 3)
+            self.assertTrue((ht.argmax(values, axis=0).numpy() == size * 3 - 1).all())
+        for dtype in (ht.int32, ht.int64, ht.float64):
+            values = ht.array(ht.arange(size * 5, dtype=dtype), split=0)
+            self.assertEqual(ht.argmax(values, axis=0).item(), size * 5 - 1)
+
+        # unbalanced chunks, e.g. after slicing
+        values = ht.arange(size * 6, 0, -1, dtype=ht.float32, split=0)[size * 3 - 1 :]
+        self.assertEqual(ht.argmax(values, axis=0).item(), 0)
+        matrix = ht.array(ht.random.randn(size * 4, 3), split=0)[size * 2 - 1 :]
+        expected = np.argmax(matrix.numpy(), axis=0)
+        self.assertTrue((ht.argmax(matrix, axis=0).numpy() == expected).all())
+        self.assertEqual(ht.argmax(matrix).item(), np.argmax(matrix.numpy()))
 
         # check exceptions
         with self.assertRaises(TypeError):
@@ -163,7 +191,9 @@ class TestStatistics(TestCase):
         self.assertEqual(result.split, None)
         # skip test on gpu; argmin works different
         if not (torch.cuda.is_available() and result.device == ht.gpu):
-            self.assertTrue((result._DNDarray__array != 0).all())
+            # ties are resolved in favor of the smaller index, like numpy does
+            expected = np.argmin(data.numpy(), axis=0)
+            self.assertTrue((result._DNDarray__array.cpu().numpy() == expected).all())
 
         # 2D split tensor, across the axis, output tensor
         size = ht.MPI_WORLD.size * 2
@@ -180,7 +210,31 @@ class TestStatistics(TestCase):
         self.assertEqual(output.split, None)
         # skip test on gpu; argmin works different
         if not (torch.cuda.is_available() and output.device == ht.gpu):
-            self.assertTrue((output._DNDarray__array != 0).all())
+            # ties are resolved in favor of the smaller index, like numpy does
+            expected = np.argmin(data.numpy(), axis=0)
+            self.assertTrue((output._DNDarray__array.cpu().numpy() == expected).all())
+
+        # ties, NaN and global flattened indices across the split axis
+        size = ht.MPI_WORLD.size
+        ties = ht.zeros((size * 3, 4), split=0)
+        self.assertEqual(ht.argmin(ties).item(), 0)
+        self.assertTrue((ht.argmin(ties, axis=0)._DNDarray__array == 0).all())
+        for split in (0, 1):
+            values = ht.arange(size * 12, dtype=ht.float32).reshape((size * 3, 4))
+            values = ht.array(values, split=split)
+            self.assertEqual(ht.argmin(values).item(), 0)
+            values[-1, 1] = float("nan")
+            self.assertEqual(ht.argmin(values).item(), size * 12 - 3)
+            self.assertTrue(ht.equal(ht.argmin(values, axis=0), ht.array([0, size * 3 - 1, 0, 0])))
+        for dtype in (ht.int32, ht.int64, ht.float64):
+            values = ht.array(ht.arange(size * 5, dtype=dtype), split=0)
+            self.assertEqual(ht.argmin(values, axis=0).item(), 0)
+
+        # unbalanced chunks, e.g. after slicing
+        matrix = ht.array(ht.random.randn(size * 4, 3), split=0)[size * 2 - 1 :]
+        expected = np.argmin(matrix.numpy(), axis=0)
+        self.assertTrue((ht.argmin(matrix, axis=0).numpy() == expected).all())
+        self.assertEqual(ht.argmin(matrix).item(), np.argmin(matrix.numpy()))
 
         # check exceptions
         with self.assertRaises(TypeError):
@@ -321,8 +375,13 @@ class TestStatistics(TestCase):
         with self.assertRaises(ZeroDivisionError):
             ht.average(random_5d, weights=zero_weights, axis=axis)
         weights_5d_split_mismatch = ht.ones(random_5d.gshape, split=-1)
-        with self.assertRaises(NotImplementedError):
-            ht.average(random_5d, weights=weights_5d_split_mismatch, axis=axis)
+        if random_5d.comm.is_distributed():
+            with self.assertRaises(NotImplementedError):
+                ht.average(random_5d, weights=weights_5d_split_mismatch, axis=axis)
+        else:
+            # differently split operands are redistributed within a single process
+            avg = ht.average(random_5d, weights=weights_5d_split_mismatch, axis=axis)
+            self.assertTrue(ht.allclose(avg, ht.mean(random_5d, axis=axis)))
 
         with self.assertRaises(TypeError):
             ht_array.average(axis=1.1)
@@ -588,6 +647,14 @@ class TestStatistics(TestCase):
             )
             self.assertTrue(torch.equal(res._DNDarray__array, expected))
 
+        # non-blocking reduction
+        a = ht.arange(size * 3, split=0)
+        res = ht.max(a, async_op=True)
+        self.assertEqual(res.dtype, a.dtype)
+        self.assertEqual(res.item(), size * 3 - 1)
+        res = ht.min(a, async_op=True)
+        self.assertEqual(res.item(), 0)
+
         # check exceptions
         with self.assertRaises(TypeError):
             ht_array.max(axis=1.1)
@@ -626,10 +693,12 @@ class TestStatistics(TestCase):
 
         self.assertIsInstance(maximum_volume, ht.DNDarray)
         self.assertEqual(maximum_volume.shape, (size * 12, 3, 3))
-        self.assertEqual(maximum_volume.lshape, (size * 12, 3, 3))
+        self.assertEqual(maximum_volume.lshape, random_volume_1.lshape)
         self.assertEqual(maximum_volume.dtype, ht.float32)
         self.assertEqual(maximum_volume._DNDarray__array.dtype, torch.float32)
         self.assertEqual(maximum_volume.split, random_volume_1.split)
+        expected = torch.max(random_volume_1._DNDarray__array, random_volume_2._DNDarray__array)
+        self.assertTrue(torch.equal(maximum_volume._DNDarray__array, expected))
 
         # check maximum over float elements of split 3d tensors with different split axis
         torch.manual_seed(1)
@@ -638,7 +707,7 @@ class TestStatistics(TestCase):
         maximum_volume_splitdiff = ht.maximum(random_volume_1_splitdiff, random_volume_2_splitdiff)
         self.assertIsInstance(maximum_volume_splitdiff, ht.DNDarray)
         self.assertEqual(maximum_volume_splitdiff.shape, (size * 3, size * 3, 4))
-        self.assertEqual(maximum_volume_splitdiff.lshape, (size * 3, size * 3, 4))
+        self.assertEqual(maximum_volume_splitdiff.lshape, random_volume_1_splitdiff.lshape)
         self.assertEqual(maximum_volume_splitdiff.dtype, ht.float32)
         self.assertEqual(maximum_volume_splitdiff._DNDarray__array.dtype, torch.float32)
         self.assertEqual(maximum_volume_splitdiff.split, 0)
@@ -646,7 +715,8 @@ class TestStatistics(TestCase):
         random_volume_1_splitdiff = ht.random.randn(size * 3, size * 3, 4, split=1)
         random_volume_2_splitdiff = ht.random.randn(size * 3, size * 3, 4, split=0)
         maximum_volume_splitdiff = ht.maximum(random_volume_1_splitdiff, random_volume_2_splitdiff)
-        self.assertEqual(maximum_volume_splitdiff.split, 0)
+        # equal redistribution costs, the split axis of the first operand is kept
+        self.assertEqual(maximum_volume_splitdiff.split, 1)
 
         random_volume_1_split_none = ht.random.randn(size * 3, size * 3, 4, split=None)
         random_volume_2_splitdiff = ht.random.randn(size * 3, size * 3, 4, split=1)
@@ -660,11 +730,11 @@ class TestStatistics(TestCase):
 
         # check output buffer
         out_shape = ht.stride_tricks.broadcast_shape(random_volume_1.gshape, random_volume_2.gshape)
-        output = ht.empty(out_shape)
+        output = ht.empty(out_shape, split=0)
         ht.maximum(random_volume_1, random_volume_2, out=output)
         self.assertIsInstance(output, ht.DNDarray)
         self.assertEqual(output.shape, (ht.MPI_WORLD.size * 12, 3, 3))
-        self.assertEqual(output.lshape, (ht.MPI_WORLD.size * 12, 3, 3))
+        self.assertEqual(output.lshape, random_volume_1.lshape)
         self.assertEqual(output.dtype, ht.float32)
         self.assertEqual(output._DNDarray__array.dtype, torch.float32)
         self.assertEqual(output.split, random_volume_1.split)
@@ -682,6 +752,9 @@ class TestStatistics(TestCase):
         output = ht.ones((12, 4, 3))
         with self.assertRaises(ValueError):
             ht.maximum(random_volume_1, random_volume_2, out=output)
+        output = ht.empty(out_shape, split=1)
+        with self.assertRaises(ValueError):
+            ht.maximum(random_volume_1, random_volume_2, out=output)
 
     def test_mean(self):
         array_0_len = 5
@@ -707,6 +780,19 @@ class TestStatistics(TestCase):
         a = ht.arange(1, 5)
         self.assertEqual(a.mean(), 2.5)
 
+        # non-blocking reduction
+        size = ht.MPI_WORLD.size
+        b = ht.arange(size * 6, split=0).reshape((size * 2, 3))
+        res = ht.mean(b, async_op=True)
+        self.assertEqual(res.shape, ())
+        self.assertEqual(res.dtype, ht.float32)
+        self.assertAlmostEqual(res.item(), (size * 6 - 1) / 2.0)
+        for axis in (0, 1):
+            res = ht.mean(b.astype(ht.float32), axis=axis, async_op=True)
+            expected = ht.mean(b.astype(ht.float32), axis=axis)
+            self.assertEqual(res.shape, expected.shape)
+            self.assertTrue(ht.allclose(res, expected))
+
         # ones
         dimensions = []
 
@@ -891,10 +977,12 @@ class TestStatistics(TestCase):
 
         self.assertIsInstance(minimum_volume, ht.DNDarray)
         self.assertEqual(minimum_volume.shape, (size * 12, 3, 3))
-        self.assertEqual(minimum_volume.lshape, (size * 12, 3, 3))
+        self.assertEqual(minimum_volume.lshape, random_volume_1.lshape)
         self.assertEqual(minimum_volume.dtype, ht.float32)
         self.assertEqual(minimum_volume._DNDarray__array.dtype, torch.float32)
         self.assertEqual(minimum_volume.split, random_volume_1.split)
+        expected = torch.min(random_volume_1._DNDarray__array, random_volume_2._DNDarray__array)
+        self.assertTrue(torch.equal(minimum_volume._DNDarray__array, expected))
 
         # check minimum over float elements of split 3d tensors with different split axis
         torch.manual_seed(1)
@@ -903,7 +991,7 @@ class TestStatistics(TestCase):
         minimum_volume_splitdiff = ht.minimum(random_volume_1_splitdiff, random_volume_2_splitdiff)
         self.assertIsInstance(minimum_volume_splitdiff, ht.DNDarray)
         self.assertEqual(minimum_volume_splitdiff.shape, (size * 3, size * 3, 4))
-        self.assertEqual(minimum_volume_splitdiff.lshape, (size * 3, size * 3, 4))
+        self.assertEqual(minimum_volume_splitdiff.lshape, random_volume_1_splitdiff.lshape)
         self.assertEqual(minimum_volume_splitdiff.dtype, ht.float32)
         self.assertEqual(minimum_volume_splitdiff._DNDarray__array.dtype, torch.float32)
         self.assertEqual(minimum_volume_splitdiff.split, 0)
@@ -911,7 +999,8 @@ class TestStatistics(TestCase):
         random_volume_1_splitdiff = ht.random.randn(size * 3, size * 3, 4, split=1)
         random_volume_2_splitdiff = ht.random.randn(size * 3, size * 3, 4, split=0)
         minimum_volume_splitdiff = ht.minimum(random_volume_1_splitdiff, random_volume_2_splitdiff)
-        self.assertEqual(minimum_volume_splitdiff.split, 0)
+        # equal redistribution costs, the split axis of the first operand is kept
+        self.assertEqual(minimum_volume_splitdiff.split, 1)
 
         random_volume_1_split_none = ht.random.randn(size * 3, size * 3, 4, split=None)
         random_volume_2_splitdiff = ht.random.randn(size * 3, size * 3, 4, split=1)
@@ -925,11 +1014,11 @@ class TestStatistics(TestCase):
 
         # check output buffer
         out_shape = ht.stride_tricks.broadcast_shape(random_volume_1.gshape, random_volume_2.gshape)
-        output = ht.empty(out_shape)
+        output = ht.empty(out_shape, split=0)
         ht.minimum(random_volume_1, random_volume_2, out=output)
         self.assertIsInstance(output, ht.DNDarray)
         self.assertEqual(output.shape, (ht.MPI_WORLD.size * 12, 3, 3))
-        self.assertEqual(output.lshape, (ht.MPI_WORLD.size * 12, 3, 3))
+        self.assertEqual(output.lshape, random_volume_1.lshape)
         self.assertEqual(output.dtype, ht.float32)
         self.assertEqual(output._DNDarray__array.dtype, torch.float32)
         self.assertEqual(output.split, random_volume_1.split)
@@ -947,6 +1036,49 @@ class TestStatistics(TestCase):
         output = ht.ones((12, 4, 3))
         with self.assertRaises(ValueError):
             ht.minimum(random_volume_1, random_volume_2, out=output)
+        output = ht.empty(out_shape, split=1)
+        with self.assertRaises(ValueError):
+            ht.minimum(random_volume_1, random_volume_2, out=output)
+
+    def test_moments(self):
+        size = ht.MPI_WORLD.size
+        np.random.seed(42)
+        x_np = np.random.randn(size * 3, 4, 5).astype(np.float32) ** 2
+
+        for split in (None, 0, 1, 2):
+            x = ht.array(x_np, split=split)
+            for axis in (None, 0, 1, (0, 2), [2, 1]):
+                np_axis = tuple(axis) if isinstance(axis, list) else axis
+                mu, var, m3, m4 = ht.moments(x, axis=axis, order=4)
+                expected_mu = x_np.mean(axis=np_axis)
+                mean = ht.mean(x, axis=axis)
+                self.assertEqual(mu.shape, mean.shape)
+                self.assertEqual(mu.split, mean.split)
+                self.assertEqual(mu.dtype, ht.float32)
+                self.assertTrue(np.allclose(mu.numpy(), expected_mu, atol=1e-5))
+                deviations = x_np - x_np.mean(axis=np_axis, keepdims=True)
+                for moment, k in ((var, 2), (m3, 3), (m4, 4)):
+                    expected = (deviations ** k).mean(axis=np_axis)
+                    self.assertTrue(np.allclose(moment.numpy(), expected, rtol=1e-4, atol=1e-4))
+
+        # lower orders and integer input
+        x = ht.arange(size * 4, split=0)
+        moments = ht.moments(x, order=1)
+        self.assertEqual(len(moments), 1)
+        self.assertEqual(moments[0].dtype, ht.float32)
+        self.assertAlmostEqual(moments[0].item(), (size * 4 - 1) / 2.0, places=4)
+        mu, var = ht.moments(x)
+        self.assertAlmostEqual(var.item(), np.arange(size * 4).var(), places=2)
+
+        # exceptions
+        with self.assertRaises(TypeError):
+            ht.moments(x_np)
+        with self.assertRaises(TypeError):
+            ht.moments(x, order=2.0)
+        with self.assertRaises(ValueError):
+            ht.moments(x, order=5)
+        with self.assertRaises(ValueError):
+            ht.moments(ht.zeros((2, 3)), axis=(1, 1))
 
     def test_percentile(self):
         # test local, distributed, split/axis combination, TODO no data on process, Issue #568
@@ -982,7 +1114,7 @@ class TestStatistics(TestCase):
         # test list q and writing to output buffer
         q = [0.1, 2.3, 15.9, 50.0, 84.1, 97.7, 99.9]
         axis = 2
-        p_np = np.percentile(x_np, q, axis=axis, interpolation="lower", keepdims=True)
+        p_np = np.percentile(x_np, q, axis=axis, method="lower", keepdims=True)
         p_ht = ht.percentile(x_ht, q, axis=axis, interpolation="lower", keepdim=True)
         out = ht.empty(p_np.shape, dtype=ht.float64, split=None, device=x_ht.device)
         ht.percentile(x_ht, q, axis=axis, out=out, interpolation="lower", keepdim=True)
@@ -990,20 +1122,58 @@ class TestStatistics(TestCase):
         self.assertEqual(out.numpy()[2].all(), p_np[2].all())
         self.assertTrue(p_ht.shape == p_np.shape)
         axis = None
-        p_np = np.percentile(x_np, q, axis=axis, interpolation="higher")
+        p_np = np.percentile(x_np, q, axis=axis, method="higher")
         p_ht = ht.percentile(x_ht, q, axis=axis, interpolation="higher")
         self.assertEqual(p_ht.numpy()[6], p_np[6])
         self.assertTrue(p_ht.shape == p_np.shape)
-        p_np = np.percentile(x_np, q, axis=axis, interpolation="nearest")
+        p_np = np.percentile(x_np, q, axis=axis, method="nearest")
         p_ht = ht.percentile(x_ht, q, axis=axis, interpolation="nearest")
         self.assertEqual(p_ht.numpy()[2], p_np[2])
 
         # test split q
         q_ht = ht.array(q, split=0, comm=x_ht.comm)
-        p_np = np.percentile(x_np, q, axis=axis, interpolation="midpoint")
+        p_np = np.percentile(x_np, q, axis=axis, method="midpoint")
         p_ht = ht.percentile(x_ht, q_ht, axis=axis, interpolation="midpoint")
         self.assertEqual(p_ht.numpy()[4], p_np[4])
 
+        # test distributed selection along the split axis, many q at once, duplicates
+        q_sel = [0, 1.5, 25, 50, 75, 99, 100]
+        x_sel = np.arange((ht.MPI_WORLD.size * 7 + 3) * 5).reshape(-1, 5) * 7 % 23 / 2
+        for split in (0, 1):
+            x_split = ht.array(x_sel, split=split)
+            for interpolation in ("linear", "lower", "midpoint"):
+                p_np = np.percentile(x_sel, q_sel, axis=split, method=interpolation)
+                p_ht = ht.percentile(x_split, q_sel, axis=split, interpolation=interpolation)
+                self.assertIsNone(p_ht.split)
+                self.assertTrue(np.allclose(p_ht.numpy(), p_np))
+            p_np = np.percentile(x_sel, q_sel)
+            p_ht = ht.percentile(x_split, q_sel)
+            self.assertEqual(p_ht.shape, p_np.shape)
+            self.assertTrue(np.allclose(p_ht.numpy(), p_np))
+            self.assertAlmostEqual(ht.median(x_split).item(), np.median(x_sel))
+
+            # small inputs are summarized exactly by the sketch
+            p_np = np.percentile(x_sel, q_sel, method="lower")
+            p_ht = ht.percentile(x_split, q_sel, method="sketch")
+            self.assertIsNone(p_ht.split)
+            self.assertTrue(np.allclose(p_ht.numpy(), p_np))
+            p_ht = ht.percentile(x_split, 50, keepdim=True, method="sketch")
+            self.assertEqual(p_ht.shape, (1,))
+        # replicated data is summarized once
+        p_ht = ht.percentile(ht.arange(10), [25, 75], method="sketch")
+        p_np = np.percentile(np.arange(10), [25, 75], method="lower")
+        self.assertTrue((p_ht.numpy() == p_np).all())
+
+        # fibers containing NaNs select NaN like numpy
+        x_nan = x_sel.copy()
+        x_nan[[1, -2], [0, 3]] = np.nan
+        x_split = ht.array(x_nan, split=0)
+        p_ht = ht.percentile(x_split, [10, 90], axis=0)
+        p_np = np.percentile(x_nan, [10, 90], axis=0)
+        self.assertTrue(np.allclose(p_ht.numpy(), p_np, equal_nan=True))
+        self.assertTrue(np.isnan(ht.percentile(x_split, [10, 90]).numpy()).all())
+        self.assertTrue(np.isnan(ht.median(x_split).item()))
+
         # test scalar x
         x_sc = ht.array(4.5)
         p_ht = ht.percentile(x_sc, q=q)
@@ -1017,6 +1187,10 @@ class TestStatistics(TestCase):
             ht.percentile(x_ht, q, interpolation="Homer!")
         with self.assertRaises(NotImplementedError):
             ht.percentile(x_ht, q, axis=(0, 1))
+        with self.assertRaises(NotImplementedError):
+            ht.percentile(x_ht, q, axis=0, method="sketch")
+        with self.assertRaises(ValueError):
+            ht.percentile(x_ht, q, method="Marge!")
         q_np = np.array(q)
         with self.assertRaises(TypeError):
             ht.percentile(x_ht, q_np)
@@ -75,9 +75,11 @@ class Laplacian:
         degree._DNDarray__array = torch.where(
             degree._DNDarray__array == 0, temp, degree._DNDarray__array
         )
-        L = A / ht.sqrt(ht.expand_dims(degree, axis=1))
-        L = L / ht.sqrt(ht.expand_dims(degree, axis=0))
-        L = L * (-1.0)
+        # the element-wise chain is evaluated as one fused kernel
+        with ht.lazy(fuse=True):
+            L = A / ht.sqrt(ht.expand_dims(degree, axis=1))
+            L = L / ht.sqrt(ht.expand_dims(degree, axis=0))
+            L = L * (-1.0)
         L.fill_diagonal(1.0)
         return L
 
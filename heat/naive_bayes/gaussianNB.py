@@ -396,7 +396,9 @@ class GaussianNB(ht.ClassificationMixin, ht.BaseEstimator):
         for i in range(jll_size):
             jointi = ht.log(self.class_prior_[i])
             n_ij = -0.5 * ht.sum(ht.log(2.0 * ht.pi * self.sigma_[i, :]))
-            n_ij -= 0.5 * ht.sum(((X - self.theta_[i, :]) ** 2) / (self.sigma_[i, :]), 1)
+            # the element-wise chain is evaluated as one fused kernel inside the reduction
+            with ht.lazy(fuse=True):
+                n_ij -= 0.5 * ht.sum(((X - self.theta_[i, :]) ** 2) / (self.sigma_[i, :]), 1)
             joint_log_likelihood[:, i] = jointi + n_ij
         return joint_log_likelihood
 
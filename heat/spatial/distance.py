@@ -91,9 +91,7 @@ def _gaussian(x, y, sigma=1.0):
     torch.tensor
         2D tensor of size m x n
     """
-    d2 = _euclidian(x, y) ** 2
-    result = torch.exp(-d2 / (2 * sigma * sigma))
-    return result
+    return _gaussian_of_distance(_euclidian(x, y), float(sigma))
 
 
 def _gaussian_fast(x, y, sigma=1.0):
@@ -116,9 +114,26 @@ def _gaussian_fast(x, y, sigma=1.0):
         2D tensor of size m x n
     """
 
-    d2 = _quadratic_expand(x, y)
-    result = torch.exp(-d2 / (2 * sigma * sigma))
-    return result
+    return _gaussian_of_squared_distance(_quadratic_expand(x, y), float(sigma))
+
+
+@torch.jit.script
+def _gaussian_of_distance(d, sigma):
+    # type: (torch.Tensor, float) -> torch.Tensor
+    """
+    Scripted element-wise gaussian kernel exp(-(d**2/2sigma**2)) of a distance matrix, evaluated as a single fused kernel
+    """
+    return torch.exp(-(d * d) / (2 * sigma * sigma))
+
+
+@torch.jit.script
+def _gaussian_of_squared_distance(d2, sigma):
+    # type: (torch.Tensor, float) -> torch.Tensor
+    """
+    Scripted element-wise gaussian kernel exp(-(d2/2sigma**2)) of a squared distance matrix, evaluated as a single fused
+    kernel
+    """
+    return torch.exp(-d2 / (2 * sigma * sigma))
 
 
 def cdist(X, Y=None, quadratic_expansion=False):